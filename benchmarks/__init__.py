@@ -0,0 +1,10 @@
+"""
+Benchmarks for the generation, simulation and tracing hot paths.
+
+Run ``python -m benchmarks`` from the project root; see ``--help`` for saving
+results and comparing against a stored baseline. ``baseline.json`` holds a
+reference run; compare with ``python -m benchmarks --baseline
+benchmarks/baseline.json`` and refresh it with ``--output`` when a change is
+meant to move the numbers. Absolute rates depend on the machine, so compare
+runs from the same one.
+"""
@@ -0,0 +1,50 @@
+import argparse
+import sys
+
+from benchmarks.cases import all_cases
+from benchmarks.harness import (
+    compare,
+    format_comparison,
+    load_results,
+    run_cases,
+    save_results,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the trainer benchmarks.")
+    parser.add_argument("-k", "--filter", default=None, help="only run cases whose name contains this")
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.1, help="seconds per timed sample")
+    parser.add_argument("--output", default=None, help="write results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="JSON file from an earlier --output run")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown fraction counted as a regression")
+    parser.add_argument("--list", action="store_true", help="list case names and exit")
+    args = parser.parse_args(argv)
+
+    cases = all_cases()
+    if args.list:
+        for name, _ in cases:
+            print(name)
+        return 0
+
+    results = run_cases(
+        cases,
+        repeats=args.repeats,
+        min_time=args.min_time,
+        pattern=args.filter,
+    )
+    if args.output:
+        print(f"Saved results to {save_results(args.output, results)}")
+    if args.baseline:
+        rows = compare(results, load_results(args.baseline), threshold=args.threshold)
+        print()
+        for row in rows:
+            print(format_comparison(row))
+        if any(row["regression"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
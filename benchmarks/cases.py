@@ -0,0 +1,126 @@
+"""
+Benchmark cases as ``(name, make_op)`` pairs for ``harness.run_cases``.
+
+Every case draws from its own seeded RNG so runs are comparable.
+"""
+
+import copy
+import itertools
+import random
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PYTHON_SRC = PROJECT_ROOT / "python"
+TESTS_DIR = PROJECT_ROOT / "tests"
+for path in (PYTHON_SRC, PROJECT_ROOT, TESTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from comm_drill_trainer import (  # noqa: E402
+    CORNER_BUFFER,
+    CORNER_LETTER_SCHEME,
+    EDGE_BUFFER,
+    EDGE_LETTER_SCHEME,
+    WING_BUFFER,
+    WING_LETTER_SCHEME,
+    generate_piece_letters,
+)
+from dlin import BUFFERS, Cube, FaceletCube, FaceletTracer, Tracer  # noqa: E402
+from five_cycle import basic_five_cycle  # noqa: E402
+from three_style_algorithms import CORNER_THREE_STYLE, EDGE_THREE_STYLE  # noqa: E402
+
+SEED = 12345
+PIECE_SCHEMES = {
+    "corners": (CORNER_LETTER_SCHEME, CORNER_BUFFER),
+    "edges": (EDGE_LETTER_SCHEME, EDGE_BUFFER),
+    "wings": (WING_LETTER_SCHEME, WING_BUFFER),
+}
+CHAIN_COUNTS = (4, 8, 12, 16)
+ALG_TABLES = {"corner": CORNER_THREE_STYLE, "edge": EDGE_THREE_STYLE}
+TRACE_POOL_SIZE = 64
+
+
+def _forced_pair(scheme, buffer_letter):
+    """First sticker of the last two pieces, always a valid forced pair."""
+    blocks = [block for block in scheme.split(" ") if block]
+    first, second = blocks[-2:]
+    return first[0], second[0]
+
+
+def _five_cycle_case(scheme, buffer_letter, forced):
+    def make_op():
+        rng = random.Random(SEED)
+        forced_pair = _forced_pair(scheme, buffer_letter) if forced else None
+        return lambda: basic_five_cycle(
+            buffer_letter=buffer_letter,
+            scheme=scheme,
+            rng=rng,
+            forced_pair=forced_pair,
+        )
+    return make_op
+
+
+def _chain_case(scheme, buffer_letter, count):
+    def make_op():
+        rng = random.Random(SEED)
+        return lambda: generate_piece_letters(count, scheme, buffer_letter, rng=rng)
+    return make_op
+
+
+def _scramble_case(engine, table):
+    def make_op():
+        algs = itertools.cycle(table.values())
+        cube = engine()
+
+        def op():
+            cube.reset_cube_to_solved()
+            cube.scramble_from_string(next(algs))
+        return op
+    return make_op
+
+
+def _trace_case(tracer_class):
+    def make_op():
+        rng = random.Random(SEED)
+        algs = list(CORNER_THREE_STYLE.values()) + list(EDGE_THREE_STYLE.values())
+        tracers = []
+        for _ in range(TRACE_POOL_SIZE):
+            tracer = tracer_class(copy.deepcopy(BUFFERS))
+            tracer.scramble_from_string(" ".join(rng.sample(algs, 4)))
+            tracers.append((tracer, tracer.snapshot()))
+        pool = itertools.cycle(tracers)
+
+        # Tracing rotates the cube into orientation, so every call starts
+        # again from the scrambled state rather than the traced one.
+        def op():
+            tracer, snapshot = next(pool)
+            tracer.restore(snapshot)
+            tracer.trace_cube()
+        return op
+    return make_op
+
+
+def all_cases():
+    cases = []
+    for piece_type, (scheme, buffer_letter) in PIECE_SCHEMES.items():
+        for forced in (False, True):
+            suffix = "/forced" if forced else ""
+            cases.append((
+                f"five_cycle/{piece_type}{suffix}",
+                _five_cycle_case(scheme, buffer_letter, forced),
+            ))
+    for count in CHAIN_COUNTS:
+        cases.append((
+            f"chain/corners/{count}",
+            _chain_case(CORNER_LETTER_SCHEME, CORNER_BUFFER, count),
+        ))
+    for engine in (Cube, FaceletCube):
+        for table_name, table in ALG_TABLES.items():
+            cases.append((
+                f"scramble/{engine.__name__}/{table_name}",
+                _scramble_case(engine, table),
+            ))
+    for tracer_class in (Tracer, FaceletTracer):
+        cases.append((f"trace/{tracer_class.__name__}", _trace_case(tracer_class)))
+    return cases
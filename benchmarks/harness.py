@@ -0,0 +1,163 @@
+"""
+Timing, result files and baseline comparison for the benchmark cases.
+
+Each case is timed as ``repeats`` independent samples of ``loops`` calls,
+with ``loops`` calibrated so one sample takes at least ``min_time`` seconds.
+Throughput is reported as the mean ops/sec over the samples with a 95%
+Student-t confidence interval.
+"""
+
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+FORMAT_VERSION = 1
+
+# two-sided 95% Student-t critical values by degrees of freedom
+_T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160,
+    14: 2.145, 15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093,
+    20: 2.086, 25: 2.060, 30: 2.042,
+}
+
+
+def _t_critical(df):
+    if df in _T_95:
+        return _T_95[df]
+    below = [key for key in _T_95 if key < df]
+    return _T_95[max(below)] if df <= 30 else 1.96
+
+
+def _calibrate(op, min_time):
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return loops
+        if elapsed <= 0:
+            loops *= 10
+        else:
+            loops = max(loops + 1, math.ceil(loops * min_time * 1.2 / elapsed))
+
+
+def measure(op, *, repeats=7, min_time=0.1):
+    """
+    Time ``op()`` and summarize its throughput.
+
+    Returns
+    -------
+    dict
+        ``ops_per_sec`` (mean), ``ci_low``/``ci_high`` (95% interval),
+        ``stdev``, ``loops`` per sample and the raw ``samples``.
+    """
+    if repeats < 2:
+        raise ValueError("Need at least 2 repeats for a confidence interval.")
+    loops = _calibrate(op, min_time)
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            op()
+        samples.append(loops / (time.perf_counter() - start))
+    mean = statistics.fmean(samples)
+    stdev = statistics.stdev(samples)
+    half_width = _t_critical(repeats - 1) * stdev / math.sqrt(repeats)
+    return {
+        "ops_per_sec": mean,
+        "ci_low": mean - half_width,
+        "ci_high": mean + half_width,
+        "stdev": stdev,
+        "loops": loops,
+        "samples": samples,
+    }
+
+
+def run_cases(cases, *, repeats=7, min_time=0.1, pattern=None, report=print):
+    """
+    Measure every ``(name, make_op)`` in ``cases`` whose name contains
+    ``pattern``. ``make_op`` is called once to build the timed callable, so
+    setup cost stays out of the numbers.
+    """
+    results = {}
+    for name, make_op in cases:
+        if pattern and pattern not in name:
+            continue
+        result = measure(make_op(), repeats=repeats, min_time=min_time)
+        results[name] = result
+        if report:
+            report(format_result(name, result))
+    return results
+
+
+def format_result(name, result):
+    half_width = (result["ci_high"] - result["ci_low"]) / 2
+    percent = 100 * half_width / result["ops_per_sec"]
+    return f"{name:<40} {result['ops_per_sec']:>14,.1f} ops/s  ±{percent:4.1f}%"
+
+
+def save_results(path, results):
+    payload = {
+        "version": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+    return path
+
+
+def load_results(path):
+    payload = json.loads(Path(path).read_text())
+    if payload.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a version {FORMAT_VERSION} benchmark file.")
+    return payload["results"]
+
+
+def compare(results, baseline, *, threshold=0.1):
+    """
+    Compare ``results`` with ``baseline`` case by case.
+
+    A case regresses when its throughput dropped by more than ``threshold``
+    (a fraction) and the two confidence intervals do not overlap.
+
+    Returns
+    -------
+    list[dict]
+        One row per case present in both runs with ``name``, ``baseline``,
+        ``current``, ``change`` (fraction) and ``regression``.
+    """
+    rows = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        change = current["ops_per_sec"] / previous["ops_per_sec"] - 1
+        regression = change < -threshold and current["ci_high"] < previous["ci_low"]
+        rows.append({
+            "name": name,
+            "baseline": previous["ops_per_sec"],
+            "current": current["ops_per_sec"],
+            "change": change,
+            "regression": regression,
+        })
+    return rows
+
+
+def format_comparison(row):
+    flag = "  REGRESSION" if row["regression"] else ""
+    return (
+        f"{row['name']:<40} {row['baseline']:>14,.1f} -> {row['current']:>14,.1f} ops/s"
+        f"  {100 * row['change']:+6.1f}%{flag}"
+    )
@@ -0,0 +1,297 @@
+"""
+Compact binary storage for 3-style alg tables (letter pair -> alg string).
+
+Tables are converted once from spreadsheet exports (CSV, ``.xlsx`` when
+``openpyxl`` is installed, or Python modules holding a dict) into a file whose
+moves are interned as one-byte token ids:
+
+    header      magic, version, token count, entry count, key bytes, move bytes
+    tokens      token count * (uint8 length, utf-8 text)
+    key offsets (entry count + 1) uint32 into ``keys``
+    alg offsets (entry count + 1) uint32 into ``moves``
+    keys        utf-8 letter pairs, sorted by their bytes
+    moves       uint8 token ids, one per move
+
+``load_alg_table`` memory-maps such a file and returns an ``AlgTable``, a
+read-only ``Mapping`` that indexes the keys on first use and decodes an alg
+only when it is looked up, so importing a table costs neither parsing nor
+memory for the entries that are never used. Whitespace inside algs is normalized to
+single spaces.
+"""
+
+import csv
+import hashlib
+import mmap
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+
+MAGIC = b"ALGT"
+VERSION = 1
+MAX_TOKENS = 256
+_HEADER = struct.Struct("<4sHHIII")
+_OFFSET = struct.Struct("<I")
+_PAIR_HEADERS = {"pair", "key", "case"}
+
+
+def _intern_table(table):
+    keys = sorted(table, key=lambda key: key.encode("utf-8"))
+    token_ids = {}
+    encoded = []
+    for key in keys:
+        alg = table[key]
+        if not isinstance(key, str) or not isinstance(alg, str):
+            raise TypeError(f"Alg table entries must be strings, got {key!r}: {alg!r}.")
+        ids = bytearray()
+        for token in alg.split():
+            token_id = token_ids.setdefault(token, len(token_ids))
+            if token_id >= MAX_TOKENS:
+                raise ValueError(f"Alg tables support at most {MAX_TOKENS} distinct moves.")
+            ids.append(token_id)
+        encoded.append((key.encode("utf-8"), bytes(ids)))
+    return list(token_ids), encoded
+
+
+def write_alg_table(table, path):
+    """
+    Write ``table`` (any mapping of letter pair to alg string) to ``path`` in
+    the binary format and return the path.
+    """
+    path = Path(path)
+    tokens, encoded = _intern_table(table)
+    token_bytes = bytearray()
+    for token in tokens:
+        text = token.encode("utf-8")
+        if len(text) > 255:
+            raise ValueError(f"Move token {token!r} is too long.")
+        token_bytes.append(len(text))
+        token_bytes += text
+    key_offsets = [0]
+    alg_offsets = [0]
+    for key, ids in encoded:
+        key_offsets.append(key_offsets[-1] + len(key))
+        alg_offsets.append(alg_offsets[-1] + len(ids))
+    offsets = struct.pack(f"<{2 * len(key_offsets)}I", *key_offsets, *alg_offsets)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(_HEADER.pack(
+            MAGIC,
+            VERSION,
+            len(tokens),
+            len(encoded),
+            key_offsets[-1],
+            alg_offsets[-1],
+        ))
+        handle.write(token_bytes)
+        handle.write(offsets)
+        for key, _ in encoded:
+            handle.write(key)
+        for _, ids in encoded:
+            handle.write(ids)
+    tmp_path.replace(path)
+    return path
+
+
+class AlgTable(Mapping):
+    """
+    Read-only, memory-mapped view of a table written by ``write_alg_table``.
+
+    Iteration yields keys in sorted order. The file stays mapped until
+    ``close`` is called or the table is garbage collected.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            self._data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._parse_header()
+        except Exception:
+            self._data.close()
+            raise
+
+    def _parse_header(self):
+        data = self._data
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{self.path} is not a version {VERSION} alg table.")
+        magic, version, token_count, count, key_len, move_len = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a version {VERSION} alg table.")
+        offset = _HEADER.size
+        tokens = []
+        for _ in range(token_count):
+            length = data[offset]
+            tokens.append(data[offset + 1 : offset + 1 + length].decode("utf-8"))
+            offset += 1 + length
+        self._tokens = tokens
+        self._rows = None
+        self._digest = None
+        self._count = count
+        self._key_offsets = offset
+        self._alg_offsets = offset + 4 * (count + 1)
+        self._keys = self._alg_offsets + 4 * (count + 1)
+        self._moves = self._keys + key_len
+        if len(data) != self._moves + move_len:
+            raise ValueError(f"{self.path} is truncated.")
+
+    def _offset(self, base, row):
+        return _OFFSET.unpack_from(self._data, base + 4 * row)[0]
+
+    def _row_of(self):
+        # Keys are decoded together on first use; algs stay encoded until read.
+        if self._rows is None:
+            count = self._count
+            offsets = struct.unpack_from(f"<{count + 1}I", self._data, self._key_offsets)
+            blob = self._data[self._keys : self._keys + offsets[-1]]
+            keys = [blob[offsets[row] : offsets[row + 1]].decode("utf-8") for row in range(count)]
+            self._rows = {key: row for row, key in enumerate(keys)}
+        return self._rows
+
+    def _alg(self, row):
+        start = self._moves + self._offset(self._alg_offsets, row)
+        end = self._moves + self._offset(self._alg_offsets, row + 1)
+        tokens = self._tokens
+        return " ".join([tokens[token_id] for token_id in self._data[start:end]])
+
+    def __getitem__(self, key):
+        return self._alg(self._row_of()[key])
+
+    def __contains__(self, key):
+        return key in self._row_of()
+
+    def __iter__(self):
+        return iter(self._row_of())
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return f"AlgTable({str(self.path)!r}, {self._count} entries)"
+
+    @property
+    def tokens(self):
+        """Interned move tokens in id order."""
+        return tuple(self._tokens)
+
+    @property
+    def digest(self):
+        """
+        SHA-256 of the raw file bytes. The file layout is canonical (sorted
+        keys, tokens in first-use order), so equal tables written by
+        ``write_alg_table`` share a digest without any alg being decoded.
+        """
+        if self._digest is None:
+            self._digest = hashlib.sha256(self._data).hexdigest()
+        return self._digest
+
+    def close(self):
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def load_alg_table(path):
+    """Memory-map the alg table at ``path`` (see ``AlgTable``)."""
+    return AlgTable(path)
+
+
+def _cell(value):
+    return "" if value is None else str(value).strip()
+
+
+def _rows_to_table(rows):
+    """
+    Alg table from spreadsheet rows, either one ``pair, alg`` row per entry
+    (an optional ``pair``/``key`` header row is skipped) or a grid whose first
+    row holds the second letters and first column the first letters, with an
+    empty top-left cell. Empty cells are skipped.
+    """
+    rows = [[_cell(value) for value in row] for row in rows]
+    rows = [row for row in rows if any(row)]
+    if not rows:
+        return {}
+    header = rows[0]
+    table = {}
+    if not header[0] and len(header) > 2:
+        for row in rows[1:]:
+            first = row[0]
+            for second, alg in zip(header[1:], row[1:]):
+                if first and second and alg:
+                    table[first + second] = " ".join(alg.split())
+        return table
+    if header[0].lower() in _PAIR_HEADERS:
+        rows = rows[1:]
+    for row in rows:
+        if len(row) < 2 or not row[0] or not row[1]:
+            raise ValueError(f"Expected a 'pair, alg' row, got {row!r}.")
+        table[row[0]] = " ".join(row[1].split())
+    return table
+
+
+def read_csv_table(path):
+    """Alg table from a CSV export (see ``_rows_to_table`` for the layouts)."""
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        return _rows_to_table(csv.reader(handle))
+
+
+def read_xlsx_table(path, sheet=None):
+    """
+    Alg table from one worksheet (the active one by default) of an ``.xlsx``
+    file. Requires ``openpyxl``.
+    """
+    try:
+        import openpyxl
+    except ImportError as exc:
+        raise ImportError("Reading .xlsx alg tables requires openpyxl.") from exc
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.active
+        return _rows_to_table(worksheet.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def read_python_table(path, name):
+    """Alg table stored as the dict ``name`` in the Python file at ``path``."""
+    import runpy
+
+    table = runpy.run_path(str(path))[name]
+    return {key: " ".join(alg.split()) for key, alg in table.items()}
+
+
+def read_table(source, sheet=None):
+    """
+    Alg table from ``source``: a ``.csv`` or ``.xlsx`` path, or
+    ``module.py:NAME`` for a dict defined in a Python file.
+    """
+    source = str(source)
+    path, _, name = source.rpartition(":") if ".py:" in source else (source, "", "")
+    suffix = Path(path).suffix.lower()
+    if suffix == ".py":
+        return read_python_table(path, name)
+    if suffix == ".csv":
+        return read_csv_table(path)
+    if suffix in (".xlsx", ".xlsm"):
+        return read_xlsx_table(path, sheet)
+    raise ValueError(f"Unsupported alg table source {source!r}.")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert an alg table to the binary format.")
+    parser.add_argument("source", help="a .csv or .xlsx export, or module.py:NAME")
+    parser.add_argument("output")
+    parser.add_argument("--sheet", default=None, help="worksheet name for .xlsx sources")
+    args = parser.parse_args()
+    converted = read_table(args.source, args.sheet)
+    output = write_alg_table(converted, args.output)
+    with load_alg_table(output) as written:
+        print(f"{len(written)} algs, {len(written.tokens)} move tokens in {output}")
@@ -0,0 +1,180 @@
+"""
+Helpers for 3-style alg tables (letter pair -> alg string).
+
+Every alg always has the same net effect on the cube, so each table entry is
+collapsed once into its net facelet permutation (see ``dlin.MOVE_PERMUTATIONS``
+for the convention). Applying a sequence of algs then costs one permutation
+composition per alg instead of simulating every move.
+"""
+
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+
+import numpy as np
+
+from alg_store import AlgTable
+from dlin import (
+    FRAME_PERMUTATIONS,
+    MOVE_PERMUTATIONS,
+    SOLVED_FACELETS,
+    compile_alg,
+    sticker_facelet,
+)
+
+PERMUTATION_CACHE_SIZE = 16
+
+# content hash -> AlgPermutationTable, least recently used first
+_PERMUTATION_TABLES = OrderedDict()
+# id(table) -> (weak reference to a read-only AlgTable, content hash)
+_TABLE_DIGESTS = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Facelets on the U and F centers identify a whole-cube orientation.
+_U_CENTER = sticker_facelet("U")
+_F_CENTER = sticker_facelet("F")
+_CENTER_FRAMES = np.full((len(SOLVED_FACELETS), len(SOLVED_FACELETS)), -1, dtype=np.intp)
+for _frame, _perm in enumerate(FRAME_PERMUTATIONS):
+    _CENTER_FRAMES[_perm[_U_CENTER], _perm[_F_CENTER]] = _frame
+
+
+def alg_permutation(alg):
+    """Net facelet permutation of ``alg`` (a move string or compiled move ids)."""
+    perm = SOLVED_FACELETS
+    for move in compile_alg(alg):
+        perm = perm[MOVE_PERMUTATIONS[move]]
+    return perm
+
+
+def table_hash(table):
+    digest = hashlib.sha256()
+    for key in sorted(table):
+        digest.update(f"{key}\t{table[key]}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class AlgPermutationTable:
+    """
+    Net permutations for every entry of an alg table.
+
+    ``perms[row]`` is the permutation of ``keys[row]``; ``row_of`` maps a letter
+    pair back to its row.
+    """
+
+    __slots__ = ("digest", "keys", "row_of", "perms")
+
+    def __init__(self, table, digest=None):
+        self.digest = digest or table_hash(table)
+        self.keys = tuple(sorted(table))
+        self.row_of = {key: row for row, key in enumerate(self.keys)}
+        # int8 keeps the (B, 54) gathers in compose_rows cache friendly.
+        self.perms = np.array(
+            [alg_permutation(table[key]) for key in self.keys],
+            dtype=np.int8,
+        ).reshape(len(self.keys), len(SOLVED_FACELETS))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def rows(self, sequences):
+        """
+        Row indices for an iterable of comm sequences given as letter pairs
+        (``("A", "B")`` or ``"AB"``); raises ``KeyError`` for missing pairs.
+        """
+        return np.array(
+            [[self.row_of["".join(pair)] for pair in sequence] for sequence in sequences],
+            dtype=np.intp,
+        )
+
+    def pair_rows(self, letters):
+        """
+        ``(L, L)`` lookup from a pair of letter ids (indices into ``letters``)
+        to its table row, ``-1`` where the table has no alg. Lets id arrays
+        such as ``generate_five_cycles`` output be mapped with one indexing step.
+        """
+        lookup = np.full((len(letters), len(letters)), -1, dtype=np.intp)
+        for first_id, first in enumerate(letters):
+            for second_id, second in enumerate(letters):
+                lookup[first_id, second_id] = self.row_of.get(first + second, -1)
+        return lookup
+
+    def compose(self, sequence):
+        """Net permutation of executing the algs of ``sequence`` in order."""
+        perm = SOLVED_FACELETS
+        for pair in sequence:
+            perm = perm[self.perms[self.row_of["".join(pair)]]]
+        return perm
+
+    def compose_rows(self, rows):
+        """
+        Net permutation per row of an ``(B, K)`` array of table rows; raises
+        ``ValueError`` for the ``-1`` rows ``pair_rows`` gives missing pairs.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        if (rows < 0).any():
+            raise ValueError("Sequences use letter pairs missing from the alg table.")
+        net = self.perms[rows[:, 0]]
+        for step in range(1, rows.shape[1]):
+            net = np.take_along_axis(net, self.perms[rows[:, step]], axis=1)
+        return net
+
+    def solves(self, rows):
+        """
+        Boolean mask of the ``(B, K)`` row sequences that return to solved.
+        A sequence with a net whole-cube rotation still counts as solving, as
+        its net permutation is then compared with that rotation's.
+        """
+        net = self.compose_rows(rows)
+        frames = _CENTER_FRAMES[net[:, _U_CENTER], net[:, _F_CENTER]]
+        return (frames >= 0) & (net == FRAME_PERMUTATIONS[frames]).all(axis=1)
+
+
+def _cached_digest(table):
+    """
+    Content hash of ``table``. Only a memory-mapped ``AlgTable`` cannot
+    change, so only its hash is kept per object; other mappings are hashed
+    on every call.
+    """
+    if not isinstance(table, AlgTable):
+        return table_hash(table)
+    with _cache_lock:
+        entry = _TABLE_DIGESTS.get(id(table))
+        if entry is not None and entry[0]() is table:
+            _TABLE_DIGESTS.move_to_end(id(table))
+            return entry[1]
+    digest = table_hash(table)
+    with _cache_lock:
+        _TABLE_DIGESTS[id(table)] = (weakref.ref(table), digest)
+        while len(_TABLE_DIGESTS) > PERMUTATION_CACHE_SIZE:
+            _TABLE_DIGESTS.popitem(last=False)
+    return digest
+
+
+def permutation_table(table):
+    """
+    ``AlgPermutationTable`` for ``table``, built once per distinct table
+    content and reused on later calls.
+
+    Mutable tables are hashed on every call (about 3 ms for 800 entries), so
+    editing one is picked up; an ``AlgTable`` is only hashed on its first
+    call. At most ``PERMUTATION_CACHE_SIZE`` tables are kept.
+    """
+    digest = _cached_digest(table)
+    with _cache_lock:
+        cached = _PERMUTATION_TABLES.get(digest)
+        if cached is not None:
+            _PERMUTATION_TABLES.move_to_end(digest)
+            return cached
+    cached = AlgPermutationTable(table, digest)
+    with _cache_lock:
+        _PERMUTATION_TABLES[digest] = cached
+        while len(_PERMUTATION_TABLES) > PERMUTATION_CACHE_SIZE:
+            _PERMUTATION_TABLES.popitem(last=False)
+    return cached
+
+
+def clear_permutation_cache():
+    with _cache_lock:
+        _PERMUTATION_TABLES.clear()
+        _TABLE_DIGESTS.clear()
@@ -0,0 +1,228 @@
+"""
+Check every entry of a 3-style alg table against the 3-cycle its key names.
+
+For buffer ``B`` the entry ``XY`` must move the sticker on ``B`` to ``X``, the
+one on ``X`` to ``Y`` and the one on ``Y`` back to ``B``, with the other
+stickers of each piece following along, and leave every other facelet
+(centers included) where it is. Letters are placed on the cube through a
+sticker layout aligned with the scheme blocks; ``CORNER_STICKERS`` and
+``EDGE_STICKERS`` describe ``CORNER_LETTER_SCHEME`` and ``EDGE_LETTER_SCHEME``.
+
+A report only depends on the table content, scheme, buffer and layout, so
+``load_or_validate`` saves it as JSON under a key built from the table
+content and later runs read it back instead of simulating the table again.
+For a memory-mapped ``AlgTable`` the key uses ``AlgTable.digest`` of the raw
+file, so finding a cached report decodes no algs. A cache directory that
+cannot be read or written only costs a fresh validation.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+
+from alg_store import AlgTable
+from alg_tables import alg_permutation, table_hash
+from comm_drill_trainer import (
+    CORNER_BUFFER,
+    CORNER_LETTER_SCHEME,
+    EDGE_BUFFER,
+    EDGE_LETTER_SCHEME,
+)
+from dlin import FACELET_NAMES, SOLVED_FACELETS, sticker_facelet
+
+VERSION = 1
+
+# Sticker names per scheme block, in the order the scheme lists its letters.
+CORNER_STICKERS = (
+    "UFR RUF FUR", "UFL FUL LUF", "UBR BUR RUB", "UBL LUB BUL",
+    "RDF DFR FDR", "LDF FDL DFL", "DBL BDL LDB", "DBR RDB BDR",
+)
+EDGE_STICKERS = (
+    "UR RU", "UF FU", "UL LU", "UB BU", "FR RF", "FL LF",
+    "DR RD", "DL LD", "BR RB", "DF FD", "DB BD", "BL LB",
+)
+LAYOUTS = {
+    "corner": (CORNER_LETTER_SCHEME, CORNER_BUFFER, CORNER_STICKERS),
+    "edge": (EDGE_LETTER_SCHEME, EDGE_BUFFER, EDGE_STICKERS),
+}
+
+
+def _resolve_layout(piece_type, scheme, buffer_letter, stickers):
+    if piece_type not in LAYOUTS:
+        raise ValueError(
+            f"Unsupported piece type {piece_type!r}; expected one of {sorted(LAYOUTS)}."
+        )
+    default_scheme, default_buffer, default_stickers = LAYOUTS[piece_type]
+    if scheme is None:
+        scheme, stickers = default_scheme, stickers or default_stickers
+    elif stickers is None:
+        raise ValueError("A custom scheme needs a matching sticker layout.")
+    blocks = tuple(block for block in scheme.split(" ") if block)
+    stickers = tuple(
+        tuple(names.split()) if isinstance(names, str) else tuple(names) for names in stickers
+    )
+    if len(blocks) != len(stickers) or any(
+        len(block) != len(names) for block, names in zip(blocks, stickers)
+    ):
+        raise ValueError("Sticker layout must match the scheme block by block.")
+    return blocks, buffer_letter or default_buffer, stickers
+
+
+def _letter_facelets(blocks, stickers):
+    """Letter -> facelet ids of its piece, starting at the letter's sticker."""
+    facelets = {}
+    for block, names in zip(blocks, stickers):
+        ids = [sticker_facelet(name) for name in names]
+        for offset, letter in enumerate(block):
+            facelets[letter] = tuple(ids[offset:] + ids[:offset])
+    return facelets
+
+
+def _expected_permutation(letter_facelets, cycle):
+    perm = SOLVED_FACELETS.copy()
+    for source, target in zip(cycle, cycle[1:] + cycle[:1]):
+        perm[list(letter_facelets[target])] = letter_facelets[source]
+    return perm
+
+
+def _describe(perm, expected):
+    wrong = [FACELET_NAMES[idx] for idx in np.flatnonzero(perm != expected)]
+    return f"{len(wrong)} facelets differ ({', '.join(wrong)})."
+
+
+def validate_alg_table(
+    table, piece_type="corner", *, scheme=None, buffer_letter=None, stickers=None,
+):
+    """
+    Simulate every alg of ``table`` once and compare it with its key.
+
+    ``scheme``/``buffer_letter``/``stickers`` default to the layout of
+    ``piece_type``; a custom scheme must come with its sticker names, one
+    space-delimited string (or sequence) per block.
+
+    Returns
+    -------
+    dict
+        ``{"table_hash", "piece_type", "scheme", "buffer_letter", "checked",
+        "wrong", "missing"}`` where ``wrong`` maps each bad key to the reason
+        and ``missing`` lists the valid pairs without an alg, both sorted.
+    """
+    blocks, buffer_letter, stickers = _resolve_layout(piece_type, scheme, buffer_letter, stickers)
+    letter_facelets = _letter_facelets(blocks, stickers)
+    if buffer_letter not in letter_facelets:
+        raise ValueError(f"Buffer letter {buffer_letter} not present in scheme.")
+    block_of = {letter: idx for idx, block in enumerate(blocks) for letter in block}
+    buffer_block = block_of[buffer_letter]
+    targets = [letter for letter in letter_facelets if block_of[letter] != buffer_block]
+
+    wrong = {}
+    for key in sorted(table):
+        if len(key) != 2 or any(letter not in block_of for letter in key):
+            wrong[key] = "Key is not a pair of scheme letters."
+            continue
+        first, second = key
+        if buffer_block in (block_of[first], block_of[second]) or block_of[first] == block_of[second]:
+            wrong[key] = "Key does not name a 3-cycle with the buffer."
+            continue
+        try:
+            perm = alg_permutation(table[key])
+        except (KeyError, IndexError) as exc:
+            wrong[key] = f"Alg does not parse: {exc}."
+            continue
+        expected = _expected_permutation(letter_facelets, (buffer_letter, first, second))
+        if not np.array_equal(perm, expected):
+            wrong[key] = _describe(perm, expected)
+
+    missing = [
+        first + second
+        for first in sorted(targets)
+        for second in sorted(targets)
+        if block_of[first] != block_of[second] and first + second not in table
+    ]
+    return {
+        "table_hash": table_hash(table),
+        "piece_type": piece_type,
+        "scheme": " ".join(blocks),
+        "buffer_letter": buffer_letter,
+        "checked": len(table),
+        "wrong": wrong,
+        "missing": missing,
+    }
+
+
+def validation_key(
+    table, piece_type="corner", *, scheme=None, buffer_letter=None, stickers=None,
+):
+    """
+    Hash identifying a report: table content, layout and validator version.
+    ``AlgTable`` content is identified by its file digest, other mappings by
+    ``table_hash``.
+    """
+    blocks, buffer_letter, stickers = _resolve_layout(piece_type, scheme, buffer_letter, stickers)
+    layout = json.dumps([VERSION, piece_type, blocks, buffer_letter, stickers])
+    content = table.digest if isinstance(table, AlgTable) else table_hash(table)
+    digest = hashlib.sha256(content.encode("utf-8"))
+    digest.update(layout.encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def validation_path(directory, table, piece_type="corner", **layout):
+    return Path(directory) / f"{piece_type}-{validation_key(table, piece_type, **layout)}.json"
+
+
+def load_or_validate(directory, table, piece_type="corner", **layout):
+    """
+    Report for ``table`` from ``directory``, validating and saving it first
+    if this table content and layout have not been checked before. Reports
+    that cannot be read or saved are recomputed rather than raised.
+    """
+    path = validation_path(directory, table, piece_type, **layout)
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        # Missing, unreadable or corrupt: validate again and try to replace it.
+        pass
+    report = validate_alg_table(table, piece_type, **layout)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(report, indent=1, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        pass
+    return report
+
+
+def format_report(report):
+    lines = [
+        f"{report['piece_type']} table {report['table_hash'][:12]}: {report['checked']} algs, "
+        f"{len(report['wrong'])} wrong, {len(report['missing'])} missing"
+    ]
+    lines.extend(f"  {key}: {reason}" for key, reason in report["wrong"].items())
+    if report["missing"]:
+        lines.append(f"  missing: {' '.join(report['missing'])}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from alg_store import load_alg_table
+
+    parser = argparse.ArgumentParser(description="Validate a binary alg table.")
+    parser.add_argument("table", help="file written by alg_store")
+    parser.add_argument("--piece-type", choices=sorted(LAYOUTS), default="corner")
+    parser.add_argument(
+        "--cache-dir", default=None, help="reuse and store reports in this directory",
+    )
+    args = parser.parse_args()
+    with load_alg_table(args.table) as loaded:
+        if args.cache_dir:
+            result = load_or_validate(args.cache_dir, loaded, args.piece_type)
+        else:
+            result = validate_alg_table(loaded, args.piece_type)
+    print(format_report(result))
+    sys.exit(1 if result["wrong"] or result["missing"] else 0)
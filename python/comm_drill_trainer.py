@@ -1,4 +1,9 @@
+import functools
 import random
+import warnings
+from collections import Counter, deque, namedtuple
+
+from compiled_scheme import compile_scheme
 
 WING_LETTER_SCHEME = "OABCDEFGHIJKLMNPRSTUVWYZ"
 CENTER_LETTER_SCHEME = "AEOU ZFGH IJKL VNMP YRST BCDW"
@@ -34,75 +39,52 @@ def _normalize_forced_pair(forced_pair):
     raise TypeError("Forced pair must be a 2-character string or a 2-item iterable.")
 
 
-def _sequence_contains_pair(sequence, pair):
-    if not pair or not sequence or len(sequence) < 2:
-        return False
-    target = ''.join(pair)
-    for idx in range(len(sequence)):
-        nxt = sequence[(idx + 1) % len(sequence)]
-        if f"{sequence[idx]}{nxt}" == target:
-            return True
-    return False
-
-
-def generate_piece_letters(
-    count,
-    scheme,
-    buffer_letter,
-    *,
-    max_attempts=1000,
-    forced_pair=None,
-):
-    if count < 0:
-        raise ValueError("Requested count must be non-negative.")
-    if count == 0:
-        return []
-
-    normalized_pair = _normalize_forced_pair(forced_pair)
-    if normalized_pair and count < 2:
-        raise ValueError("Need at least two letters to include a forced pair.")
-
-    raw_blocks = [block for block in scheme.split(' ') if block]
-
-    trim_start = 0
-    if buffer_letter:
-        for idx, block in enumerate(raw_blocks):
-            if buffer_letter in block:
-                trim_start = idx + 1
+def _canonical_rotation(sequence):
+    """Smallest rotation of ``sequence``, so shifted copies share one key."""
+    items = tuple(sequence)
+    if not items:
+        return items
+    return min(items[offset:] + items[:offset] for offset in range(len(items)))
+
+
+def _dedup_window(draw, window, max_attempts=1000, sequence_of=None):
+    """
+    Yield ``draw()`` results forever, skipping any whose rotation-independent
+    key is among the last ``window`` yielded sequences. ``sequence_of`` picks
+    the sequence out of a drawn item (defaults to the item itself). Empty
+    sequences are never deduplicated, as they are all the same.
+    """
+    recent = deque()
+    recent_keys = set()
+    while True:
+        for _ in range(max(1, int(max_attempts))):
+            item = draw()
+            key = _canonical_rotation(sequence_of(item) if sequence_of else item)
+            if window <= 0 or not key or key not in recent_keys:
                 break
+        else:
+            raise RuntimeError(
+                f"Unable to draw a sequence outside the last {window} after multiple attempts.",
+            )
+        if window > 0 and key:
+            recent.append(key)
+            recent_keys.add(key)
+            if len(recent) > window:
+                recent_keys.discard(recent.popleft())
+        yield item
 
-    trimmed_blocks = raw_blocks[trim_start:]
-
-    if not trimmed_blocks:
-        raise ValueError("No pieces available after trimming with the buffer.")
-
-    block_strings = []
-    block_letter_templates = []
-
-    for block in trimmed_blocks:
-        letters = [letter for letter in block if letter != buffer_letter]
-        if letters:
-            block_strings.append(block)
-            block_letter_templates.append(letters)
-
-    if not block_letter_templates:
-        raise ValueError("No usable letters remain after applying the buffer.")
-
-    if count > 1 and len(block_strings) <= 1:
-        raise ValueError("Not enough distinct blocks to satisfy spacing constraints.")
 
-    letter_to_block_idx = {}
-    for idx, block in enumerate(block_strings):
-        for letter in block:
-            if letter == buffer_letter:
-                continue
-            letter_to_block_idx[letter] = idx
+def _prepare_chain(scheme, buffer_letter, forced_pair=None):
+    normalized_pair = _normalize_forced_pair(forced_pair)
+    compiled = compile_scheme(scheme, buffer_letter)
 
-    total_letters_per_cycle = sum(len(letters) for letters in block_letter_templates)
-    if total_letters_per_cycle == 0:
+    if not compiled.chain_blocks:
+        trimmed = compiled.blocks if compiled.buffer_idx is None else compiled.pieces_after_buffer
+        if not trimmed:
+            raise ValueError("No pieces available after trimming with the buffer.")
         raise ValueError("No usable letters remain after applying the buffer.")
-    cycle_attempt_limit = max(1, int(max_attempts))
 
+    letter_to_block_idx = compiled.chain_letter_to_block_idx
     if normalized_pair:
         if normalized_pair[0] == normalized_pair[1]:
             raise ValueError("Forced pair letters must be distinct.")
@@ -116,116 +98,719 @@ def generate_piece_letters(
         if block_a == block_b:
             raise ValueError("Forced pair letters cannot belong to the same piece.")
 
-    def build_cycle():
-        for _ in range(cycle_attempt_limit):
-            working = [letters.copy() for letters in block_letter_templates]
-            for letters in working:
-                random.shuffle(letters)
+    return {
+        "block_strings": compiled.chain_blocks,
+        "block_letter_templates": compiled.chain_letters,
+        "letter_to_block_idx": letter_to_block_idx,
+        "total_letters_per_cycle": compiled.chain_total,
+        "normalized_pair": normalized_pair,
+    }
 
-            cycle = []
-            last_idx = None
-            remaining = total_letters_per_cycle
 
-            while remaining > 0:
-                candidates = [i for i, letters in enumerate(working) if letters and i != last_idx]
-                if not candidates:
-                    break
-                idx = random.choice(candidates)
-                letter = working[idx].pop()
-                cycle.append((idx, letter))
-                last_idx = idx
-                remaining -= 1
-
-            if remaining != 0:
-                continue
-
-            if len(cycle) > 1 and cycle[0][0] == cycle[-1][0]:
-                shifts = list(range(1, len(cycle) - 1))
-                random.shuffle(shifts)
-                adjusted = None
-                for shift in shifts:
-                    rotated = cycle[shift:] + cycle[:shift]
-                    if rotated[0][0] != rotated[-1][0]:
-                        adjusted = rotated
-                        break
-                if adjusted is None:
-                    continue
-                cycle = adjusted
-
-            return cycle
+def _check_chain_count(prepared, count):
+    if count < 0:
+        raise ValueError("Requested count must be non-negative.")
+    if prepared["normalized_pair"] and count < 2:
+        raise ValueError("Need at least two letters to include a forced pair.")
+    if count > 1 and len(prepared["block_strings"]) <= 1:
+        raise ValueError("Not enough distinct blocks to satisfy spacing constraints.")
+    reason = _chain_infeasibility(prepared, count)
+    if reason:
+        raise ValueError(reason)
+
+
+# A chain is built in rounds like the original retry-based generator: each
+# full round is an arrangement of every usable letter with no two
+# consecutive letters on the same piece and different pieces at its two
+# ends, a round starts on a different piece than the previous one ended on,
+# the last round may stop early, and the last letter of the chain may not
+# share a piece with the first. ``_build_chain`` places letters one at a
+# time, choosing uniformly among the pieces from which all of this can still
+# be completed, so it never backtracks. It serves forced pairs, feasibility
+# checks and the counts the original process cannot produce; other chains
+# are drawn with the original weights by ``_draw_chain``.
+#
+# Completability only depends on how many pieces are in each situation, so
+# a round is summarised as a multiset of ``_PieceFeature`` records, where
+# ``mark`` tells apart the pieces of a forced pair (0 for the others).
+
+_PieceFeature = namedtuple(
+    "_PieceFeature",
+    (
+        "size",         # letters per round
+        "left",         # letters left in this round
+        "previous",     # holds the previous letter
+        "round_first",  # the round started on it
+        "end_ok",       # the round may end on it
+        "chain_first",  # the chain started on it
+        "mark",
+    ),
+)
+
+
+def _block_feature(template_counts, remaining, last_idx, first_idx, end_ok, wrap_idx, marks, idx):
+    return _PieceFeature(
+        template_counts[idx],
+        remaining[idx],
+        idx == last_idx,
+        idx == first_idx,
+        end_ok is None or idx in end_ok,
+        idx == wrap_idx,
+        marks.get(idx, 0),
+    )
 
+
+def _round_state(template_counts, remaining, last_idx, first_idx, end_ok, wrap_idx, marks):
+    features = Counter(
+        _block_feature(
+            template_counts, remaining, last_idx, first_idx, end_ok, wrap_idx, marks, idx,
+        )
+        for idx in range(len(remaining))
+    )
+    return frozenset(features.items())
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _advance_round(state, feature):
+    """State after placing a letter from a piece with ``feature``."""
+    counts = dict(state)
+    round_started = False
+    for old in list(counts):
+        round_started = round_started or old.round_first
+        if old.previous:
+            counts[old] -= 1
+            demoted = old._replace(previous=False)
+            counts[demoted] = counts.get(demoted, 0) + 1
+    counts[feature] -= 1
+    moved = feature._replace(
+        left=feature.left - 1,
+        previous=True,
+        round_first=feature.round_first or not round_started,
+    )
+    counts[moved] = counts.get(moved, 0) + 1
+    return frozenset(item for item in counts.items() if item[1])
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _can_finish_round(state, need, stop=0, wrap_flag=None, forced=()):
+    """
+    Whether the round can be continued until ``need`` drops to ``stop``. A
+    round that runs to the end must finish on an allowed piece other than the
+    one it started on; ``wrap_flag`` names the feature flag of the piece the
+    chain's last letter may not be on, and ``forced`` holds ``(need, mark)``
+    steps that must use the piece with that mark.
+    """
+    last = next((feature for feature, _ in state if feature.previous), None)
+    if need == stop:
+        if last is None:
+            return True
+        if wrap_flag is not None and getattr(last, wrap_flag):
+            return False
+        if stop:
+            return True
+        round_length = sum(feature.size * number for feature, number in state)
+        return last.end_ok and (round_length == 1 or not last.round_first)
+    required = dict(forced).get(need)
+    return any(
+        _can_finish_round(_advance_round(state, feature), need - 1, stop, wrap_flag, forced)
+        for feature, _ in state
+        if feature.left > 0
+        and not feature.previous
+        and (required is None or feature.mark == required)
+    )
+
+
+def _chain_rounds(count, total_letters_per_cycle):
+    """Number of rounds and the ``need`` at which the last round stops."""
+    rounds = -(-count // total_letters_per_cycle)
+    return rounds, rounds * total_letters_per_cycle - count
+
+
+def _round_limits(round_no, rounds, stop, count, forced_by_round):
+    """``_can_finish_round`` arguments after ``need`` for a round."""
+    forced = forced_by_round[round_no]
+    if round_no < rounds - 1:
+        return 0, None, forced
+    if count == 1:
+        return stop, None, forced
+    return stop, "round_first" if rounds == 1 else "chain_first", forced
+
+
+def _forced_by_round(count, total, forced_marks):
+    """Group ``{position: mark}`` into per-round ``(need, mark)`` tuples."""
+    rounds, _ = _chain_rounds(count, total)
+    grouped = [[] for _ in range(rounds)]
+    for position, mark in sorted(forced_marks.items()):
+        grouped[position // total].append((total - position % total, mark))
+    return tuple(tuple(steps) for steps in grouped)
+
+
+@functools.lru_cache(maxsize=1024)
+def _round_end_sets(template_counts, count, wrap_idx, marks, forced_by_round):
+    """
+    Pieces each round may end on so that every later round can still be
+    completed; the last round may end anywhere.
+    """
+    total = sum(template_counts)
+    rounds, stop = _chain_rounds(count, total)
+    marks = dict(marks)
+    ends = [None] * rounds
+    for round_no in range(rounds - 2, -1, -1):
+        following = ends[round_no + 1]
+        limits = _round_limits(round_no + 1, rounds, stop, count, forced_by_round)
+        ends[round_no] = frozenset(
+            idx
+            for idx in range(len(template_counts))
+            if _can_finish_round(
+                _round_state(
+                    template_counts, template_counts, idx, None, following, wrap_idx, marks,
+                ),
+                total,
+                *limits,
+            )
+        )
+    return tuple(ends)
+
+
+def _chain_starts(template_counts, count, marks, forced_by_round, first_forced):
+    """
+    Pieces the chain may start on. The first piece fixes the wrap constraint
+    for every round, so one piece per distinct ``(size, mark)`` is checked.
+    """
+    total = sum(template_counts)
+    rounds, stop = _chain_rounds(count, total)
+    candidates = range(len(template_counts)) if first_forced is None else (first_forced,)
+    kinds = {}
+    for idx in candidates:
+        kinds.setdefault((template_counts[idx], marks.get(idx, 0)), []).append(idx)
+    starts = []
+    for same_kind in kinds.values():
+        idx = same_kind[0]
+        ends = _round_end_sets(
+            template_counts, count, idx, tuple(sorted(marks.items())), forced_by_round,
+        )
+        state = _round_state(template_counts, template_counts, None, None, ends[0], idx, marks)
+        feature = _block_feature(
+            template_counts, template_counts, None, None, ends[0], idx, marks, idx,
+        )
+        limits = _round_limits(0, rounds, stop, count, forced_by_round)
+        if _can_finish_round(_advance_round(state, feature), total - 1, *limits):
+            starts.extend(same_kind)
+    return starts
+
+
+def _pick_block(state, feature_of, remaining, last_idx, need, limits, rng):
+    """
+    Uniform choice among the pieces the round can still be completed from.
+    A random candidate is drawn and only dropped if it is a dead end, so
+    usually a single check is needed.
+    """
+    candidates = [
+        idx for idx in range(len(remaining)) if remaining[idx] and idx != last_idx
+    ]
+    while candidates:
+        pos = rng.randrange(len(candidates))
+        idx = candidates[pos]
+        if _can_finish_round(_advance_round(state, feature_of(idx)), need - 1, *limits):
+            return idx
+        candidates[pos] = candidates[-1]
+        candidates.pop()
+    return None
+
+
+def _chain_layout(prepared, count, forced_letters):
+    """
+    Marks of the forced pieces, per-round forced steps and the pieces the
+    chain may start on, for ``forced_letters`` mapping positions to letters.
+    """
+    letter_to_block_idx = prepared["letter_to_block_idx"]
+    template_counts = tuple(len(letters) for letters in prepared["block_letter_templates"])
+    marks = {
+        letter_to_block_idx[letter]: mark
+        for mark, letter in enumerate(sorted(set(forced_letters.values())), start=1)
+    }
+    forced_by_round = _forced_by_round(
+        count,
+        prepared["total_letters_per_cycle"],
+        {position: marks[letter_to_block_idx[letter]] for position, letter in forced_letters.items()},
+    )
+    first_forced = forced_letters.get(0)
+    starts = _chain_starts(
+        template_counts,
+        count,
+        marks,
+        forced_by_round,
+        None if first_forced is None else letter_to_block_idx[first_forced],
+    )
+    return marks, forced_by_round, starts
+
+
+def _pair_placements(prepared, count):
+    """Forced letters for each position the forced pair may start at."""
+    first, second = prepared["normalized_pair"]
+    return [{position: first, (position + 1) % count: second} for position in range(count)]
+
+
+@functools.lru_cache(maxsize=1024)
+def _plain_chain_exists(template_counts, count):
+    """``_chain_exists`` without a forced pair, which only depends on the sizes."""
+    forced_by_round = _forced_by_round(count, sum(template_counts), {})
+    return bool(_chain_starts(template_counts, count, {}, forced_by_round, None))
+
+
+def _chain_exists(prepared, count, *, with_pair=True):
+    """Whether any chain of ``count`` letters satisfies the constraints."""
+    if count == 0:
+        return True
+    if not (with_pair and prepared["normalized_pair"]):
+        template_counts = tuple(map(len, prepared["block_letter_templates"]))
+        return _plain_chain_exists(template_counts, count)
+    return any(
+        _chain_layout(prepared, count, forced_letters)[2]
+        for forced_letters in _pair_placements(prepared, count)
+    )
+
+
+def _build_chain(prepared, count, rng, forced_letters=None):
+    """
+    One chain of ``count`` letters, or ``None`` if none exists.
+    ``forced_letters`` maps positions to letters that must appear there.
+    """
+    templates = prepared["block_letter_templates"]
+    letter_to_block_idx = prepared["letter_to_block_idx"]
+    template_counts = tuple(len(letters) for letters in templates)
+    total = prepared["total_letters_per_cycle"]
+    rounds, stop = _chain_rounds(count, total)
+    forced_letters = forced_letters or {}
+    marks, forced_by_round, starts = _chain_layout(prepared, count, forced_letters)
+    if not starts:
         return None
+    wrap_idx = rng.choice(starts)
+    ends = _round_end_sets(
+        template_counts, count, wrap_idx, tuple(sorted(marks.items())), forced_by_round,
+    )
 
-    def rotate_for_previous(cycle, prev_idx):
-        if prev_idx is None:
-            return cycle
-        if len(cycle) == 1:
-            return None if cycle[0][0] == prev_idx else cycle
-        shifts = list(range(len(cycle)))
-        random.shuffle(shifts)
-        for shift in shifts:
-            rotated = cycle[shift:] + cycle[:shift]
-            first_block = rotated[0][0]
-            last_block = rotated[-1][0]
-            if first_block == prev_idx:
-                continue
-            if len(rotated) > 1 and first_block == last_block:
-                continue
-            return rotated
+    result = []
+    last_idx = None
+    for round_no in range(rounds):
+        limits = _round_limits(round_no, rounds, stop, count, forced_by_round)
+        end_ok = ends[round_no]
+        working = [list(letters) for letters in templates]
+        reserved = {
+            letter_to_block_idx[letter]: letter
+            for position, letter in forced_letters.items()
+            if position // total == round_no
+        }
+        remaining = list(template_counts)
+        first_idx = None
+        state = _round_state(
+            template_counts, remaining, last_idx, first_idx, end_ok, wrap_idx, marks,
+        )
+
+        def feature_of(idx):
+            return _block_feature(
+                template_counts, remaining, last_idx, first_idx, end_ok, wrap_idx, marks, idx,
+            )
+
+        for need in range(total, limits[0], -1):
+            forced_letter = forced_letters.get(len(result))
+            if forced_letter is not None:
+                idx = letter_to_block_idx[forced_letter]
+            elif result:
+                idx = _pick_block(state, feature_of, remaining, last_idx, need, limits, rng)
+            else:
+                idx = wrap_idx
+            state = _advance_round(state, feature_of(idx))
+            letters = working[idx]
+            if forced_letter is not None:
+                letter = forced_letter
+                del reserved[idx]
+            else:
+                free = [pos for pos, letter in enumerate(letters) if letter != reserved.get(idx)]
+                letter = letters[rng.choice(free)]
+            letters.remove(letter)
+            result.append(letter)
+            remaining[idx] -= 1
+            last_idx = idx
+            if first_idx is None:
+                first_idx = idx
+    return result
+
+
+# ``_draw_chain`` reproduces the distribution of the original generator
+# without its retries. That generator drew each round as a walk picking
+# uniformly among the pieces with letters left other than the previous one,
+# and redrew walks that got stuck. A walk that started and ended on the same
+# piece was rotated by a random shift in ``1..len - 2``, which leaves those
+# two letters next to each other inside the round, and every round after the
+# first was rotated uniformly to start away from the previous piece. Chains
+# in which such a pair fell within the letters used, or whose ends shared a
+# piece, were thrown away and started over.
+#
+# Here walks are drawn conditioned on completing by weighting each step with
+# the odds that the walk completes from there. Those odds only depend on the
+# letters left on the first and previous pieces and on how many other pieces
+# have each number of letters left, so they are memoized over
+# ``(plain, first, last)``: ``plain[c - 1]`` counts the other pieces with
+# ``c`` letters left, ``first`` is the letters left on the first piece and
+# ``last`` those on the previous piece, or ``-1`` when the previous piece is
+# the first. Both are ``None`` before the first step.
+
+_COMPLETE, _VALID, _POISONED = 0, 1, 2
+_CHAIN_REDRAWS = 100
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _walk_moves(plain, first, last):
+    """``(pieces, size, next state)`` per move; ``size`` is ``None`` for the first piece."""
+    base = list(plain)
+    if last is not None and last > 0:
+        base[last - 1] += 1
+    moves = []
+    for size, number in enumerate(plain, start=1):
+        if number:
+            following = base.copy()
+            following[size - 1] -= 1
+            if first is None:
+                moves.append((number, size, (tuple(following), size - 1, -1)))
+            else:
+                moves.append((number, size, (tuple(following), first, size - 1)))
+    if first and last != -1:
+        moves.append((1, None, (tuple(base), first - 1, -1)))
+    return tuple(moves)
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _walk_odds(plain, first, last):
+    """
+    Odds that a walk in this state uses up every letter, and that it does so
+    ending away from its first piece.
+    """
+    moves = _walk_moves(plain, first, last)
+    if not moves:
+        if any(plain) or first or (last is not None and last > 0):
+            return 0.0, 0.0
+        return 1.0, float(last != -1)
+    complete = valid = 0.0
+    pieces = 0
+    for number, _, following in moves:
+        odds = _walk_odds(*following)
+        complete += number * odds[0]
+        valid += number * odds[1]
+        pieces += number
+    return complete / pieces, valid / pieces
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _walk_choices(state, mode):
+    """Moves with cumulative weights scaled to 1 for sampling walks of ``mode``."""
+    moves = []
+    total = 0.0
+    for number, size, following in _walk_moves(*state):
+        complete, valid = _walk_odds(*following)
+        weight = (complete, valid, complete - valid)[mode]
+        if weight > 0:
+            total += number * weight
+            moves.append((total, size, following))
+    return tuple((bound / total, size, following) for bound, size, following in moves)
+
+
+@functools.lru_cache(maxsize=1024)
+def _walk_setup(template_counts):
+    """Start state and the pieces holding each number of letters."""
+    plain = [0] * max(template_counts)
+    buckets = [[] for _ in range(len(plain) + 1)]
+    for idx, size in enumerate(template_counts):
+        plain[size - 1] += 1
+        buckets[size].append(idx)
+    return (tuple(plain), None, None), tuple(map(tuple, buckets))
+
+
+def _sample_walk(templates, template_counts, mode, steps, rng):
+    """
+    First ``steps`` pieces and letters of a walk over every letter of
+    ``templates``, drawn like the original generator conditioned on
+    ``mode``: completing, also ending away from the first piece
+    (``_VALID``), or ending on it (``_POISONED``).
+    """
+    state, buckets = _walk_setup(template_counts)
+    buckets = list(map(list, buckets))
+    remaining = list(template_counts)
+    working = list(map(list, templates))
+    walk = []
+    letters = []
+    first_idx = last_idx = None
+    random_ = rng.random
+    for _ in range(steps):
+        choices = _walk_choices(state, mode)
+        if len(choices) == 1:
+            _, size, state = choices[0]
+        else:
+            point = random_()
+            for bound, size, state in choices:
+                if point < bound:
+                    break
+        if size is None:
+            idx = first_idx
+        else:
+            bucket = buckets[size]
+            if len(bucket) == 1:
+                idx = bucket.pop()
+            else:
+                pos = int(random_() * len(bucket))
+                idx = bucket[pos]
+                bucket[pos] = bucket[-1]
+                bucket.pop()
+        if last_idx != first_idx and remaining[last_idx]:
+            buckets[remaining[last_idx]].append(last_idx)
+        remaining[idx] -= 1
+        if first_idx is None:
+            first_idx = idx
+        pool = working[idx]
+        if len(pool) == 1:
+            letters.append(pool.pop())
+        else:
+            pos = int(random_() * len(pool))
+            letters.append(pool[pos])
+            pool[pos] = pool[-1]
+            pool.pop()
+        walk.append(idx)
+        last_idx = idx
+    return walk, letters
+
+
+def _legacy_chain_possible(template_counts, count):
+    """Whether the original process can produce a chain of ``count`` letters."""
+    complete, valid = _walk_odds(*_walk_setup(template_counts)[0])
+    rounds, _ = _chain_rounds(count, sum(template_counts))
+    return complete > 0 and (rounds == 1 or valid > 0)
+
+
+def _draw_chain(prepared, count, rng):
+    """
+    One chain with the weights of the original generator, or ``None`` where
+    it would have started over.
+    """
+    templates = prepared["block_letter_templates"]
+    template_counts = tuple(map(len, templates))
+    total = prepared["total_letters_per_cycle"]
+    if total == 1:
+        return list(templates[0])
+    rounds, stop = _chain_rounds(count, total)
+    size = total - stop
+    blocks = []
+    result = []
+    for _ in range(rounds - 1):
+        walk, letters = _sample_walk(templates, template_counts, _VALID, total, rng)
+        shift = 0
+        if blocks:
+            shift = rng.randrange(total)
+            while walk[shift] == blocks[-1]:
+                shift = rng.randrange(total)
+        blocks += walk[shift:] + walk[:shift]
+        result += letters[shift:] + letters[:shift]
+
+    if not blocks:
+        # With no previous round only the first ``size`` letters of the walk
+        # (or of its rotation) matter, so draw just as many.
+        complete, valid = _walk_odds(*_walk_setup(template_counts)[0])
+        if rng.random() * complete < valid:
+            walk, letters = _sample_walk(templates, template_counts, _VALID, size, rng)
+        else:
+            shift = rng.randint(1, total - 2)
+            if shift > total - size:
+                return None
+            walk, letters = _sample_walk(templates, template_counts, _POISONED, shift + size, rng)
+            walk, letters = walk[shift:], letters[shift:]
+        if count > 1 and walk[0] == walk[-1]:
+            return None
+        return letters
+
+    walk, letters = _sample_walk(templates, template_counts, _COMPLETE, total, rng)
+    pair_at = None
+    if walk[0] == walk[-1]:
+        shift = rng.randint(1, total - 2)
+        walk = walk[shift:] + walk[:shift]
+        letters = letters[shift:] + letters[:shift]
+        pair_at = total - shift
+    shift = rng.randrange(total)
+    while walk[shift] == blocks[-1] or shift == pair_at:
+        shift = rng.randrange(total)
+    if pair_at is not None and (pair_at - shift) % total < size:
+        return None
+    walk = (walk[shift:] + walk[:shift])[:size]
+    if walk[-1] == blocks[0]:
         return None
+    return result + (letters[shift:] + letters[:shift])[:size]
 
-    overall_attempt_limit = max(1, int(max_attempts))
-
-    for _ in range(overall_attempt_limit):
-        result = []
-        prev_block_idx = None
-        remaining = count
-        attempt_failed = False
-
-        while remaining > 0:
-            cycle = None
-            for _ in range(cycle_attempt_limit):
-                candidate = build_cycle()
-                if candidate is None:
-                    continue
-                adjusted = rotate_for_previous(candidate, prev_block_idx)
-                if adjusted is None:
-                    continue
-                cycle = adjusted
-                break
 
-            if cycle is None:
-                attempt_failed = True
-                break
+def _sample_chain(prepared, count, rng):
+    if count == 0:
+        return []
 
-            for block_idx, letter in cycle:
-                if remaining == 0:
-                    break
-                if prev_block_idx is not None and block_idx == prev_block_idx:
-                    attempt_failed = True
-                    break
-                result.append(letter)
-                prev_block_idx = block_idx
-                remaining -= 1
+    normalized_pair = prepared["normalized_pair"]
+    if not normalized_pair:
+        template_counts = tuple(map(len, prepared["block_letter_templates"]))
+        if _legacy_chain_possible(template_counts, count):
+            for _ in range(_CHAIN_REDRAWS):
+                result = _draw_chain(prepared, count, rng)
+                if result is not None:
+                    return result
+        result = _build_chain(prepared, count, rng)
+        if result is None:
+            raise ValueError("Unable to satisfy block spacing constraints.")
+        return result
 
-            if attempt_failed:
-                break
+    # Place the forced pair at a random position (wrapping around the end)
+    # and build the rest of the chain around it.
+    placements = _pair_placements(prepared, count)
+    while placements:
+        pick = rng.randrange(len(placements))
+        result = _build_chain(prepared, count, rng, placements[pick])
+        if result is not None:
+            return result
+        placements[pick] = placements[-1]
+        placements.pop()
+
+    first, second = normalized_pair
+    raise ValueError(
+        f"Unable to place forced pair {first}{second} while satisfying block spacing constraints.",
+    )
 
-        if attempt_failed or len(result) < count:
-            continue
 
-        if len(result) > 1:
-            first_block = letter_to_block_idx.get(result[0])
-            last_block = letter_to_block_idx.get(result[-1])
-            if first_block is None or last_block is None or first_block == last_block:
-                continue
+def _max_chain_count(prepared):
+    """
+    Largest feasible count, or ``None`` when counts are unbounded.
+
+    Without a full round (one piece holding more than half the letters) a
+    chain is a single partial round. Otherwise the feasible counts settle
+    into a pattern repeating every round within a few rounds, so a feasible
+    count in the last round before a horizon of ``pieces + 4`` rounds means
+    arbitrarily long chains exist.
+    """
+    total = prepared["total_letters_per_cycle"]
+    sizes = [len(letters) for letters in prepared["block_letter_templates"]]
+    if len(sizes) <= 1:
+        return 1
+    if 2 * max(sizes) > total:
+        horizon = total
+    else:
+        horizon = (len(sizes) + 4) * total
+        if any(_chain_exists(prepared, count) for count in range(horizon, horizon - total, -1)):
+            return None
+        horizon -= total
+    for count in range(horizon, 0, -1):
+        if _chain_exists(prepared, count):
+            return count
+    return 0
+
+
+def _chain_infeasibility(prepared, count):
+    """Why no chain of ``count`` letters exists, or ``None`` if one does."""
+    if _chain_exists(prepared, count):
+        return None
+    maximum = _max_chain_count(prepared)
+    limit = "" if maximum is None else f" The maximum feasible count is {maximum}."
+    if prepared["normalized_pair"] and _chain_exists(prepared, count, with_pair=False):
+        first, second = prepared["normalized_pair"]
+        return (
+            f"Forced pair {first}{second} cannot be placed in a chain of {count} letters "
+            f"without breaking block spacing constraints.{limit}"
+        )
+    sizes = [len(letters) for letters in prepared["block_letter_templates"]]
+    largest = max(sizes)
+    total = prepared["total_letters_per_cycle"]
+    if len(sizes) == 2 and count % 2:
+        return (
+            f"With only two pieces a chain alternates between them, so it cannot have "
+            f"an odd number of letters ({count}).{limit}"
+        )
+    if count < total:
+        # One partial round: its letters are distinct and, around the cycle,
+        # no piece can supply more than every other letter.
+        share = count // 2
+        available = sum(min(size, share) for size in sizes)
+        return (
+            f"A chain of {count} letters is a single partial round, where each piece may "
+            f"supply at most {share} letters, and the pieces only have {available} to "
+            f"offer.{limit}"
+        )
+    if 2 * largest > total:
+        block = prepared["block_strings"][sizes.index(largest)]
+        return (
+            f"Piece {block} holds {largest} of {total} letters, more than half, so a full "
+            f"round cannot keep its letters apart.{limit}"
+        )
+    return f"No chain of {count} letters satisfies block spacing constraints.{limit}"
+
+
+def max_chain_count(scheme, buffer_letter, forced_pair=None):
+    """
+    Largest count ``generate_piece_letters`` accepts for this scheme, buffer
+    and forced pair, or ``None`` if arbitrarily long chains exist. Some
+    smaller counts may still be infeasible (e.g. odd counts with two pieces).
+    """
+    return _max_chain_count(_prepare_chain(scheme, buffer_letter, forced_pair))
+
+
+def _warn_max_attempts(max_attempts, stacklevel=3):
+    """
+    Warn that ``max_attempts`` was passed to a generator that no longer
+    retries (the streams still use it to bound dedup redraws).
+    """
+    if max_attempts is not None:
+        warnings.warn(
+            "max_attempts is deprecated and ignored: generation no longer retries.",
+            DeprecationWarning,
+            stacklevel=stacklevel,
+        )
 
-        if normalized_pair and not _sequence_contains_pair(result, normalized_pair):
-            continue
 
-        return result
+def generate_piece_letters(
+    count,
+    scheme,
+    buffer_letter,
+    *,
+    max_attempts=None,
+    forced_pair=None,
+    rng=None,
+):
+    _warn_max_attempts(max_attempts)
+    if count < 0:
+        raise ValueError("Requested count must be non-negative.")
+    if count == 0:
+        return []
+    prepared = _prepare_chain(scheme, buffer_letter, forced_pair)
+    _check_chain_count(prepared, count)
+    return _sample_chain(prepared, count, rng or random)
+
 
-    raise ValueError("Unable to satisfy block spacing constraints after multiple attempts.")
+def iter_chain_sequences(
+    count,
+    scheme,
+    buffer_letter,
+    *,
+    max_attempts=1000,
+    forced_pair=None,
+    rng=None,
+    dedup_window=0,
+):
+    """
+    Lazily yield chain-method letter sequences forever.
+
+    The scheme and forced pair are validated once up front. With
+    ``dedup_window > 0`` a sequence (or any rotation of it) is not repeated
+    within that many consecutive results; ``max_attempts`` bounds the redraws
+    spent avoiding one.
+    """
+    prepared = _prepare_chain(scheme, buffer_letter, forced_pair)
+    _check_chain_count(prepared, count)
+    rng = rng or random
+    yield from _dedup_window(
+        lambda: _sample_chain(prepared, count, rng),
+        dedup_window,
+        max_attempts,
+    )
 
 
 def generate_wings(num_letters, forced_pair=None):
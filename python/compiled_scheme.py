@@ -0,0 +1,202 @@
+"""
+Scheme preprocessing shared by the five-cycle and chain-method generators.
+
+``compile_scheme(scheme, buffer_letter)`` splits the scheme once, interns its
+letters and works out which pieces each generator may draw from after the
+buffer, returning an immutable ``CompiledScheme``. Results are kept in a
+process-wide LRU cache so callers cycling through many schemes and buffers
+only pay for each combination once. Unlike ``functools.lru_cache`` the cache
+size can be changed at runtime with ``set_cache_size``.
+
+Compiling never fails on generator-specific conditions (unequal block sizes,
+a buffer missing from the scheme, too few pieces); those are left to each
+generator so they keep raising their own errors.
+"""
+
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+
+from sticker_state import StickerScheme
+
+DEFAULT_CACHE_SIZE = 128
+
+_cache = OrderedDict()
+_cache_size = DEFAULT_CACHE_SIZE
+_cache_lock = threading.Lock()
+_hits = 0
+_misses = 0
+
+
+def _split_blocks(scheme):
+    if isinstance(scheme, str):
+        return tuple(block for block in scheme.split(" ") if block)
+    return tuple(scheme)
+
+
+def _build_scheme_data(blocks):
+    stickers = StickerScheme(blocks)
+    letter_to_ref_pos = {
+        ch: stickers.ref_pos(idx) for idx, ch in enumerate(stickers.letters)
+    }
+    return {
+        "blocks": blocks,
+        "block_len": stickers.block_len,
+        "letter_to_ref_pos": letter_to_ref_pos,
+        "stickers": stickers,
+    }
+
+
+class CompiledScheme:
+    """
+    Precomputed tables for one ``(scheme, buffer_letter)``.
+
+    Attributes
+    ----------
+    blocks : tuple[str, ...]
+        Scheme blocks in order.
+    text : str
+        Blocks joined by single spaces.
+    letter_to_block_idx : Mapping[str, int]
+        Block index of every letter in ``blocks``.
+    buffer_idx : int | None
+        Block holding the buffer letter, if any.
+    pieces_after_buffer : tuple[str, ...]
+        Blocks after the buffer block (empty if the buffer is missing).
+    chain_blocks, chain_letters : tuple
+        Blocks the chain method draws from and their letters without the
+        buffer; without a buffer match every block is used.
+    chain_letter_to_block_idx : Mapping[str, int]
+        Index into ``chain_blocks`` of every chain letter.
+    chain_total : int
+        Letters in one chain round.
+    """
+
+    __slots__ = (
+        "blocks",
+        "buffer_letter",
+        "text",
+        "letter_to_block_idx",
+        "buffer_idx",
+        "pieces_after_buffer",
+        "chain_blocks",
+        "chain_letters",
+        "chain_letter_to_block_idx",
+        "chain_total",
+        "_scheme_data",
+    )
+
+    def __init__(self, blocks, buffer_letter):
+        blocks = tuple(blocks)
+        letter_to_block_idx = {}
+        for idx, block in enumerate(blocks):
+            for letter in block:
+                letter_to_block_idx[letter] = idx
+        buffer_idx = next(
+            (idx for idx, block in enumerate(blocks) if buffer_letter and buffer_letter in block),
+            None,
+        )
+        trimmed = blocks if buffer_idx is None else blocks[buffer_idx + 1 :]
+        chain_blocks = []
+        chain_letters = []
+        for block in trimmed:
+            letters = tuple(letter for letter in block if letter != buffer_letter)
+            if letters:
+                chain_blocks.append(block)
+                chain_letters.append(letters)
+        try:
+            scheme_data = MappingProxyType(_build_scheme_data(blocks))
+        except ValueError as exc:
+            # Keep only the error's type and args: a cached exception instance
+            # would collect a traceback (and pin caller frames) on every raise.
+            scheme_data = (type(exc), exc.args)
+
+        setattr_ = super().__setattr__
+        setattr_("blocks", blocks)
+        setattr_("buffer_letter", buffer_letter)
+        setattr_("text", " ".join(blocks))
+        setattr_("letter_to_block_idx", MappingProxyType(letter_to_block_idx))
+        setattr_("buffer_idx", buffer_idx)
+        setattr_("pieces_after_buffer", () if buffer_idx is None else blocks[buffer_idx + 1 :])
+        setattr_("chain_blocks", tuple(chain_blocks))
+        setattr_("chain_letters", tuple(chain_letters))
+        setattr_(
+            "chain_letter_to_block_idx",
+            MappingProxyType({
+                letter: idx for idx, letters in enumerate(chain_letters) for letter in letters
+            }),
+        )
+        setattr_("chain_total", sum(len(letters) for letters in chain_letters))
+        setattr_("_scheme_data", scheme_data)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __repr__(self):
+        return f"CompiledScheme({self.text!r}, {self.buffer_letter!r})"
+
+    @property
+    def scheme_data(self):
+        """
+        Sticker tables for the five-cycle generator (see ``StickerScheme``).
+
+        Raises
+        ------
+        ValueError
+            If the blocks do not form a valid sticker scheme.
+        """
+        if isinstance(self._scheme_data, tuple):
+            error_type, args = self._scheme_data
+            raise error_type(*args)
+        return self._scheme_data
+
+
+def compile_scheme(scheme, buffer_letter):
+    """
+    Cached ``CompiledScheme`` for ``scheme`` (a space-delimited string or a
+    sequence of blocks) and ``buffer_letter``.
+    """
+    global _hits, _misses
+    key = (scheme if isinstance(scheme, str) else _split_blocks(scheme), buffer_letter)
+    with _cache_lock:
+        compiled = _cache.get(key)
+        if compiled is not None:
+            _cache.move_to_end(key)
+            _hits += 1
+            return compiled
+        _misses += 1
+    compiled = CompiledScheme(_split_blocks(scheme), buffer_letter)
+    with _cache_lock:
+        if _cache_size > 0:
+            _cache[key] = compiled
+            while len(_cache) > _cache_size:
+                _cache.popitem(last=False)
+    return compiled
+
+
+def set_cache_size(size):
+    """Keep at most ``size`` compiled schemes (0 disables caching)."""
+    global _cache_size
+    size = int(size)
+    if size < 0:
+        raise ValueError("Cache size must be non-negative.")
+    with _cache_lock:
+        _cache_size = size
+        while len(_cache) > size:
+            _cache.popitem(last=False)
+
+
+def clear_cache():
+    global _hits, _misses
+    with _cache_lock:
+        _cache.clear()
+        _hits = _misses = 0
+
+
+def cache_info():
+    """``{"hits", "misses", "size", "maxsize"}`` for the compiled-scheme cache."""
+    with _cache_lock:
+        return {"hits": _hits, "misses": _misses, "size": len(_cache), "maxsize": _cache_size}
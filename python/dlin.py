@@ -1,3 +1,4 @@
+import functools
 import numpy as np
 import json
 
@@ -8,6 +9,24 @@ BUFFERS = {
 
 # piece.py
 
+FACE_PRECEDENCE = {"U": 0, "D": 0, "F": 1, "B": 1, "R": 2, "L": 2, "": 3}
+
+
+def piece_name(sides, axis=1):
+    axis_face = sides[axis]
+    axis_face = sides[2] if not axis_face else axis_face
+    name = list(sides)
+    index = name.index(axis_face)
+    name[index], name[0] = name[0], name[index]
+    name[1:] = sorted(name[1:], key=lambda x: FACE_PRECEDENCE[x])
+    return "".join(name)
+
+
+def piece_key(sides):
+    """Orientation-independent identity of a piece: the set of its faces."""
+    return frozenset(side for side in sides if side)
+
+
 class Piece():
     def __init__(self, x, y, z):
         xd = {0: "L", 1: "", 2: "R"}
@@ -15,24 +34,191 @@ class Piece():
         zd = {0: "F", 1: "", 2: "B"}
         self.sides = [xd[x], yd[y], zd[z]]
 
+    @property
+    def sides(self):
+        return self._sides
+
+    @sides.setter
+    def sides(self, sides):
+        self._sides = sides
+        self._names = {}
+        self.key = piece_key(sides)
+
     def get_name(self, axis=1):
-        face_precedence = {"U": 0, "D": 0, "F": 1, "B": 1, "R": 2, "L": 2, "": 3}
-        axis_face = self.sides[axis]
-        axis_face = self.sides[2] if not axis_face else axis_face
-        name = self.sides.copy()
-        index = name.index(axis_face)
-        name[index], name[0] = name[0], name[index]
-        name[1:] = sorted(name[1:], key=lambda x: face_precedence[x])
-        return "".join(name)
+        name = self._names.get(axis)
+        if name is None:
+            name = self._names[axis] = piece_name(self.sides, axis)
+        return name
                 
     def swap_stickers(self, axis1, axis2):
         self.sides[axis1], self.sides[axis2] = self.sides[axis2], self.sides[axis1]
+        self._names = {}
         return
     
     def roll(self, k):
         self.sides = np.roll(self.sides, k)
         return
 
+# moves.py
+
+MOVE_FACES = "UDLRFBMES"
+WIDE_FACES = "UDLRFB"
+ROTATIONS = "xyz"
+ALG_CACHE_SIZE = 4096
+
+
+def parse_move(move):
+    """
+    Canonical name of a move token: lowercase faces are wide turns, a ``'`` anywhere makes it counterclockwise
+    and a ``2`` anywhere makes it a half turn.
+    """
+    if move[0] in "urfbld":
+        move = move[0].upper() + "w" + move[1:]
+    face = move[0]
+    suffix = "2" if "2" in move else ("'" if "'" in move else "")
+    if face in ROTATIONS:
+        return face + suffix
+    if "w" in move:
+        return face + "w" + suffix
+    return face + suffix
+
+
+MOVE_NAMES = tuple(
+    [face + suffix for face in MOVE_FACES for suffix in ("", "'", "2")]
+    + [face + "w" + suffix for face in WIDE_FACES for suffix in ("", "'", "2")]
+    + [axis + suffix for axis in ROTATIONS for suffix in ("", "'", "2")]
+)
+MOVE_IDS = {name: idx for idx, name in enumerate(MOVE_NAMES)}
+# (kind, face, clockwise, turns) per move id, as Cube.do_move executes it.
+MOVE_SPECS = tuple(
+    (
+        "rotation" if name[0] in ROTATIONS else ("wide" if "w" in name else "face"),
+        name[0],
+        not name.endswith("'"),
+        2 if name.endswith("2") else 1,
+    )
+    for name in MOVE_NAMES
+)
+
+
+def move_id(move):
+    if isinstance(move, (int, np.integer)):
+        return int(move)
+    move_idx = MOVE_IDS.get(move)
+    if move_idx is None:
+        move_idx = MOVE_IDS[parse_move(move)]
+    return move_idx
+
+
+@functools.lru_cache(maxsize=ALG_CACHE_SIZE)
+def _compile_alg_string(alg):
+    return tuple(move_id(move) for move in alg.split())
+
+
+def compile_alg(alg):
+    """
+    Move ids for an alg given as a move string or an already compiled
+    sequence. Strings are parsed once and kept in a bounded LRU cache.
+    """
+    if isinstance(alg, str):
+        return _compile_alg_string(alg)
+    return tuple(move_id(move) for move in alg)
+
+
+def alg_string(alg):
+    if isinstance(alg, str):
+        return alg
+    return " ".join(MOVE_NAMES[move_id(move)] for move in alg)
+
+
+# frames.py
+
+# A frame records which physical face each face letter currently names, so a
+# whole-cube rotation only relabels later moves instead of moving pieces. The
+# 24 frames are numbered in FRAMES (identity first), each a tuple of physical
+# faces in FRAME_FACES order.
+FRAME_FACES = "UDLRFB"
+IDENTITY_FRAME = 0
+# rotation axis -> face position -> face that moves into it
+_ROTATION_SOURCES = {
+    "x": {"U": "F", "F": "D", "D": "B", "B": "U"},
+    "y": {"F": "R", "R": "B", "B": "L", "L": "F"},
+    "z": {"U": "L", "L": "D", "D": "R", "R": "U"},
+}
+# slice -> the face it turns along with, and back
+SLICE_REFERENCE = {"M": "L", "E": "D", "S": "F"}
+FACE_SLICE = {"L": "M", "R": "M", "D": "E", "U": "E", "F": "S", "B": "S"}
+_INVERSE_SUFFIX = {"": "'", "'": "", "2": "2"}
+OPPOSITE_FACES = {"U": "D", "D": "U", "L": "R", "R": "L", "F": "B", "B": "F"}
+# wide face -> (rotation axis, whether it turns the same way as the face)
+WIDE_ROTATIONS = {
+    "R": ("x", True), "L": ("x", False),
+    "U": ("y", True), "D": ("y", False),
+    "F": ("z", True), "B": ("z", False),
+}
+
+
+def _rotate_frame(frame, rotation):
+    faces = dict(zip(FRAME_FACES, frame))
+    sources = _ROTATION_SOURCES[rotation[0]]
+    for _ in range({"": 1, "2": 2, "'": 3}[rotation[1:]]):
+        faces = {face: faces[sources.get(face, face)] for face in FRAME_FACES}
+    return tuple(faces[face] for face in FRAME_FACES)
+
+
+def _frame_move_name(frame, name):
+    """Physical move made by ``name`` when face letters follow ``frame``."""
+    face, suffix = name[0], name[1:]
+    if face in ROTATIONS:
+        return name
+    faces = dict(zip(FRAME_FACES, frame))
+    if face not in SLICE_REFERENCE:
+        return faces[face] + suffix
+    physical = faces[SLICE_REFERENCE[face]]
+    slice_face = FACE_SLICE[physical]
+    if SLICE_REFERENCE[slice_face] != physical:
+        suffix = _INVERSE_SUFFIX[suffix]
+    return slice_face + suffix
+
+
+def _build_frames():
+    """Frames in breadth-first order with a shortest rotation sequence each."""
+    rotation_ids = [MOVE_IDS[name] for name in MOVE_NAMES if name[0] in ROTATIONS]
+    frames = [tuple(FRAME_FACES)]
+    realizations = {frames[0]: ()}
+    for frame in frames:
+        for move in rotation_ids:
+            after = _rotate_frame(frame, MOVE_NAMES[move])
+            if after not in realizations:
+                realizations[after] = realizations[frame] + (move,)
+                frames.append(after)
+    return frames, [realizations[frame] for frame in frames]
+
+
+FRAMES, FRAME_ROTATIONS = _build_frames()
+FRAME_IDS = {frame: idx for idx, frame in enumerate(FRAMES)}
+ROTATION_MOVE_IDS = frozenset(
+    idx for idx, name in enumerate(MOVE_NAMES) if name[0] in ROTATIONS
+)
+# frame id -> move id -> frame id after the move
+FRAME_AFTER = tuple(
+    tuple(
+        FRAME_IDS[_rotate_frame(frame, name)] if name[0] in ROTATIONS else frame_id
+        for name in MOVE_NAMES
+    )
+    for frame_id, frame in enumerate(FRAMES)
+)
+# frame id -> move id -> physical move id (rotations map to themselves)
+FRAME_MOVES = tuple(
+    tuple(MOVE_IDS[_frame_move_name(frame, name)] for name in MOVE_NAMES)
+    for frame in FRAMES
+)
+# frame id -> physical face -> face letter naming it in that frame
+FRAME_FACE_NAMES = tuple(
+    dict(zip(frame, FRAME_FACES)) for frame in FRAMES
+)
+
+
 # cube.py
 
 FACES = {
@@ -47,84 +233,226 @@ FACES = {
     "D": {"axis": 1, "pos": 0}
 }
 
+SLICE_POSITIONS = {
+    face: [pos for pos in np.ndindex(3, 3, 3) if pos[spec["axis"]] == spec["pos"]]
+    for face, spec in FACES.items()
+}
+# piece type -> home positions in loopcube order
+PIECE_POSITIONS = {
+    "corner": [pos for pos in np.ndindex(3, 3, 3) if 1 not in pos],
+    "edge": [pos for pos in np.ndindex(3, 3, 3) if pos.count(1) == 1],
+    "center": [pos for pos in np.ndindex(3, 3, 3) if pos.count(1) == 2],
+}
+ALL_POSITIONS = list(np.ndindex(3, 3, 3))
+SOLVED_SIDES = {pos: Piece(*pos).sides for pos in ALL_POSITIONS}
+SOLVED_PIECE_INDEX = {piece_key(sides): pos for pos, sides in SOLVED_SIDES.items()}
+
+
+def normalize_piece_types(types=None):
+    """
+    Normalize a ``piece_types`` argument (``None`` for all, one name or an
+    iterable of names; plurals such as "edges" are accepted).
+    """
+    if types is None:
+        return tuple(PIECE_POSITIONS)
+    if isinstance(types, str):
+        types = (types,)
+    normalized = []
+    for name in types:
+        name = name[:-1] if name.endswith("s") else name
+        if name not in PIECE_POSITIONS:
+            raise ValueError(f"Unknown piece type {name!r}.")
+        normalized.append(name)
+    return tuple(normalized)
+
+
+@functools.lru_cache(maxsize=None)
+def _orbit_layer_turns(orbits):
+    """
+    ``(face, clockwise) -> (pairs, axis1, axis2)`` for quarter layer turns:
+    ``(destination, source)`` positions of the moving pieces of ``orbits``
+    and the two axes whose stickers swap.
+    """
+    tracked = {pos for piece_type in orbits for pos in PIECE_POSITIONS[piece_type]}
+    turns = {}
+    for face, spec in FACES.items():
+        index = [slice(None), slice(None), slice(None)]
+        index[spec["axis"]] = spec["pos"]
+        index = tuple(index)
+        for clockwise in (True, False):
+            k = 1 if clockwise else -1
+            k = -k if face in {"U", "L", "F", "S", "M"} else k
+            sources = np.empty((3, 3, 3), dtype=object)
+            for pos in ALL_POSITIONS:
+                sources[pos] = pos
+            sources[index] = np.rot90(sources[index], k)
+            pairs = tuple(
+                (pos, sources[pos]) for pos in SLICE_POSITIONS[face]
+                if pos in tracked and sources[pos] != pos
+            )
+            turns[face, clockwise] = (pairs, *sorted({0, 1, 2} - {spec["axis"]}))
+    return turns
+
+
 class Cube():
-    def __init__(self):
+    """
+    3x3x3 array of ``Piece`` objects. ``orbits`` limits which piece types
+    ("corner", "edge", "center"; default all) turns keep up to date; the
+    orientation and index of other pieces go stale.
+    """
+
+    def __init__(self, orbits=None):
+        self.orbits = frozenset(normalize_piece_types(orbits))
+        self._layer_turns = _orbit_layer_turns(self.orbits)
         self.cube = np.ndarray((3, 3, 3), dtype=Piece)
         for x in range(3):
             for y in range(3):
                 for z in range(3):
                     self.cube[x, y, z] = Piece(x, y, z)
 
-        self.solved = np.copy(self.cube)
         self.scramble = ""
+        self.index_pieces()
+
+    @property
+    def cube(self):
+        # Rotations are only tracked in self.frame until the pieces are read.
+        if self.frame != IDENTITY_FRAME:
+            self.apply_frame()
+        return self._cube
+
+    @cube.setter
+    def cube(self, cube):
+        self._cube = cube
+        self.frame = IDENTITY_FRAME
+
+    def index_pieces(self):
+        # piece key -> coordinates, kept current by every turn
+        self.piece_index = {
+            piece.key: pos for pos, piece in zip(ALL_POSITIONS, self._cube.flat)
+        }
+        return
+
+    def apply_frame(self):
+        """Physically perform the rotations recorded in ``self.frame``."""
+        rotations = FRAME_ROTATIONS[self.frame]
+        self.frame = IDENTITY_FRAME
+        for move in rotations:
+            _, axis, clockwise, turns = MOVE_SPECS[move]
+            for _ in range(turns):
+                self.rotate_pieces(axis, clockwise)
+        return
+
+    def rotate_pieces(self, axis, clockwise=True):
+        # all three layers at once, turning like R (x), U (y) or F (z)
+        face = {"x": "R", "y": "U", "z": "F"}[axis]
+        k = 1 if clockwise else -1
+        k = -k if face in {"U", "F"} else k
+        layer_axes = tuple(sorted({0, 1, 2} - {FACES[face]["axis"]}))
+        self._cube = np.rot90(self._cube, k, axes=layer_axes).copy()
+        for piece_type in self.orbits:
+            for pos in PIECE_POSITIONS[piece_type]:
+                self._cube[pos].swap_stickers(*layer_axes)
+        self.index_pieces()
+        return
 
     def reset_cube_to_solved(self):
-        self.cube = self.solved
+        # Turns mutate the Piece objects, so rewrite their sides in place
+        # rather than keeping a second array of (shared) pieces around.
+        self.frame = IDENTITY_FRAME
+        for pos, piece in zip(ALL_POSITIONS, self._cube.flat):
+            piece.sides = list(SOLVED_SIDES[pos])
+        self.piece_index = dict(SOLVED_PIECE_INDEX)
+        return
+
+    def snapshot(self):
+        """Immutable copy of the cube state and scramble, for ``restore``."""
+        return tuple(tuple(piece.sides) for piece in self.cube.flat), self.scramble
+
+    def restore(self, snapshot):
+        """Return to a state taken with ``snapshot``, reusing the pieces."""
+        sides, self.scramble = snapshot
+        self.frame = IDENTITY_FRAME
+        for piece, piece_sides in zip(self._cube.flat, sides):
+            piece.sides = list(piece_sides)
+        self.index_pieces()
         return
 
     def single_turn(self, face, clockwise=True):
-        k = 1 if clockwise else -1
-        k = -k if face in {"U", "L", "F", "S", "M"} else k
-        axis, pos = FACES[face].values()
-        index = [slice(None), slice(None), slice(None)]
-        index[axis] = pos
-        index = tuple(index)
-        self.cube[index] = np.rot90(self.cube[index], k)
-        axis1, axis2 = {0, 1, 2} - {axis}
-        for piece in self.cube[index].flatten():
+        move = FRAME_MOVES[self.frame][MOVE_IDS[face + ("" if clockwise else "'")]]
+        _, face, clockwise, _ = MOVE_SPECS[move]
+        # only pieces of the tracked orbits are moved
+        pairs, axis1, axis2 = self._layer_turns[face, clockwise]
+        cube = self._cube
+        moved = [cube[source] for _, source in pairs]
+        for (target, _), piece in zip(pairs, moved):
+            cube[target] = piece
             piece.swap_stickers(axis1, axis2)
+            self.piece_index[piece.key] = target
         return
 
     def wide_turn(self, face, clockwise=True):
-        sliceclockwise = clockwise
-        if face in {"R", "U", "B"}:
-            sliceclockwise = not clockwise
-        if face in {"L", "R"}:
-            sliceface = "M"
-        elif face in {"U", "D"}:
-            sliceface = "E"
-        elif face in {"F", "B"}:
-            sliceface = "S"
-        self.single_turn(face, clockwise)
-        self.single_turn(sliceface, sliceclockwise)
+        # Rw = L x: turn the opposite face and leave the rest to the frame
+        axis, same_direction = WIDE_ROTATIONS[face]
+        self.single_turn(OPPOSITE_FACES[face], clockwise)
+        self.rotation(axis, clockwise == same_direction)
         return
 
     def rotation(self, rotation, clockwise=True):
-        axis = rotation[0]
-        if axis == "x":
-            moves = ["R", "M'", "L'"]
-        elif axis == "y":
-            moves = ["U", "E'", "D'"]
-        elif axis == "z":
-            moves = ["F", "S", "B'"]
-        
-        if not clockwise:
-            [[self.do_move(move) for move in moves] for i in range(3)]
-        else:
-            [self.do_move(move) for move in moves]
+        # relabel the faces; pieces only move once they are read
+        move = MOVE_IDS[rotation[0] + ("" if clockwise else "'")]
+        self.frame = FRAME_AFTER[self.frame][move]
         return
 
     def do_move(self, move):
-        if move[0] in "urfbld":
-            move = move[0].upper() + "w" + move[1:]
-            self.do_move(move)
-            # print(move)
-            return
-            
-        clockwise = False if "'" in move else True
-        face = move[0]
-        turn = lambda x: self.single_turn(face, clockwise)
-        if "x" in move or "y" in move or "z" in move:
-            turn = lambda x: self.rotation(face, clockwise)
-        if "w" in move:
-            turn = lambda x: self.wide_turn(face, clockwise)
-        if "2" in move:
-            turn(face)
-            turn(face)
+        kind, face, clockwise, turns = MOVE_SPECS[move_id(move)]
+        if kind == "rotation":
+            turn = self.rotation
+        elif kind == "wide":
+            turn = self.wide_turn
         else:
-            turn(face)
+            turn = self.single_turn
+        for _ in range(turns):
+            turn(face, clockwise)
+        return
+
+
+    def piece_sides(self, pos):
+        return list(self.cube[pos].sides)
+
+    def set_piece_sides(self, pos, sides):
+        self.cube[pos].sides = list(sides)
+        self.piece_index[self.cube[pos].key] = pos
         return
 
+    def piece_name(self, pos, axis=1):
+        return self.cube[pos].get_name(axis=axis)
+
+    def locate_piece(self, name):
+        if self.frame != IDENTITY_FRAME:
+            self.apply_frame()
+        return self.piece_index[piece_key(name)]
+
+    def _tracked_piece_types(self, piece_types):
+        if piece_types is None:
+            return tuple(self.orbits)
+        piece_types = normalize_piece_types(piece_types)
+        untracked = sorted(set(piece_types) - self.orbits)
+        if untracked:
+            raise ValueError(f"Piece types {untracked} are not tracked by this cube.")
+        return piece_types
+
+    def is_solved(self, piece_types=None):
+        """
+        Whether every piece of ``piece_types`` ("corner", "edge", "center";
+        default the tracked orbits) is home and oriented, stopping at the
+        first one that isn't. Asking about an untracked type raises
+        ``ValueError``, as its pieces are not kept up to date.
+        """
+        for piece_type in self._tracked_piece_types(piece_types):
+            for pos in PIECE_POSITIONS[piece_type]:
+                if self.cube[pos].sides != SOLVED_SIDES[pos]:
+                    return False
+        return True
 
     def get_coords(self, p):
         d = {FACES[x]['axis']: FACES[x]['pos'] for x in p}
@@ -168,17 +496,73 @@ class Cube():
 
 
     def scramble_from_string(self, scram):
-        self.scramble = scram
-        moves = scram.split(" ")
-        for move in moves:
+        self.scramble = alg_string(scram)
+        for move in compile_alg(scram):
             self.do_move(move)
         return
     
 # tracer.py
 
+@functools.lru_cache(maxsize=None)
+def coords_from_name(name):
+    coords = [1, 1, 1]
+    for side in name:
+        if side == "F":
+            coords[2] = 0
+        elif side == "B":
+            coords[2] = 2
+        elif side == "U":
+            coords[1] = 2
+        elif side == "D":
+            coords[1] = 0
+        elif side == "R":
+            coords[0] = 2
+        elif side == "L":
+            coords[0] = 0
+    return tuple(coords)
+
+
+def corner_twist(from_sticker, to_sticker, piece):
+    """
+    Twist direction (1 or -1) of a corner whose ``from_sticker`` face colour
+    now shows ``to_sticker``; ``piece`` is the corner's set of faces.
+    """
+    if to_sticker in {"R", "L"} and from_sticker in {"U", "D"}:
+        ori = 1
+    elif to_sticker in {"F", "B"} and from_sticker in {"U", "D"}:
+        ori = -1
+    elif to_sticker in {"U", "D"} and from_sticker in {"F", "B"}:
+        ori = 1
+    elif to_sticker in {"R", "L"} and from_sticker in {"F", "B"}:
+        ori = -1
+    elif to_sticker in {"U", "D"} and from_sticker in {"R", "L"}:
+        ori = 1
+    elif to_sticker in {"F", "B"} and from_sticker in {"R", "L"}:
+        ori = -1
+
+    if piece in [{"U", "F", "R"}, {"U", "B", "L"}, {"D", "B", "R"}, {"D", "F", "L"}]:
+        ori = -ori
+    return ori
+
+
+# face a center sits on -> rotation bringing it to U (first) or, for the F
+# center once U is up, to F
+CENTER_FACES = {coords_from_name(face): face for face in FRAME_FACES}
+U_CENTER_ROTATIONS = {"U": None, "D": "z2", "F": "x", "B": "x'", "L": "z", "R": "z'"}
+F_CENTER_ROTATIONS = {"F": None, "B": "y2", "R": "y", "L": "y'"}
+
+
 class Tracer(Cube):
     def __init__(self, buffers, trace="both"):
-        super().__init__()
+        self.trace_corners = True if trace in {"corner", "corners", "both"} else False
+        self.trace_edges = True if trace in {"edge", "edges", "both"} else False
+        # centers are needed to rotate into orientation
+        orbits = ["center"]
+        if self.trace_corners:
+            orbits.append("corner")
+        if self.trace_edges:
+            orbits.append("edge")
+        super().__init__(orbits=orbits)
         self.tracing = {"edge": [], "corner": []}
         self.buffers = buffers
         self.loopcube = []
@@ -186,69 +570,44 @@ class Tracer(Cube):
             for y in range(3):
                 for z in range(3):
                     self.loopcube.append((x, y, z))
-    
-        self.trace_corners = True if trace in {"corners", "both"} else False
-        self.trace_edges = True if trace in {"edges", "both"} else False
+
+    def reset(self):
+        """Solved cube, empty scramble and tracing, so one tracer can be reused."""
+        self.reset_cube_to_solved()
+        self.scramble = ""
+        self.tracing = {"edge": [], "corner": []}
+        return
 
     def find_piece(self, piecename):
-        piecename = set(piecename)
-        piece = [pos for pos in self.loopcube
-                 if set(self.cube[pos].get_name()) == piecename][0]
-        return piece
+        return self.locate_piece(piecename)
 
     def rotate_into_orientation(self):
+        # Both rotations only relabel the frame, so the F center's face is
+        # looked up through it rather than by moving pieces in between.
         rotations = []
-        u_center = self.find_piece("U")
-        direction = max(set(u_center) - {1})
-        axis = u_center.index(direction)
-        if axis == 2:
-            rotation = "x" if direction == 0 else "x'"
-        elif axis == 0:
-            rotation = "z" if direction == 0 else "z'"
-        elif axis == 1:
-            rotation = "z2" if direction == 0 else None
-      
+        u_face = CENTER_FACES[self.find_piece("U")]
+        f_face = CENTER_FACES[self.find_piece("F")]
+        rotation = U_CENTER_ROTATIONS[u_face]
         if rotation:
             self.do_move(rotation)
             rotations.append(rotation)
 
-        f_center = self.find_piece("F")
-        direction = max(set(f_center) - {1})
-        axis = f_center.index(direction)
-        if axis == 2:
-            rotation = None if direction == 0 else "y2"
-        elif axis == 0:
-            rotation = "y" if direction == 2 else "y'"
-
+        rotation = F_CENTER_ROTATIONS[FRAME_FACE_NAMES[self.frame][f_face]]
         if rotation:
             self.do_move(rotation)
             rotations.append(rotation)
-         
+
         self.tracing["rotation"] = rotations
 
         return
     
     def coords_from_name(self, name):
-        coords = [1, 1, 1]
-        for side in name:
-            if side == "F":
-                coords[2] = 0
-            elif side == "B":
-                coords[2] = 2
-            elif side == "U":
-                coords[1] = 2
-            elif side == "D":
-                coords[1] = 0
-            elif side == "R":
-                coords[0] = 2
-            elif side == "L":
-                coords[0] = 0
-        return tuple(coords)   
+        return coords_from_name(name)
     
     def where_to(self, a):
         axis = FACES[a[0]]["axis"]
         piece = self.coords_from_name(a)
-        return self.cube[piece].get_name(axis=axis)
+        return self.piece_name(piece, axis=axis)
     
     def set_buffer(self, target):
         self.buffer = target
@@ -256,12 +615,11 @@ class Tracer(Cube):
     
     def trace_from_target(self, target, targets=None):
         targets = targets if targets else []
+        buffer = set(self.buffer)
         to = self.where_to(target)
-        if set(list(to)) == set(list(self.buffer)):
-            return
-        else:
+        while set(to) != buffer:
             targets.append(to)
-            self.trace_from_target(to, targets)
+            to = self.where_to(to)
         return targets
     
     def absolute_target(self, target):
@@ -272,7 +630,7 @@ class Tracer(Cube):
         for piece in self.loopcube:
             x, y, z = piece
             name = Piece(x, y, z).get_name()
-            to_name = self.cube[piece].get_name()
+            to_name = self.piece_name(piece)
             if 1 in piece \
             and set(list(name)) == set(list(to_name)) \
             and name != to_name:
@@ -284,30 +642,11 @@ class Tracer(Cube):
         for piece in self.loopcube:
             x, y, z = piece
             name = Piece(x, y, z).get_name()
-            to_name = self.cube[piece].get_name()
+            to_name = self.piece_name(piece)
             if 1 not in piece \
             and set(list(name)) == set(list(to_name)) \
             and name != to_name:
-                abs_target = set(list(name))
-                from_sticker = name[0]
-                to_sticker = to_name[0]
-                
-                if to_sticker in {"R", "L"} and from_sticker in {"U", "D"}:
-                    ori = 1
-                elif to_sticker in {"F", "B"} and from_sticker in {"U", "D"}:
-                    ori = -1
-                elif to_sticker in {"U", "D"} and from_sticker in {"F", "B"}:
-                    ori = 1
-                elif to_sticker in {"R", "L"} and from_sticker in {"F", "B"}:
-                    ori = -1
-                elif to_sticker in {"U", "D"} and from_sticker in {"R", "L"}:
-                    ori = 1
-                elif to_sticker in {"F", "B"} and from_sticker in {"R", "L"}:
-                    ori = -1
-
-                if abs_target in [{"U", "F", "R"}, {"U", "B", "L"}, {"D", "B", "R"}, {"D", "F", "L"}]:
-                    ori = -ori        
-                    
+                ori = corner_twist(name[0], to_name[0], set(name))
                 twists.append({"location": name, "orientation": ori})
         return twists
                 
@@ -317,42 +656,23 @@ class Tracer(Cube):
 
     def corner_cycle_ori(self, targets):
         last_target = self.where_to(targets[-1])
-        abs_target = set(list(last_target))
-        last_sticker = last_target[0]
-        buffer_sticker = self.buffer[0]
         if last_target == self.buffer:
             return 0
-        if last_sticker in {"R", "L"} and buffer_sticker in {"U", "D"}:
-            ori = 1
-        elif last_sticker in {"F", "B"} and buffer_sticker in {"U", "D"}:
-            ori = -1
-        elif last_sticker in {"U", "D"} and buffer_sticker in {"F", "B"}:
-            ori = 1
-        elif last_sticker in {"R", "L"} and buffer_sticker in {"F", "B"}:
-            ori = -1
-        elif last_sticker in {"U", "D"} and buffer_sticker in {"R", "L"}:
-            ori = 1
-        elif last_sticker in {"F", "B"} and buffer_sticker in {"R", "L"}:
-            ori = -1
-            
-        if abs_target in [{"U", "F", "R"}, {"U", "B", "L"}, {"D", "B", "R"}, {"D", "F", "L"}]:
-            ori = -ori
-    
-        return ori
+        return corner_twist(self.buffer[0], last_target[0], set(last_target))
     
     def cycle_parity(self, targets):
         return 1 if len(targets) % 2 else 0
    
 
     def trace_all(self, piecetype, buffers):
-        solved = []
+        solved = set()
         for buffer in buffers:
-            if self.absolute_target(buffer) in [self.absolute_target(x) for x in solved]:
+            if piece_key(buffer) in solved:
                 continue
             self.set_buffer(buffer)
             targets = self.trace_from_target(buffer)
             if targets:
-                [solved.append(target) for target in targets]
+                solved.update(piece_key(target) for target in targets)
                 parity = self.cycle_parity(targets)
                 ori = self.edge_cycle_ori(targets) if piecetype == "edge" else self.corner_cycle_ori(targets)
                 self.tracing[piecetype].append({"type": "cycle", "buffer": buffer, "targets": targets, "orientation": ori, "parity": parity})
@@ -379,16 +699,19 @@ class Tracer(Cube):
     def manual_swap(self, e1, e2):
         # CURRENTLY ONLY SUPPORTS PSEUDOSWAPS PRESERVING F/B EO
         coords1, coords2 = self.coords_from_name(e1), self.coords_from_name(e2)
-        slice1, slice2 = self.cube[coords1].sides.index(''), self.cube[coords2].sides.index('')
+        sides1, sides2 = self.piece_sides(coords1), self.piece_sides(coords2)
+        slice1, slice2 = sides1.index(''), sides2.index('')
         non_slice1, non_slice2 = sorted(list({0, 1, 2} - {slice1})), sorted(list({0, 1, 2} - {slice2}))
-        piece1, piece2 = [f for f in self.cube[coords1].sides if f], [f for f in self.cube[coords2].sides if f]
+        piece1, piece2 = [f for f in sides1 if f], [f for f in sides2 if f]
         # idk why you have to do this but it works
         if sorted([slice1, slice2]) == [0, 1] or sorted([slice1, slice2]) == [0, 2]:
             piece2 = reversed(piece2)
             piece1 = reversed(piece1)
 
-        self.cube[coords1].sides[non_slice1[0]], self.cube[coords1].sides[non_slice1[1]] = piece2
-        self.cube[coords2].sides[non_slice2[0]], self.cube[coords2].sides[non_slice2[1]] = piece1
+        sides1[non_slice1[0]], sides1[non_slice1[1]] = piece2
+        sides2[non_slice2[0]], sides2[non_slice2[1]] = piece1
+        self.set_piece_sides(coords1, sides1)
+        self.set_piece_sides(coords2, sides2)
         return
 
     def sort_tracing(self):
@@ -403,4 +726,314 @@ class Tracer(Cube):
         if self.trace_edges:
             self.trace_all("edge", self.buffers["edge"])
         self.sort_tracing()
-        return
\ No newline at end of file
+        return
+
+# facelet_cube.py
+
+AXIS_FACES = ({0: "L", 2: "R"}, {0: "D", 2: "U"}, {0: "F", 2: "B"})
+
+
+def _facelet_layout():
+    facelets = []
+    for x in range(3):
+        for y in range(3):
+            for z in range(3):
+                for axis, coord in enumerate((x, y, z)):
+                    if coord != 1:
+                        facelets.append(((x, y, z), axis))
+    return facelets
+
+
+# Every sticker is a facelet (piece position, axis); ids follow loopcube order.
+FACELETS = _facelet_layout()
+FACELET_INDEX = {facelet: idx for idx, facelet in enumerate(FACELETS)}
+FACELET_COLORS = [AXIS_FACES[axis][pos[axis]] for pos, axis in FACELETS]
+POSITION_FACELETS = {}
+for _idx, (_pos, _axis) in enumerate(FACELETS):
+    POSITION_FACELETS.setdefault(_pos, [None, None, None])[_axis] = _idx
+# piece key -> one home facelet of that piece, for locating pieces
+PIECE_KEY_FACELETS = {
+    piece_key(FACELET_COLORS[idx] for idx in slots if idx is not None):
+        next(idx for idx in slots if idx is not None)
+    for slots in POSITION_FACELETS.values()
+}
+# (pos, axis, facelet ids at pos) -> piece name, filled on first use
+_PIECE_NAMES = {}
+# sticker name of every facelet, e.g. "RUF" for the R facelet of UFR
+FACELET_NAMES = [piece_name(Piece(*pos).sides, axis) for pos, axis in FACELETS]
+# facelet read by piece_name(pos) with the default axis
+PRIMARY_FACELETS = {
+    pos: slots[1] if slots[1] is not None else slots[2]
+    for pos, slots in POSITION_FACELETS.items()
+}
+# piece type -> facelet ids of those pieces, for is_solved
+PIECE_FACELETS = {
+    piece_type: np.array(
+        [idx for pos in positions for idx in POSITION_FACELETS[pos] if idx is not None],
+        dtype=np.intp,
+    )
+    for piece_type, positions in PIECE_POSITIONS.items()
+}
+
+
+@functools.lru_cache(maxsize=None)
+def sticker_facelet(name):
+    """Facelet id of the sticker called ``name`` (first letter = its face)."""
+    return FACELET_INDEX[(coords_from_name(name), FACES[name[0]]["axis"])]
+
+
+def _labeled_move_permutation(move):
+    cube = Cube()
+    for pos in np.ndindex(3, 3, 3):
+        cube.cube[pos].sides = POSITION_FACELETS.get(pos, [None, None, None]).copy()
+    cube.do_move(move)
+    perm = np.empty(len(FACELETS), dtype=np.intp)
+    for idx, (pos, axis) in enumerate(FACELETS):
+        perm[idx] = cube.cube[pos].sides[axis]
+    return perm
+
+
+# new_facelets = facelets[MOVE_PERMUTATIONS[move_id]], generated by replaying
+# each move once on a Cube whose stickers carry facelet ids.
+MOVE_PERMUTATIONS = np.array([_labeled_move_permutation(name) for name in MOVE_NAMES])
+SOLVED_FACELETS = np.arange(len(FACELETS), dtype=np.intp)
+# frame id -> net permutation of the rotations that realize it
+FRAME_PERMUTATIONS = np.array([
+    functools.reduce(lambda perm, move: perm[MOVE_PERMUTATIONS[move]], rotations, SOLVED_FACELETS)
+    for rotations in FRAME_ROTATIONS
+])
+# frame id -> move id -> permutation of the physical move (plain lists, as
+# one Python index is cheaper than a NumPy one per move)
+FRAME_MOVE_PERMUTATIONS = [[MOVE_PERMUTATIONS[move] for move in moves] for moves in FRAME_MOVES]
+
+
+@functools.lru_cache(maxsize=None)
+def _orbit_tables(orbits):
+    """
+    ``(tracked facelets, move permutations, frame permutations, solved state)``
+    for a FaceletCube storing only the facelets of ``orbits``. Permutations
+    never mix piece types, so each one restricts to the tracked facelets.
+    """
+    if orbits == frozenset(PIECE_POSITIONS):
+        return None, FRAME_MOVE_PERMUTATIONS, FRAME_PERMUTATIONS, SOLVED_FACELETS
+    tracked = np.sort(np.concatenate([PIECE_FACELETS[piece_type] for piece_type in orbits]))
+    compact = np.full(len(FACELETS), -1, dtype=np.intp)
+    compact[tracked] = np.arange(len(tracked))
+
+    def restrict(perm):
+        return compact[perm[tracked]]
+
+    return (
+        tracked,
+        [[restrict(perm) for perm in row] for row in FRAME_MOVE_PERMUTATIONS],
+        [restrict(perm) for perm in FRAME_PERMUTATIONS],
+        tracked.copy(),
+    )
+
+
+class FaceletCube(Cube):
+    """
+    Cube held as a 54-entry integer array: ``facelets[i]`` is the facelet id of
+    the sticker currently in slot ``i``. Every move is one precomputed
+    permutation, so a turn is a single index operation; whole-cube rotations
+    only change ``frame`` until the state is read.
+
+    With ``orbits`` only the facelets of those piece types are stored and
+    permuted; the others read as solved, though ``is_solved`` refuses to
+    answer for them, as ``Cube`` does.
+    """
+
+    def __init__(self, orbits=None):
+        self.orbits = frozenset(normalize_piece_types(orbits))
+        (
+            self._tracked,
+            self._move_permutations,
+            self._frame_permutations,
+            self._solved,
+        ) = _orbit_tables(self.orbits)
+        self._expanded = self._expanded_from = None
+        self.facelets = SOLVED_FACELETS.copy()
+        self.scramble = ""
+        self._where = None
+
+    @property
+    def facelets(self):
+        # Rotations are only tracked in self.frame until the state is read.
+        if self.frame != IDENTITY_FRAME:
+            self.apply_frame()
+        if self._tracked is None:
+            return self._facelets
+        if self._expanded_from is not self._facelets:
+            self._expanded = SOLVED_FACELETS.copy()
+            self._expanded[self._tracked] = self._facelets
+            self._expanded_from = self._facelets
+        return self._expanded
+
+    @facelets.setter
+    def facelets(self, facelets):
+        self._facelets = facelets if self._tracked is None else facelets[self._tracked]
+        self.frame = IDENTITY_FRAME
+
+    def apply_frame(self):
+        self._facelets = self._facelets[self._frame_permutations[self.frame]]
+        self.frame = IDENTITY_FRAME
+        self._where = None
+        return
+
+    def reset_cube_to_solved(self):
+        self.facelets = SOLVED_FACELETS.copy()
+        self._where = None
+        return
+
+    def snapshot(self):
+        return self.facelets.copy(), self.scramble
+
+    def restore(self, snapshot):
+        facelets, self.scramble = snapshot
+        # set_piece_sides writes into the array, so never share it
+        self.facelets = facelets.copy()
+        self._where = None
+        return
+
+    def apply_permutation(self, perm):
+        self.facelets = self.facelets[perm]
+        self._where = None
+        return
+
+    def _turn(self, move):
+        self._facelets = self._facelets[self._move_permutations[self.frame][move]]
+        self._where = None
+        return
+
+    def single_turn(self, face, clockwise=True):
+        self._turn(MOVE_IDS[face + ("" if clockwise else "'")])
+        return
+
+    def wide_turn(self, face, clockwise=True):
+        self._turn(MOVE_IDS[face + "w" + ("" if clockwise else "'")])
+        return
+
+    def rotation(self, rotation, clockwise=True):
+        self.frame = FRAME_AFTER[self.frame][MOVE_IDS[rotation[0] + ("" if clockwise else "'")]]
+        return
+
+    def do_move(self, move):
+        move = move_id(move)
+        if move in ROTATION_MOVE_IDS:
+            self.frame = FRAME_AFTER[self.frame][move]
+        else:
+            self._turn(move)
+        return
+
+    def scramble_from_string(self, scram):
+        self.scramble = alg_string(scram)
+        facelets = self._facelets
+        frame = self.frame
+        move_permutations = self._move_permutations
+        for move in compile_alg(scram):
+            if move in ROTATION_MOVE_IDS:
+                frame = FRAME_AFTER[frame][move]
+            else:
+                facelets = facelets[move_permutations[frame][move]]
+        self._facelets = facelets
+        self.frame = frame
+        self._where = None
+        return
+
+    def piece_sides(self, pos):
+        return [
+            "" if idx is None else FACELET_COLORS[self.facelets[idx]]
+            for idx in POSITION_FACELETS.get(pos, (None, None, None))
+        ]
+
+    def set_piece_sides(self, pos, sides):
+        home = self.get_coords([side for side in sides if side])
+        facelets = self.facelets
+        for axis, idx in enumerate(POSITION_FACELETS[pos]):
+            if idx is not None:
+                facelets[idx] = FACELET_INDEX[(home, FACES[sides[axis]]["axis"])]
+        self.facelets = facelets
+        self._where = None
+        return
+
+    def piece_name(self, pos, axis=1):
+        key = (pos, axis, tuple(
+            None if idx is None else int(self.facelets[idx])
+            for idx in POSITION_FACELETS.get(pos, (None, None, None))
+        ))
+        name = _PIECE_NAMES.get(key)
+        if name is None:
+            name = _PIECE_NAMES[key] = piece_name(self.piece_sides(pos), axis)
+        return name
+
+    def is_solved(self, piece_types=None):
+        if piece_types is None:
+            if self.frame != IDENTITY_FRAME:
+                self.apply_frame()
+            return bool((self._facelets == self._solved).all())
+        for piece_type in self._tracked_piece_types(piece_types):
+            idx = PIECE_FACELETS[piece_type]
+            if not (self.facelets[idx] == idx).all():
+                return False
+        return True
+
+    def locate_piece(self, name):
+        # inverse of facelets, rebuilt once after each batch of moves
+        if self._where is None:
+            self._where = np.empty_like(self.facelets)
+            self._where[self.facelets] = SOLVED_FACELETS
+        return FACELETS[self._where[PIECE_KEY_FACELETS[piece_key(name)]]][0]
+
+
+class FaceletTracer(Tracer, FaceletCube):
+    """
+    ``Tracer`` running on the integer facelet engine; tracing output is the
+    same as ``Tracer`` for the same scramble.
+    """
+
+    def trace_all(self, piecetype, buffers):
+        # Target after sticker f is the sticker now sitting on facelet f, so
+        # each cycle is a walk along the facelet array from the buffer.
+        facelets = self.facelets.tolist()
+        tracing = self.tracing[piecetype]
+        solved = set()
+        for buffer in buffers:
+            start = sticker_facelet(buffer)
+            home = FACELETS[start][0]
+            if home in solved:
+                continue
+            targets = []
+            current = facelets[start]
+            while FACELETS[current][0] != home:
+                targets.append(current)
+                solved.add(FACELETS[current][0])
+                current = facelets[current]
+            if not targets:
+                continue
+            last = FACELET_NAMES[current]
+            if last == buffer:
+                ori = 0
+            elif piecetype == "edge":
+                ori = 1
+            else:
+                ori = corner_twist(buffer[0], last[0], set(last))
+            tracing.append({
+                "type": "cycle",
+                "buffer": buffer,
+                "targets": [FACELET_NAMES[target] for target in targets],
+                "orientation": ori,
+                "parity": len(targets) % 2,
+            })
+
+        for pos in PIECE_POSITIONS[piecetype]:
+            ref = PRIMARY_FACELETS[pos]
+            current = facelets[ref]
+            if current == ref or FACELETS[current][0] != pos:
+                continue
+            name = FACELET_NAMES[ref]
+            if piecetype == "edge":
+                ori = 1
+            else:
+                ori = corner_twist(name[0], FACELET_NAMES[current][0], set(name))
+            tracing.append({"type": "misoriented", "buffer": name, "targets": [], "orientation": ori, "parity": 0})
+        return
@@ -6,19 +6,31 @@ The workflow mirrors the comm drill generator but adds a structured setup:
 2. Randomly pick four distinct pieces (i, j, k, l).
 3. Build three initial comms (ij, kl, and either jk or jl) using randomly
    selected sticker orientations for each referenced piece.
-4. Apply those comms to the cube state (using tracer helpers). This should
-   leave a 5-cycle involving the buffer; trace it to derive the final two
-   comms needed to return to solved state.
+4. Those comms always leave a 5-cycle involving the buffer, whose trace is
+   derived in closed form from the chosen stickers; it gives the final two
+   comms needed to return to solved state. Simulating the comms on a sticker
+   state is only done as an optional self-check.
 """
 
 import random
 import sys
+import time
 from comm_drill_trainer import (
     CORNER_BUFFER,
     CORNER_LETTER_SCHEME,
     EDGE_BUFFER,
     EDGE_LETTER_SCHEME,
+    _dedup_window,
+    _warn_max_attempts,
 )
+from compiled_scheme import CompiledScheme, _build_scheme_data, compile_scheme
+from generation_stats import active_collector
+
+NOT_ENOUGH_PIECES = "Need at least 4 pieces after the buffer piece."
+
+
+class NotEnoughPiecesError(ValueError):
+    """The scheme leaves too few pieces after the buffer to build a 5-cycle."""
 
 
 def _normalize_forced_pair(forced_pair):
@@ -46,78 +58,10 @@ def _normalize_blocks(source):
         return [block for block in source.split(" ") if block]
     return list(source)
 
-def _build_scheme_data(blocks):
-    if not blocks:
-        raise ValueError("Scheme must provide at least one block.")
-    block_len = len(blocks[0])
-    if block_len == 0:
-        raise ValueError("Blocks cannot be empty.")
-    letter_to_ref_pos = {}
-    for pos, block in enumerate(blocks):
-        if len(block) != block_len:
-            raise ValueError("All blocks must have the same length.")
-        for slot, ch in enumerate(block):
-            if ch in letter_to_ref_pos:
-                raise ValueError(f"Duplicate letter detected: {ch}")
-            letter_to_ref_pos[ch] = (pos, slot)
-    return {
-        "blocks": blocks,
-        "block_len": block_len,
-        "letter_to_ref_pos": letter_to_ref_pos,
-    }
-
-def _solved_state(data):
-    n = len(data["blocks"])
-    return list(range(n)), [0] * n
-
-def _letter_at_slot(data, pieces, oris, pos, slot):
-    blocks = data["blocks"]
-    M = data["block_len"]
-    piece = pieces[pos]
-    o = oris[pos] % M
-    side_idx = (slot - o) % M
-    return blocks[piece][side_idx]
-
-def _find_current_slot(data, pieces, oris, letter):
-    n = len(data["blocks"])
-    M = data["block_len"]
-    for pos in range(n):
-        for slot in range(M):
-            if _letter_at_slot(data, pieces, oris, pos, slot) == letter:
-                return (pos, slot)
-    raise ValueError(f"Letter {letter} not found in current state.")
-
-def _swap_stickers(data, pieces, oris, A, B):
-    M = data["block_len"]
-    posA, slotA = _find_current_slot(data, pieces, oris, A)
-    posB, slotB = _find_current_slot(data, pieces, oris, B)
-    pieceA, oA = pieces[posA], oris[posA] % M
-    pieceB, oB = pieces[posB], oris[posB] % M
-    sideA = (slotA - oA) % M
-    sideB = (slotB - oB) % M
-    new_o_for_posA = (slotA - sideB) % M
-    new_o_for_posB = (slotB - sideA) % M
-    pieces[posA], oris[posA] = pieceB, new_o_for_posA
-    pieces[posB], oris[posB] = pieceA, new_o_for_posB
-
-def _three_cycle(data, pieces, oris, a, b, c):
-    _swap_stickers(data, pieces, oris, b, c)
-    _swap_stickers(data, pieces, oris, a, b)
-
-def _letter_at_home(data, pieces, oris, letter):
-    pos, slot = data["letter_to_ref_pos"][letter]
-    return _letter_at_slot(data, pieces, oris, pos, slot)
-
-def _trace_from_buffer(data, pieces, oris, buffer_letter, max_steps=200):
-    cycle = [buffer_letter]
-    cur = buffer_letter
-    for _ in range(max_steps):
-        nxt = _letter_at_home(data, pieces, oris, cur)
-        cycle.append(nxt)
-        if nxt == buffer_letter:
-            break
-        cur = nxt
-    return cycle
+def _trace_from_buffer(data, state, buffer_letter, max_steps=200):
+    stickers = data["stickers"]
+    trace = state.trace(stickers.intern(buffer_letter), max_steps)
+    return stickers.decode(trace)
 
 def _pieces_after_buffer(blocks, buffer_letter):
     raw_blocks = list(blocks)
@@ -133,17 +77,18 @@ def _pieces_after_buffer(blocks, buffer_letter):
     return trimmed
 
 
-def _validate_forced_pair(blocks, buffer_letter, forced_pair):
+def _validate_forced_pair(scheme, buffer_letter, forced_pair):
+    # ``scheme`` may already be compiled; recompiling its blocks tuple would
+    # miss the cache entry keyed on the caller's original scheme.
     normalized = _normalize_forced_pair(forced_pair)
     if normalized is None:
         return None
     first, second = normalized
     if first == second:
         raise ValueError("Forced pair letters must be distinct.")
-    letter_to_block_idx = {}
-    for idx, block in enumerate(blocks):
-        for letter in block:
-            letter_to_block_idx[letter] = idx
+    if not isinstance(scheme, CompiledScheme):
+        scheme = compile_scheme(scheme, buffer_letter)
+    letter_to_block_idx = scheme.letter_to_block_idx
     missing = [letter for letter in normalized if letter not in letter_to_block_idx]
     if missing:
         raise ValueError(f"Forced pair letters {missing} do not exist in the scheme.")
@@ -175,10 +120,12 @@ def _random_pair(block_a, block_b, buffer_letter, rng):
 
 
 def _apply_comm_sequence(data, comms, buffer_letter):
-    pieces_state, oris_state = _solved_state(data)
+    stickers = data["stickers"]
+    state = stickers.solved_state()
+    buffer_id = stickers.intern(buffer_letter)
     for first, second in comms:
-        _three_cycle(data, pieces_state, oris_state, buffer_letter, first, second)
-    return pieces_state, oris_state
+        state.three_cycle(buffer_id, stickers.intern(first), stickers.intern(second))
+    return state
 
 
 def _is_buffer_five_cycle(trace, buffer_letter):
@@ -190,17 +137,205 @@ def _is_buffer_five_cycle(trace, buffer_letter):
     return len(unique) == 5 and len(set(unique)) == 5
 
 
+def _derive_trace_ids(stickers, b, c, d, e, third_c, third_x, third_on_l):
+    """
+    Closed-form middle of the trace left by the three seeded comms ``bc``,
+    ``de`` and either ``c'd'`` (``third_on_l`` false) or ``c'e'``, where primes
+    are the third comm's stickers on the same pieces. Writing ``x^k`` for the
+    sticker ``k`` steps clockwise from ``x``, with ``c' = c^p`` and
+    ``d' = d^q`` / ``e' = e^q``:
+
+        A-C-D: a -> b -> d^(q-p) -> e^(q-p) -> c^q -> a
+        A-C-E: a -> b -> e^(q-p) -> c^q -> d^q -> a
+
+    All arguments are letter ids; returns the three ids between ``b`` and the
+    closing buffer.
+    """
+    M = stickers.block_len
+    p = (third_c - c) % M
+    q = (third_x - (e if third_on_l else d)) % M
+    twist = stickers.twist
+    if third_on_l:
+        return twist(e, q - p), twist(c, q), twist(d, q)
+    return twist(d, q - p), twist(e, q - p), twist(c, q)
+
+
+def _derive_trace(data, buffer_letter, initial_comms, third_on_l):
+    stickers = data["stickers"]
+    (b, c), (d, e), (third_c, third_x) = (
+        stickers.encode(comm) for comm in initial_comms
+    )
+    middle = _derive_trace_ids(stickers, b, c, d, e, third_c, third_x, third_on_l)
+    return [buffer_letter, stickers.letters[b], *stickers.decode(middle), buffer_letter]
+
+
+def _prepare_five_cycle(scheme, buffer_letter, forced_pair=None):
+    compiled = compile_scheme(
+        CORNER_LETTER_SCHEME if scheme is None else scheme,
+        buffer_letter,
+    )
+    scheme_data = compiled.scheme_data
+    if buffer_letter not in scheme_data["letter_to_ref_pos"]:
+        raise ValueError(f"Buffer letter {buffer_letter} not present in scheme.")
+    normalized_pair = _validate_forced_pair(compiled, buffer_letter, forced_pair)
+    available_pieces = compiled.pieces_after_buffer
+    if not available_pieces:
+        raise ValueError("No pieces remain after trimming with the buffer.")
+    if len(available_pieces) < 4:
+        raise NotEnoughPiecesError(NOT_ENOUGH_PIECES)
+    return {
+        "blocks": compiled.blocks,
+        "scheme_data": scheme_data,
+        "buffer_letter": buffer_letter,
+        "normalized_pair": normalized_pair,
+        "letter_to_block_idx": compiled.letter_to_block_idx,
+        "available_pieces": available_pieces,
+    }
+
+
+def _sample_five_cycle(
+    prepared,
+    rng,
+    randomize_third_orientation=False,
+    verify=False,
+    timings=None,
+):
+    if timings is not None:
+        started = time.perf_counter()
+    blocks = prepared["blocks"]
+    scheme_data = prepared["scheme_data"]
+    buffer_letter = prepared["buffer_letter"]
+    normalized_pair = prepared["normalized_pair"]
+    letter_to_block_idx = prepared["letter_to_block_idx"]
+    available_pieces = prepared["available_pieces"]
+
+    orientation_map = {}
+
+    def record_orientation(piece_a, piece_b, letters):
+        orientation_map[piece_a] = letters[0]
+        orientation_map[piece_b] = letters[1]
+        return tuple(letters)
+
+    if normalized_pair:
+        forced_piece_blocks = [
+            blocks[letter_to_block_idx[letter]] for letter in normalized_pair
+        ]
+        pool = [
+            piece
+            for piece in available_pieces
+            if piece not in forced_piece_blocks
+        ]
+        if len(pool) < 2:
+            raise NotEnoughPiecesError("Not enough additional pieces available for forced pair.")
+        extras = tuple(rng.sample(pool, 2))
+        force_into_first = rng.random() < 0.5
+        if force_into_first:
+            piece_i, piece_j = forced_piece_blocks
+            piece_k, piece_l = extras
+            first_comm = record_orientation(piece_i, piece_j, normalized_pair)
+            second_comm = record_orientation(
+                piece_k,
+                piece_l,
+                _random_pair(piece_k, piece_l, buffer_letter, rng),
+            )
+        else:
+            piece_k, piece_l = forced_piece_blocks
+            piece_i, piece_j = extras
+            first_comm = record_orientation(
+                piece_i,
+                piece_j,
+                _random_pair(piece_i, piece_j, buffer_letter, rng),
+            )
+            second_comm = record_orientation(piece_k, piece_l, normalized_pair)
+        selected_pieces = tuple(forced_piece_blocks + list(extras))
+    else:
+        selected = tuple(rng.sample(available_pieces, 4))
+        piece_i, piece_j, piece_k, piece_l = selected
+        first_comm = record_orientation(
+            piece_i,
+            piece_j,
+            _random_pair(piece_i, piece_j, buffer_letter, rng),
+        )
+        second_comm = record_orientation(
+            piece_k,
+            piece_l,
+            _random_pair(piece_k, piece_l, buffer_letter, rng),
+        )
+        selected_pieces = selected
+
+    jk_or_jl = rng.choice(
+        (
+            (piece_j, piece_k),
+            (piece_j, piece_l),
+        ),
+    )
+    third_piece_a, third_piece_b = jk_or_jl
+    if randomize_third_orientation:
+        third_comm = _random_pair(third_piece_a, third_piece_b, buffer_letter, rng)
+    else:
+        third_comm = (
+            orientation_map[third_piece_a],
+            orientation_map[third_piece_b],
+        )
+
+    initial_comms = [first_comm, second_comm, third_comm]
+    if timings is not None:
+        sampled = time.perf_counter()
+        timings["sampling"] = sampled - started
+    trace = _derive_trace(
+        scheme_data,
+        buffer_letter,
+        initial_comms,
+        third_on_l=third_piece_b == piece_l,
+    )
+    if timings is not None:
+        derived = time.perf_counter()
+        timings["derivation"] = derived - sampled
+
+    if verify:
+        state = _apply_comm_sequence(scheme_data, initial_comms, buffer_letter)
+        simulated = _trace_from_buffer(scheme_data, state, buffer_letter)
+        if simulated != trace or not _is_buffer_five_cycle(simulated, buffer_letter):
+            debug_message = (
+                "Derived trace does not match simulation. "
+                f"pieces={selected_pieces}, comms={initial_comms}, "
+                f"derived={trace}, simulated={simulated}"
+            )
+            print(debug_message, file=sys.stderr)
+            raise RuntimeError(debug_message)
+        if timings is not None:
+            timings["verification"] = time.perf_counter() - derived
+
+    cleanup_pairs = [
+        (trace[4], trace[3]),
+        (trace[2], trace[1]),
+    ]
+
+    full_sequence = tuple(initial_comms + cleanup_pairs)
+    return {
+        "selected_pieces": selected_pieces,
+        "comm_sequence": full_sequence,
+        "trace": tuple(trace),
+    }
+
+
 def basic_five_cycle(
     *,
     buffer_letter=CORNER_BUFFER,
     scheme=None,
     rng=None,
-    max_attempts=1000,
+    max_attempts=None,
     forced_pair=None,
+    randomize_third_orientation=False,
+    verify=False,
+    stats=None,
 ):
     """
     Generate a 5-comm sequence following the specification in the user request.
 
+    The two cleanup comms are derived in closed form from the three seeded
+    comms (see ``_derive_trace_ids``), so generation always succeeds in one pass.
+
     Parameters
     ----------
     buffer_letter : str
@@ -211,8 +346,20 @@ def basic_five_cycle(
         corner scheme.
     rng : random.Random | None
         Optional RNG instance for deterministic testing.
-    max_attempts : int
-        Number of retries allowed to find a valid 5-cycle setup.
+    max_attempts : None
+        Deprecated and ignored, as construction no longer retries; passing
+        it warns.
+    forced_pair : str | tuple[str, str] | None
+        Letter pair that must appear as one of the seeded comms.
+    randomize_third_orientation : bool
+        Pick random stickers for the third comm instead of reusing the
+        orientations from the first two comms. Must stay off for centers.
+    verify : bool
+        Also simulate the three seeded comms and check the derived trace
+        against the simulated one.
+    stats : callable | None
+        Collector receiving one event per call (see ``generation_stats``);
+        defaults to the one installed by ``with GenerationStats()``, if any.
 
     Returns
     -------
@@ -221,130 +368,71 @@ def basic_five_cycle(
 
     Raises
     ------
+    NotEnoughPiecesError
+        If the scheme leaves fewer than four pieces after the buffer, or too
+        few besides the forced pair.
     RuntimeError
-        If the three seeded comms do not yield a buffer-centered 5-cycle.
+        If ``verify`` is set and the simulated trace disagrees with the
+        derived one.
     """
-    rng = rng or random.Random()
-    blocks = _normalize_blocks(scheme)
-    scheme_data = _build_scheme_data(blocks)
-    if buffer_letter not in scheme_data["letter_to_ref_pos"]:
-        raise ValueError(f"Buffer letter {buffer_letter} not present in scheme.")
-    normalized_pair = _validate_forced_pair(blocks, buffer_letter, forced_pair)
-    letter_to_block_idx = {}
-    for idx, block in enumerate(blocks):
-        for letter in block:
-            letter_to_block_idx[letter] = idx
-    available_pieces = _pieces_after_buffer(blocks, buffer_letter)
-    if len(available_pieces) < 4:
-        raise ValueError("Need at least 4 pieces after the buffer piece.")
-
-    last_failure = None
-    attempts = max(1, int(max_attempts))
-
-    for _ in range(attempts):
-        selected_pieces = None
-        orientation_map = {}
-
-        def record_orientation(piece_a, piece_b, letters):
-            orientation_map[piece_a] = letters[0]
-            orientation_map[piece_b] = letters[1]
-            return tuple(letters)
-
-        if normalized_pair:
-            forced_piece_blocks = []
-            for letter in normalized_pair:
-                block_idx = letter_to_block_idx[letter]
-                forced_piece_blocks.append(blocks[block_idx])
-
-            pool = [
-                piece
-                for piece in available_pieces
-                if piece not in forced_piece_blocks
-            ]
-            if len(pool) < 2:
-                last_failure = "Not enough additional pieces available for forced pair."
-                continue
-            extras = tuple(rng.sample(pool, 2))
-            force_into_first = rng.random() < 0.5
-            if force_into_first:
-                piece_i, piece_j = forced_piece_blocks
-                piece_k, piece_l = extras
-                first_comm = record_orientation(piece_i, piece_j, normalized_pair)
-                second_comm = record_orientation(
-                    piece_k,
-                    piece_l,
-                    _random_pair(piece_k, piece_l, buffer_letter, rng),
-                )
-            else:
-                piece_k, piece_l = forced_piece_blocks
-                piece_i, piece_j = extras
-                first_comm = record_orientation(
-                    piece_i,
-                    piece_j,
-                    _random_pair(piece_i, piece_j, buffer_letter, rng),
-                )
-                second_comm = record_orientation(piece_k, piece_l, normalized_pair)
-            selected_pieces = tuple(forced_piece_blocks + list(extras))
-        else:
-            selected = tuple(rng.sample(available_pieces, 4))
-            piece_i, piece_j, piece_k, piece_l = selected
-            first_comm = record_orientation(
-                piece_i,
-                piece_j,
-                _random_pair(piece_i, piece_j, buffer_letter, rng),
-            )
-            second_comm = record_orientation(
-                piece_k,
-                piece_l,
-                _random_pair(piece_k, piece_l, buffer_letter, rng),
-            )
-            selected_pieces = selected
-
-        jk_or_jl = rng.choice(
-            (
-                (piece_j, piece_k),
-                (piece_j, piece_l),
-            ),
+    _warn_max_attempts(max_attempts)
+    stats = stats or active_collector()
+    if stats is None:
+        prepared = _prepare_five_cycle(scheme, buffer_letter, forced_pair)
+        return _sample_five_cycle(
+            prepared,
+            rng or random.Random(),
+            randomize_third_orientation,
+            verify,
         )
-        third_piece_a, third_piece_b = jk_or_jl
-        if randomize_third_orientation:
-            third_comm = _random_pair(third_piece_a, third_piece_b, buffer_letter, rng)
-        else:
-            letter_a = orientation_map.get(third_piece_a)
-            letter_b = orientation_map.get(third_piece_b)
-            if letter_a is not None and letter_b is not None:
-                third_comm = (letter_a, letter_b)
-            else:
-                third_comm = _random_pair(third_piece_a, third_piece_b, buffer_letter, rng)
-        orientation_map[third_piece_a] = third_comm[0]
-        orientation_map[third_piece_b] = third_comm[1]
-
-        initial_comms = [first_comm, second_comm, third_comm]
-
-        pieces_state, oris_state = _apply_comm_sequence(scheme_data, initial_comms, buffer_letter)
-        trace = _trace_from_buffer(scheme_data, pieces_state, oris_state, buffer_letter)
-
-        if not _is_buffer_five_cycle(trace, buffer_letter):
-            last_failure = (
-                f"pieces={selected_pieces}, comms={initial_comms}, trace={trace}"
-            )
-            continue
-
-        cleanup_pairs = [
-            (trace[4], trace[3]),
-            (trace[2], trace[1]),
-        ]
 
-        full_sequence = tuple(initial_comms + cleanup_pairs)
-        return {
-            "selected_pieces": selected_pieces,
-            "comm_sequence": full_sequence,
-            "trace": tuple(trace),
-        }
-
-    debug_message = "Failed to leave a 5-cycle. " + (last_failure or "No attempts run.")
-    print(debug_message, file=sys.stderr)
-    raise RuntimeError(debug_message)
+    event = {
+        "scheme": _stats_scheme(scheme),
+        "buffer_letter": buffer_letter,
+        "forced_pair": _stats_forced_pair(forced_pair),
+        "attempts": 1,
+    }
+    timings = {}
+    rejection = None
+    started = time.perf_counter()
+    try:
+        try:
+            prepared = _prepare_five_cycle(scheme, buffer_letter, forced_pair)
+        finally:
+            timings["prepare"] = time.perf_counter() - started
+        return _sample_five_cycle(
+            prepared,
+            rng or random.Random(),
+            randomize_third_orientation,
+            verify,
+            timings,
+        )
+    except RuntimeError:
+        rejection = "trace_mismatch"
+        raise
+    except NotEnoughPiecesError:
+        rejection = "not_enough_pieces"
+        raise
+    except (ValueError, TypeError):
+        rejection = "invalid_input"
+        raise
+    finally:
+        stats({**event, "rejection": rejection, "timings": timings})
+
+
+def _stats_scheme(scheme):
+    # Stats keys must never raise and mask the error being recorded.
+    try:
+        return " ".join(_normalize_blocks(scheme))
+    except TypeError:
+        return repr(scheme)
+
+
+def _stats_forced_pair(forced_pair):
+    try:
+        return _normalize_forced_pair(forced_pair)
+    except (ValueError, TypeError):
+        return None
 
 
 def random_shift_comms(comm_sequence, rng=None):
@@ -370,6 +458,7 @@ def generate_five_cycle(**kwargs):
     """
     Convenience wrapper: run five_cycle and apply a random rotation to comms.
     """
+    _warn_max_attempts(kwargs.pop("max_attempts", None))
     result = basic_five_cycle(**kwargs)
     rotated = random_shift_comms(result["comm_sequence"])
     result = dict(result)
@@ -377,6 +466,43 @@ def generate_five_cycle(**kwargs):
     return result
 
 
+def iter_five_cycles(
+    *,
+    buffer_letter=CORNER_BUFFER,
+    scheme=None,
+    rng=None,
+    forced_pair=None,
+    randomize_third_orientation=False,
+    shift=True,
+    dedup_window=0,
+    max_attempts=1000,
+):
+    """
+    Lazily yield five-cycle results forever.
+
+    The scheme, buffer and forced pair are compiled once and reused for every
+    draw. ``shift`` applies ``random_shift_comms`` like ``generate_five_cycle``.
+    With ``dedup_window > 0`` a sequence (or any rotation of it) is not
+    repeated within that many consecutive results; ``max_attempts`` bounds
+    the redraws spent avoiding one.
+    """
+    prepared = _prepare_five_cycle(scheme, buffer_letter, forced_pair)
+    rng = rng or random.Random()
+
+    def draw():
+        result = _sample_five_cycle(prepared, rng, randomize_third_orientation)
+        if shift:
+            result["comm_sequence"] = random_shift_comms(result["comm_sequence"], rng)
+        return result
+
+    yield from _dedup_window(
+        draw,
+        dedup_window,
+        max_attempts,
+        sequence_of=lambda result: result["comm_sequence"],
+    )
+
+
 if __name__ == "__main__":
     print("=== Corner 5-cycle example ===")
     corner_result = basic_five_cycle()
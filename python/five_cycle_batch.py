@@ -0,0 +1,140 @@
+"""
+Vectorized five-cycle generation.
+
+``generate_five_cycles`` draws the same random choices as ``basic_five_cycle``
+(ordered 4-piece selection, one sticker per piece, third-comm pattern and
+optional third-comm orientation) for a whole batch at once with NumPy, and
+derives the cleanup comms with the closed form from ``_derive_trace_ids``.
+Comms are returned as letter ids into the scheme's letter table.
+"""
+
+import numpy as np
+
+from comm_drill_trainer import CORNER_BUFFER
+from five_cycle import (
+    _build_scheme_data,
+    _normalize_blocks,
+    _pieces_after_buffer,
+    _validate_forced_pair,
+)
+
+
+def _twist(ids, k, M):
+    side = ids % M
+    return ids - side + (side + k) % M
+
+
+def _sample_rows(rng, n, population, k):
+    """``k`` distinct ordered picks from ``population`` for each of ``n`` rows."""
+    keys = rng.random((n, len(population)))
+    return np.asarray(population)[np.argsort(keys, axis=1)[:, :k]]
+
+
+def generate_five_cycles(
+    n,
+    *,
+    scheme=None,
+    buffer_letter=CORNER_BUFFER,
+    seed=None,
+    forced_pair=None,
+    randomize_third_orientation=False,
+    shift=True,
+):
+    """
+    Generate ``n`` five-comm sequences in one vectorized pass.
+
+    Parameters
+    ----------
+    n : int
+        Number of sequences.
+    scheme, buffer_letter, forced_pair, randomize_third_orientation
+        As for ``basic_five_cycle``.
+    seed : int | numpy.random.SeedSequence | numpy.random.Generator | None
+        Seed or generator for ``numpy.random.default_rng``.
+    shift : bool
+        Randomly rotate each sequence, like ``generate_five_cycle``.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, tuple[str, ...]]
+        ``(comms, letters)`` where ``comms`` has shape ``(n, 5, 2)`` and holds
+        indices into ``letters``.
+    """
+    if n < 0:
+        raise ValueError("Requested count must be non-negative.")
+    rng = np.random.default_rng(seed)
+    blocks = _normalize_blocks(scheme)
+    scheme_data = _build_scheme_data(blocks)
+    if buffer_letter not in scheme_data["letter_to_ref_pos"]:
+        raise ValueError(f"Buffer letter {buffer_letter} not present in scheme.")
+    normalized_pair = _validate_forced_pair(blocks, buffer_letter, forced_pair)
+    available_pieces = _pieces_after_buffer(blocks, buffer_letter)
+    if len(available_pieces) < 4:
+        raise ValueError("Need at least 4 pieces after the buffer piece.")
+    stickers = scheme_data["stickers"]
+    M = stickers.block_len
+    piece_letters = np.array(
+        [stickers.encode(block) for block in available_pieces],
+        dtype=np.int64,
+    )
+    piece_count = len(available_pieces)
+
+    if normalized_pair:
+        forced_ids = np.array(stickers.encode(normalized_pair), dtype=np.int64)
+        forced_pieces = [
+            available_pieces.index(blocks[stickers.ref_pos(letter_id)[0]])
+            for letter_id in forced_ids
+        ]
+        pool = [idx for idx in range(piece_count) if idx not in forced_pieces]
+        extras = _sample_rows(rng, n, pool, 2)
+        extra_letters = piece_letters[extras, rng.integers(0, M, (n, 2))]
+        force_into_first = rng.random(n) < 0.5
+        forced = np.broadcast_to(forced_ids, (n, 2))
+        seeded = np.where(
+            force_into_first[:, None],
+            np.concatenate([forced, extra_letters], axis=1),
+            np.concatenate([extra_letters, forced], axis=1),
+        )
+        forced_pieces = np.broadcast_to(np.array(forced_pieces), (n, 2))
+        pieces = np.where(
+            force_into_first[:, None],
+            np.concatenate([forced_pieces, extras], axis=1),
+            np.concatenate([extras, forced_pieces], axis=1),
+        )
+    else:
+        pieces = _sample_rows(rng, n, range(piece_count), 4)
+        seeded = piece_letters[pieces, rng.integers(0, M, (n, 4))]
+
+    b, c, d, e = seeded.T
+    third_on_l = rng.integers(0, 2, n).astype(bool)
+    if randomize_third_orientation:
+        third_piece = np.where(third_on_l, pieces[:, 3], pieces[:, 2])
+        third_c = piece_letters[pieces[:, 1], rng.integers(0, M, n)]
+        third_x = piece_letters[third_piece, rng.integers(0, M, n)]
+    else:
+        third_c = c
+        third_x = np.where(third_on_l, e, d)
+
+    p = (third_c - c) % M
+    q = (third_x - np.where(third_on_l, e, d)) % M
+    m0 = np.where(third_on_l, _twist(e, q - p, M), _twist(d, q - p, M))
+    m1 = np.where(third_on_l, _twist(c, q, M), _twist(e, q - p, M))
+    m2 = np.where(third_on_l, _twist(d, q, M), _twist(c, q, M))
+
+    comms = np.stack(
+        [b, c, d, e, third_c, third_x, m2, m1, m0, b],
+        axis=1,
+    ).reshape(n, 5, 2)
+    if shift:
+        offsets = rng.integers(0, 5, n)
+        order = (np.arange(5) + offsets[:, None]) % 5
+        comms = np.take_along_axis(comms, order[:, :, None], axis=1)
+    return comms, stickers.letters
+
+
+def decode_five_cycles(comms, letters):
+    """Turn an ``(n, 5, 2)`` id array back into tuples of letter pairs."""
+    return [
+        tuple((letters[first], letters[second]) for first, second in row)
+        for row in np.asarray(comms).tolist()
+    ]
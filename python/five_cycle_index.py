@@ -0,0 +1,352 @@
+"""
+Precomputed index of every sequence ``basic_five_cycle`` can return.
+
+For a fixed scheme, buffer and third-comm orientation mode the generator only
+ever chooses an ordered 4-piece selection, one sticker per piece, one of the
+two third-comm patterns and (when randomized) the third comm's stickers. This
+module enumerates all of those once and stores each resulting 5-comm sequence
+as 10 letter ids in a compact binary file:
+
+    header   magic, version, mode, buffer id, record count, scheme text
+    records  record_count * 10 bytes (comm letter ids, in order)
+    offsets  (L * L + 1) uint32, CSR offsets into ``postings`` per seeded pair
+    postings uint32 record numbers, grouped by the pair of comm 1 or comm 2
+
+Sampling is a single ``randrange`` over the records, or over the postings of
+one pair when a forced pair is requested, and matches the distribution of
+``basic_five_cycle``.
+"""
+
+import hashlib
+import itertools
+import random
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from comm_drill_trainer import CORNER_BUFFER
+from five_cycle import (
+    _build_scheme_data,
+    _derive_trace_ids,
+    _normalize_blocks,
+    _pieces_after_buffer,
+    _validate_forced_pair,
+)
+
+MAGIC = b"FCIX"
+VERSION = 1
+RECORD_LEN = 10
+_HEADER = struct.Struct("<4sHBBIH")
+
+
+def _mode_name(randomize_third_orientation):
+    return "random" if randomize_third_orientation else "fixed"
+
+
+def scheme_hash(blocks):
+    return hashlib.sha256(" ".join(blocks).encode("utf-8")).hexdigest()[:16]
+
+
+def index_key(scheme=None, buffer_letter=CORNER_BUFFER, randomize_third_orientation=False):
+    """(scheme hash, buffer letter, orientation mode) identifying an index."""
+    blocks = _normalize_blocks(scheme)
+    return scheme_hash(blocks), buffer_letter, _mode_name(randomize_third_orientation)
+
+
+def _to_array(typecode, data):
+    out = array(typecode)
+    out.frombytes(data)
+    if sys.byteorder != "little":
+        out.byteswap()
+    return out
+
+
+def _to_bytes(values):
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class FiveCycleIndex:
+    """
+    All valid five-cycle sequences for one scheme, buffer and orientation mode.
+    """
+
+    __slots__ = (
+        "blocks",
+        "buffer_letter",
+        "randomize_third_orientation",
+        "records",
+        "pair_offsets",
+        "pair_postings",
+        "_scheme_data",
+    )
+
+    def __init__(
+        self,
+        blocks,
+        buffer_letter,
+        randomize_third_orientation,
+        records,
+        pair_offsets,
+        pair_postings,
+    ):
+        self.blocks = list(blocks)
+        self.buffer_letter = buffer_letter
+        self.randomize_third_orientation = randomize_third_orientation
+        self.records = records
+        self.pair_offsets = pair_offsets
+        self.pair_postings = pair_postings
+        self._scheme_data = _build_scheme_data(self.blocks)
+
+    def __len__(self):
+        return len(self.records) // RECORD_LEN
+
+    @property
+    def key(self):
+        return (
+            scheme_hash(self.blocks),
+            self.buffer_letter,
+            _mode_name(self.randomize_third_orientation),
+        )
+
+    def sequence(self, record_no):
+        """Comm sequence stored at ``record_no`` as letter pairs."""
+        letters = self._scheme_data["stickers"].letters
+        start = record_no * RECORD_LEN
+        ids = self.records[start : start + RECORD_LEN]
+        return tuple(
+            (letters[ids[idx]], letters[ids[idx + 1]])
+            for idx in range(0, RECORD_LEN, 2)
+        )
+
+    def pair_count(self, forced_pair):
+        first, second = self._pair_ids(forced_pair)
+        key = first * len(self._scheme_data["stickers"]) + second
+        return self.pair_offsets[key + 1] - self.pair_offsets[key]
+
+    def _pair_ids(self, forced_pair):
+        normalized = _validate_forced_pair(self.blocks, self.buffer_letter, forced_pair)
+        return self._scheme_data["stickers"].encode(normalized)
+
+    def sample(self, rng=None, forced_pair=None):
+        """
+        Draw one sequence uniformly, in the same format as ``basic_five_cycle``.
+        """
+        rng = rng or random.Random()
+        pair = None
+        if forced_pair is None:
+            record_no = rng.randrange(len(self))
+        else:
+            first, second = self._pair_ids(forced_pair)
+            key = first * len(self._scheme_data["stickers"]) + second
+            start, end = self.pair_offsets[key], self.pair_offsets[key + 1]
+            if start == end:
+                raise ValueError(f"No indexed sequence contains pair {forced_pair}.")
+            record_no = self.pair_postings[rng.randrange(start, end)]
+            pair = self._scheme_data["stickers"].decode((first, second))
+        sequence = self.sequence(record_no)
+        return self._result(sequence, pair)
+
+    def _result(self, sequence, forced_pair):
+        letter_to_ref_pos = self._scheme_data["letter_to_ref_pos"]
+        seeded = list(sequence[:2])
+        if forced_pair is not None and tuple(forced_pair) == sequence[1]:
+            seeded.reverse()
+        selected_pieces = tuple(
+            self.blocks[letter_to_ref_pos[letter][0]]
+            for comm in seeded
+            for letter in comm
+        )
+        (trace_4, trace_3), (trace_2, trace_1) = sequence[3], sequence[4]
+        return {
+            "selected_pieces": selected_pieces,
+            "comm_sequence": sequence,
+            "trace": (
+                self.buffer_letter,
+                trace_1,
+                trace_2,
+                trace_3,
+                trace_4,
+                self.buffer_letter,
+            ),
+        }
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        scheme_text = " ".join(self.blocks).encode("utf-8")
+        stickers = self._scheme_data["stickers"]
+        header = _HEADER.pack(
+            MAGIC,
+            VERSION,
+            int(self.randomize_third_orientation),
+            stickers.intern(self.buffer_letter),
+            len(self),
+            len(scheme_text),
+        )
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as handle:
+            handle.write(header)
+            handle.write(scheme_text)
+            handle.write(self.records.tobytes())
+            handle.write(_to_bytes(self.pair_offsets))
+            handle.write(_to_bytes(self.pair_postings))
+        tmp_path.replace(path)
+        return path
+
+    @classmethod
+    def load(cls, path):
+        data = Path(path).read_bytes()
+        magic, version, mode, buffer_id, count, text_len = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} five-cycle index.")
+        offset = _HEADER.size
+        blocks = data[offset : offset + text_len].decode("utf-8").split(" ")
+        offset += text_len
+        letters = [ch for block in blocks for ch in block]
+        records = array("B", data[offset : offset + count * RECORD_LEN])
+        offset += count * RECORD_LEN
+        offsets_len = (len(letters) ** 2 + 1) * 4
+        pair_offsets = _to_array("I", data[offset : offset + offsets_len])
+        offset += offsets_len
+        pair_postings = _to_array("I", data[offset:])
+        if len(pair_postings) != 2 * count:
+            raise ValueError(f"{path} is truncated.")
+        return cls(
+            blocks,
+            letters[buffer_id],
+            bool(mode),
+            records,
+            pair_offsets,
+            pair_postings,
+        )
+
+
+def build_index(
+    *,
+    scheme=None,
+    buffer_letter=CORNER_BUFFER,
+    randomize_third_orientation=False,
+):
+    """
+    Enumerate every sequence ``basic_five_cycle`` can produce for the scheme.
+
+    Returns
+    -------
+    FiveCycleIndex
+        In-memory index; call ``save`` to persist it.
+    """
+    blocks = _normalize_blocks(scheme)
+    scheme_data = _build_scheme_data(blocks)
+    if buffer_letter not in scheme_data["letter_to_ref_pos"]:
+        raise ValueError(f"Buffer letter {buffer_letter} not present in scheme.")
+    stickers = scheme_data["stickers"]
+    if len(stickers) > 256:
+        raise ValueError("Five-cycle indexes support at most 256 letters.")
+    available_pieces = _pieces_after_buffer(blocks, buffer_letter)
+    if len(available_pieces) < 4:
+        raise ValueError("Need at least 4 pieces after the buffer piece.")
+    piece_letters = [
+        stickers.encode([ch for ch in block if ch != buffer_letter])
+        for block in available_pieces
+    ]
+
+    records = array("B")
+    for i, j, k, l in itertools.permutations(range(len(piece_letters)), 4):
+        for b, c, d, e in itertools.product(
+            piece_letters[i], piece_letters[j], piece_letters[k], piece_letters[l],
+        ):
+            for third_on_l in (False, True):
+                third_piece = l if third_on_l else k
+                if randomize_third_orientation:
+                    thirds = itertools.product(piece_letters[j], piece_letters[third_piece])
+                else:
+                    thirds = ((c, e if third_on_l else d),)
+                for third_c, third_x in thirds:
+                    m0, m1, m2 = _derive_trace_ids(
+                        stickers, b, c, d, e, third_c, third_x, third_on_l,
+                    )
+                    records.extend((b, c, d, e, third_c, third_x, m2, m1, m0, b))
+
+    letter_count = len(stickers)
+    count = len(records) // RECORD_LEN
+    pair_offsets = array("I", bytes(4 * (letter_count * letter_count + 1)))
+    for record_no in range(count):
+        start = record_no * RECORD_LEN
+        pair_offsets[records[start] * letter_count + records[start + 1] + 1] += 1
+        pair_offsets[records[start + 2] * letter_count + records[start + 3] + 1] += 1
+    for key in range(1, len(pair_offsets)):
+        pair_offsets[key] += pair_offsets[key - 1]
+    fill = array("I", pair_offsets)
+    pair_postings = array("I", bytes(4 * 2 * count))
+    for record_no in range(count):
+        start = record_no * RECORD_LEN
+        for first in (start, start + 2):
+            key = records[first] * letter_count + records[first + 1]
+            pair_postings[fill[key]] = record_no
+            fill[key] += 1
+
+    return FiveCycleIndex(
+        blocks,
+        buffer_letter,
+        randomize_third_orientation,
+        records,
+        pair_offsets,
+        pair_postings,
+    )
+
+
+def index_path(
+    directory,
+    scheme=None,
+    buffer_letter=CORNER_BUFFER,
+    randomize_third_orientation=False,
+):
+    digest, _, mode = index_key(scheme, buffer_letter, randomize_third_orientation)
+    blocks = _normalize_blocks(scheme)
+    buffer_id = _build_scheme_data(blocks)["stickers"].intern(buffer_letter)
+    return Path(directory) / f"{digest}-{buffer_id}-{mode}.fcidx"
+
+
+def load_or_build_index(
+    directory,
+    *,
+    scheme=None,
+    buffer_letter=CORNER_BUFFER,
+    randomize_third_orientation=False,
+):
+    """
+    Load the index for ``(scheme, buffer, mode)`` from ``directory``, building
+    and saving it first if it does not exist yet.
+    """
+    path = index_path(directory, scheme, buffer_letter, randomize_third_orientation)
+    if path.exists():
+        return FiveCycleIndex.load(path)
+    index = build_index(
+        scheme=scheme,
+        buffer_letter=buffer_letter,
+        randomize_third_orientation=randomize_third_orientation,
+    )
+    index.save(path)
+    return index
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build a five-cycle sequence index.")
+    parser.add_argument("directory")
+    parser.add_argument("--scheme", default=None)
+    parser.add_argument("--buffer", default=CORNER_BUFFER)
+    parser.add_argument("--randomize-third-orientation", action="store_true")
+    args = parser.parse_args()
+    options = {
+        "scheme": args.scheme,
+        "buffer_letter": args.buffer,
+        "randomize_third_orientation": args.randomize_third_orientation,
+    }
+    built = load_or_build_index(args.directory, **options)
+    print(f"{len(built)} sequences in {index_path(args.directory, **options)}")
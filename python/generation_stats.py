@@ -0,0 +1,116 @@
+"""
+Optional telemetry for the sequence generators.
+
+A collector is any callable taking one event dict per generator call:
+
+    {
+        "scheme": "UVJ OIF ...",      # normalized scheme text
+        "buffer_letter": "U",
+        "forced_pair": ("A", "B") | None,
+        "attempts": 1,
+        "rejection": None | "not_enough_pieces" | "invalid_input" | "trace_mismatch",
+        "timings": {"prepare": s, "sampling": s, "derivation": s, "verification": s},
+    }
+
+Pass one as ``stats=`` to ``basic_five_cycle`` or install it for a block of
+code with ``with GenerationStats() as stats: ...``. When no collector is
+active the generators skip all timing.
+"""
+
+from collections import Counter
+from contextvars import ContextVar
+
+STAGES = ("prepare", "sampling", "derivation", "verification")
+
+_active_collector = ContextVar("generation_stats_collector", default=None)
+
+
+def active_collector():
+    """Collector installed by the innermost ``with GenerationStats()`` block."""
+    return _active_collector.get()
+
+
+def _time_bucket(seconds):
+    """Power-of-two microsecond bucket: ``b`` holds durations below ``2**b`` us."""
+    return int(seconds * 1e6).bit_length()
+
+
+class GenerationStats:
+    """
+    Aggregates generator events into counters and histograms, overall and per
+    ``(scheme, buffer_letter, forced_pair)``.
+    """
+
+    def __init__(self):
+        self.counters = Counter()
+        self.rejections = Counter()
+        self.attempts = Counter()
+        self.stage_seconds = Counter()
+        self.stage_histograms = {stage: Counter() for stage in STAGES}
+        self.by_key = {}
+        self._token = None
+
+    def __call__(self, event):
+        self.counters["calls"] += 1
+        self.attempts[event["attempts"]] += 1
+        rejection = event["rejection"]
+        if rejection is None:
+            self.counters["successes"] += 1
+        else:
+            self.counters["rejections"] += 1
+            self.rejections[rejection] += 1
+        total = 0.0
+        for stage, seconds in event["timings"].items():
+            self.stage_seconds[stage] += seconds
+            self.stage_histograms[stage][_time_bucket(seconds)] += 1
+            total += seconds
+
+        key = (event["scheme"], event["buffer_letter"], event["forced_pair"])
+        per_key = self.by_key.get(key)
+        if per_key is None:
+            per_key = self.by_key[key] = Counter()
+        per_key["calls"] += 1
+        per_key["seconds"] += total
+        if rejection is not None:
+            per_key[rejection] += 1
+
+    def __enter__(self):
+        self._token = _active_collector.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _active_collector.reset(self._token)
+        self._token = None
+        return False
+
+    def slowest(self, limit=10):
+        """``(key, counters)`` pairs with the highest mean time per call."""
+        ranked = sorted(
+            self.by_key.items(),
+            key=lambda item: item[1]["seconds"] / item[1]["calls"],
+            reverse=True,
+        )
+        return ranked[:limit]
+
+    def summary(self):
+        """Plain-dict snapshot, e.g. for logging as JSON."""
+        return {
+            "counters": dict(self.counters),
+            "rejections": dict(self.rejections),
+            "attempts": dict(self.attempts),
+            "stage_seconds": dict(self.stage_seconds),
+            "stage_histograms_us": {
+                stage: {2 ** bucket: count for bucket, count in sorted(histogram.items())}
+                for stage, histogram in self.stage_histograms.items()
+                if histogram
+            },
+            "by_key": [
+                {
+                    "scheme": scheme,
+                    "buffer_letter": buffer_letter,
+                    "forced_pair": forced_pair,
+                    **counters,
+                }
+                for (scheme, buffer_letter, forced_pair), counters in self.by_key.items()
+            ],
+        }
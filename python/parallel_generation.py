@@ -0,0 +1,161 @@
+"""
+Process-pool generation of large drill pools.
+
+Work is split into fixed-size chunks and every chunk gets its own RNG stream
+spawned from one master ``numpy.random.SeedSequence``. Because the chunking and
+the spawned seeds only depend on ``total``, ``chunk_size`` and ``seed``, the
+merged pool is identical for any number of workers, including 1.
+"""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from comm_drill_trainer import (
+    _check_chain_count,
+    _prepare_chain,
+    _sample_chain,
+    _warn_max_attempts,
+)
+from five_cycle import _prepare_five_cycle, _sample_five_cycle, random_shift_comms
+
+DEFAULT_CHUNK_SIZE = 256
+
+
+def _chunk_rng(seed_sequence):
+    state = seed_sequence.generate_state(4, dtype=np.uint64)
+    return random.Random(int.from_bytes(state.tobytes(), "little"))
+
+
+def _plan_chunks(total, chunk_size, seed):
+    if total < 0:
+        raise ValueError("Requested pool size must be non-negative.")
+    chunk_size = max(1, int(chunk_size))
+    sizes = [chunk_size] * (total // chunk_size)
+    if total % chunk_size:
+        sizes.append(total % chunk_size)
+    master = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    return list(zip(master.spawn(len(sizes)), sizes))
+
+
+def _run_chunks(worker, tasks, workers):
+    if workers == 1 or len(tasks) <= 1:
+        chunks = map(worker, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(worker, tasks))
+    return [item for chunk in chunks for item in chunk]
+
+
+def _five_cycle_chunk(task):
+    seed_sequence, size, options = task
+    rng = _chunk_rng(seed_sequence)
+    prepared = _prepare_five_cycle(
+        options["scheme"],
+        options["buffer_letter"],
+        options["forced_pair"],
+    )
+    results = []
+    for _ in range(size):
+        result = _sample_five_cycle(
+            prepared,
+            rng,
+            options["randomize_third_orientation"],
+        )
+        if options["shift"]:
+            result["comm_sequence"] = random_shift_comms(result["comm_sequence"], rng)
+        results.append(result)
+    return results
+
+
+def _chain_chunk(task):
+    seed_sequence, size, options = task
+    rng = _chunk_rng(seed_sequence)
+    prepared = _prepare_chain(
+        options["scheme"],
+        options["buffer_letter"],
+        options["forced_pair"],
+    )
+    return [
+        _sample_chain(prepared, options["count"], rng)
+        for _ in range(size)
+    ]
+
+
+def generate_five_cycle_pool(
+    total,
+    *,
+    buffer_letter,
+    scheme,
+    seed=None,
+    workers=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    forced_pair=None,
+    randomize_third_orientation=False,
+    shift=True,
+):
+    """
+    Generate ``total`` five-cycle results across a process pool.
+
+    Parameters
+    ----------
+    seed : int | numpy.random.SeedSequence | None
+        Master seed; the same seed and ``chunk_size`` give the same pool for
+        any ``workers``.
+    workers : int | None
+        Process count (``None`` uses ``os.cpu_count()``, ``1`` runs inline).
+    shift : bool
+        Apply ``random_shift_comms`` like ``generate_five_cycle``.
+
+    Returns
+    -------
+    list[dict]
+        Results in the same format as ``basic_five_cycle``, in chunk order.
+    """
+    # Validate once in the parent so bad input fails before any worker starts.
+    _prepare_five_cycle(scheme, buffer_letter, forced_pair)
+    options = {
+        "scheme": scheme,
+        "buffer_letter": buffer_letter,
+        "forced_pair": forced_pair,
+        "randomize_third_orientation": randomize_third_orientation,
+        "shift": shift,
+    }
+    tasks = [
+        (seed_sequence, size, options)
+        for seed_sequence, size in _plan_chunks(total, chunk_size, seed)
+    ]
+    return _run_chunks(_five_cycle_chunk, tasks, workers)
+
+
+def generate_chain_pool(
+    total,
+    count,
+    scheme,
+    buffer_letter,
+    *,
+    seed=None,
+    workers=None,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    forced_pair=None,
+    max_attempts=None,
+):
+    """
+    Generate ``total`` chain-method sequences of ``count`` letters each across
+    a process pool. Seeding and ordering work as in ``generate_five_cycle_pool``.
+    ``max_attempts`` is deprecated and ignored, as in ``generate_piece_letters``.
+    """
+    _warn_max_attempts(max_attempts)
+    _check_chain_count(_prepare_chain(scheme, buffer_letter, forced_pair), count)
+    options = {
+        "count": count,
+        "scheme": scheme,
+        "buffer_letter": buffer_letter,
+        "forced_pair": forced_pair,
+    }
+    tasks = [
+        (seed_sequence, size, options)
+        for seed_sequence, size in _plan_chunks(total, chunk_size, seed)
+    ]
+    return _run_chunks(_chain_chunk, tasks, workers)
@@ -0,0 +1,111 @@
+"""
+Batch counterpart of ``StickerState``: ``B`` sticker states held in one NumPy
+array so a comm can be applied to all of them with a single fancy-indexing
+step.
+
+Only the letter location index is stored: ``where[row, letter_id]`` is the flat
+slot the letter occupies in that row. A sticker 3-cycle ``(a b c)`` moves whole
+pieces, so it sends every sticker ``a^k`` (``k`` steps clockwise from ``a``) to
+where ``c^k`` was, ``b^k`` to where ``a^k`` was and ``c^k`` to where ``b^k``
+was, matching ``StickerState.three_cycle`` for stickers on distinct pieces.
+"""
+
+import numpy as np
+
+
+class StickerBatch:
+    """
+    ``size`` sticker states over the pieces of a ``StickerScheme``.
+    """
+
+    __slots__ = ("scheme", "where", "_twists", "_rows")
+
+    def __init__(self, scheme, size, where=None):
+        letter_count = len(scheme)
+        M = scheme.block_len
+        self.scheme = scheme
+        if where is None:
+            where = np.tile(np.arange(letter_count, dtype=np.int16), (size, 1))
+        self.where = where
+        ids = np.arange(letter_count)
+        self._twists = (ids - ids % M)[:, None] + (ids[:, None] + np.arange(M)) % M
+        self._rows = np.arange(size)[:, None]
+
+    def __len__(self):
+        return len(self.where)
+
+    def copy(self):
+        return StickerBatch(self.scheme, len(self), self.where.copy())
+
+    def reset(self):
+        self.where[:] = np.arange(len(self.scheme), dtype=self.where.dtype)
+
+    def three_cycle(self, a, b, c):
+        """
+        Apply the sticker 3-cycle ``(a b c)`` to every row. Each argument is a
+        letter id or an array with one letter id per row.
+        """
+        size = len(self)
+        pieces_a = self._twists[np.broadcast_to(a, size)]
+        pieces_b = self._twists[np.broadcast_to(b, size)]
+        pieces_c = self._twists[np.broadcast_to(c, size)]
+        rows = self._rows
+        where = self.where
+        slots_a = where[rows, pieces_a]
+        slots_b = where[rows, pieces_b]
+        where[rows, pieces_a] = where[rows, pieces_c]
+        where[rows, pieces_b] = slots_a
+        where[rows, pieces_c] = slots_b
+
+    def apply_comms(self, buffer_id, comms):
+        """
+        Apply comm sequences from ``buffer_id``; ``comms`` has shape
+        ``(B, K, 2)`` (one sequence per row) or ``(K, 2)`` (same for all rows).
+        """
+        comms = np.asarray(comms)
+        for step in range(comms.shape[-2]):
+            pair = comms[..., step, :]
+            self.three_cycle(buffer_id, pair[..., 0], pair[..., 1])
+
+    def home_letters(self):
+        """``(B, L)`` array of the letter sitting in each home slot."""
+        homes = np.empty_like(self.where)
+        np.put_along_axis(
+            homes,
+            self.where.astype(np.intp),
+            np.arange(len(self.scheme), dtype=homes.dtype)[None, :],
+            axis=1,
+        )
+        return homes
+
+    def trace(self, buffer_id, max_steps=200):
+        """
+        Trace the buffer cycle of every row.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            ``(cycles, lengths)``: ``cycles[row]`` is ``[buffer, x1, ..., buffer]``
+            padded with ``-1``, and ``lengths[row]`` the number of valid entries.
+            Rows that do not close within ``max_steps`` have no closing buffer.
+        """
+        size = len(self)
+        homes = self.home_letters()
+        rows = np.arange(size)
+        cycles = np.full((size, max_steps + 1), -1, dtype=np.int16)
+        cycles[:, 0] = buffer_id
+        lengths = np.ones(size, dtype=np.int64)
+        cur = np.full(size, buffer_id, dtype=homes.dtype)
+        active = np.ones(size, dtype=bool)
+        for step in range(1, max_steps + 1):
+            cur = homes[rows, cur]
+            cycles[active, step] = cur[active]
+            lengths += active
+            active &= cur != buffer_id
+            if not active.any():
+                return cycles[:, : step + 1], lengths
+        return cycles, lengths
+
+    def is_solved(self):
+        """Boolean mask of rows equal to the solved state."""
+        return (self.where == np.arange(len(self.scheme))).all(axis=1)
@@ -0,0 +1,199 @@
+"""
+Compact sticker state for uniform-M puzzles, shared by the tracer demo and the
+five-cycle generator.
+
+Letters are interned to small ints once per scheme: the letter printed on side
+``side`` of block ``pos`` gets id ``pos * M + side``. Because every block starts
+in its own position with orientation 0, a letter id is also the flat index of
+its home slot, which keeps tracing to plain integer lookups.
+"""
+
+from array import array
+
+
+class StickerScheme:
+    """
+    Immutable letter table for a scheme of equally sized blocks.
+    """
+
+    __slots__ = ("blocks", "block_len", "letters", "letter_ids")
+
+    def __init__(self, blocks):
+        blocks = tuple(blocks)
+        if not blocks:
+            raise ValueError("Scheme must provide at least one block.")
+        block_len = len(blocks[0])
+        if block_len == 0:
+            raise ValueError("Blocks cannot be empty.")
+        letters = []
+        letter_ids = {}
+        for block in blocks:
+            if len(block) != block_len:
+                raise ValueError("All blocks must have the same length.")
+            for ch in block:
+                if ch in letter_ids:
+                    raise ValueError(f"Duplicate letter detected: {ch}")
+                letter_ids[ch] = len(letters)
+                letters.append(ch)
+        self.blocks = blocks
+        self.block_len = block_len
+        self.letters = tuple(letters)
+        self.letter_ids = letter_ids
+
+    def __len__(self):
+        return len(self.letters)
+
+    def intern(self, letter):
+        try:
+            return self.letter_ids[letter]
+        except KeyError:
+            raise ValueError(f"Letter {letter} not found in scheme.") from None
+
+    def encode(self, letters):
+        return tuple(self.intern(ch) for ch in letters)
+
+    def decode(self, ids):
+        return [self.letters[i] for i in ids]
+
+    def ref_pos(self, letter_id):
+        """(pos, slot) where the letter sits in the solved state."""
+        return divmod(letter_id, self.block_len)
+
+    def twist(self, letter_id, k):
+        """Id of the letter ``k`` stickers clockwise from ``letter_id`` on the same piece."""
+        pos, side = divmod(letter_id, self.block_len)
+        return pos * self.block_len + (side + k) % self.block_len
+
+    def solved_state(self):
+        return StickerState(self)
+
+
+class StickerState:
+    """
+    Permutation + orientation state over the pieces of a ``StickerScheme``.
+
+    ``pieces[pos]`` is the block currently sitting at ``pos`` with orientation
+    ``oris[pos]``; ``where[letter_id]`` is the flat slot the letter occupies, kept
+    up to date by every swap so lookups never scan the state.
+    """
+
+    __slots__ = ("scheme", "pieces", "oris", "where")
+
+    def __init__(self, scheme, pieces=None, oris=None, where=None):
+        n = len(scheme.blocks)
+        self.scheme = scheme
+        self.pieces = array("b", range(n)) if pieces is None else pieces
+        self.oris = array("b", bytes(n)) if oris is None else oris
+        self.where = array("h", range(len(scheme))) if where is None else where
+
+    def copy(self):
+        return StickerState(
+            self.scheme,
+            array("b", self.pieces),
+            array("b", self.oris),
+            array("h", self.where),
+        )
+
+    def letter_at_slot(self, pos, slot):
+        """
+        Which letter is visible at (pos, slot)?
+        If a piece with orientation o sits at pos, the visible side index is (slot - o) mod M.
+        """
+        M = self.scheme.block_len
+        return self.pieces[pos] * M + (slot - self.oris[pos]) % M
+
+    def letter_at_home(self, letter_id):
+        """
+        Letter currently sitting in the *home* slot of ``letter_id``.
+        """
+        return self.letter_at_slot(*divmod(letter_id, self.scheme.block_len))
+
+    def find(self, letter_id):
+        """(pos, slot) where ``letter_id`` currently appears."""
+        return divmod(self.where[letter_id], self.scheme.block_len)
+
+    def _place(self, pos, piece, o):
+        M = self.scheme.block_len
+        self.pieces[pos] = piece
+        self.oris[pos] = o
+        base = pos * M
+        first = piece * M
+        for side in range(M):
+            self.where[first + side] = base + (side + o) % M
+
+    def swap(self, a, b):
+        """
+        Swap the *current* positions of stickers ``a`` and ``b`` (sticker 2-cycle),
+        updating permutation and orientations.
+
+        If a is at (posA, slotA) on pieceA with orientation oA, the side carrying a is
+            sideA = (slotA - oA) mod M.
+        To show a at some target slot 'slotB', set the new orientation so:
+            (sideA + oA') mod M == slotB  ->  oA' = (slotB - sideA) mod M.
+        Do this symmetrically for b and swap the two pieces.
+        """
+        M = self.scheme.block_len
+        pos_a, slot_a = self.find(a)
+        pos_b, slot_b = self.find(b)
+        piece_a = self.pieces[pos_a]
+        piece_b = self.pieces[pos_b]
+        side_a = (slot_a - self.oris[pos_a]) % M
+        side_b = (slot_b - self.oris[pos_b]) % M
+        self._place(pos_a, piece_b, (slot_a - side_b) % M)
+        self._place(pos_b, piece_a, (slot_b - side_a) % M)
+
+    def three_cycle(self, a, b, c):
+        """
+        Sticker 3-cycle (a b c) implemented as two 2-cycles applied right-to-left:
+            first (b c), then (a b).
+        """
+        self.swap(b, c)
+        self.swap(a, b)
+
+    def trace(self, buffer_id, max_steps=200):
+        """
+        Trace the sticker cycle induced by the current state, starting from ``buffer_id``.
+
+        Rule: next = letter found at the *home slot* of the current tracer.
+        Returns ``[buffer, x1, ..., buffer]`` if it closes within ``max_steps``.
+        """
+        cycle = [buffer_id]
+        cur = buffer_id
+        for _ in range(max_steps):
+            nxt = self.letter_at_home(cur)
+            cycle.append(nxt)
+            if nxt == buffer_id:
+                break
+            cur = nxt
+        return cycle
+
+    def cycles(self):
+        """
+        Decompose the whole sticker permutation into disjoint cycles relative to
+        the solved reference, including 1-cycles.
+        """
+        seen = bytearray(len(self.scheme))
+        cycles = []
+        for start in range(len(self.scheme)):
+            if seen[start]:
+                continue
+            cyc = [start]
+            cur = start
+            while True:
+                seen[cur] = 1
+                nxt = self.letter_at_home(cur)
+                cyc.append(nxt)
+                if nxt == start:
+                    break
+                cur = nxt
+            cycles.append(cyc)
+        return cycles
+
+    def labels(self):
+        """Visible letters per position, e.g. ``["UVJ", "OIF", ...]``."""
+        letters = self.scheme.letters
+        M = self.scheme.block_len
+        return [
+            "".join(letters[self.letter_at_slot(pos, slot)] for slot in range(M))
+            for pos in range(len(self.pieces))
+        ]
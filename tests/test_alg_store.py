@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PYTHON_SRC = PROJECT_ROOT / "python"
+TESTS_DIR = PROJECT_ROOT / "tests"
+for path in (PYTHON_SRC, PROJECT_ROOT, TESTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from alg_store import load_alg_table, read_csv_table, write_alg_table  # noqa: E402
+from alg_tables import table_hash  # noqa: E402
+from three_style_algorithms import CORNER_THREE_STYLE, EDGE_THREE_STYLE  # noqa: E402
+
+
+def verify_alg_store():
+    # Content of the tables before they moved from Python literals to alg_store.
+    assert table_hash(CORNER_THREE_STYLE) == (
+        "53274b42a5718d5ca185c13d5d888caa1e60a09dce6d1729ced81695a1afab77"
+    )
+    assert table_hash(EDGE_THREE_STYLE) == (
+        "1b55b877321a11fadf826c4ffdc38162ec7b5bb9944acf9268d4ff9054389141"
+    )
+    assert len(CORNER_THREE_STYLE) == 378 and list(EDGE_THREE_STYLE) == sorted(EDGE_THREE_STYLE)
+    assert "ZZ" not in CORNER_THREE_STYLE and CORNER_THREE_STYLE.get("ZZ") is None
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        table = {"BA": "R  U R'", "AB": "R' U' R", "AC": ""}
+        with load_alg_table(write_alg_table(table, tmpdir / "small.algt")) as loaded:
+            assert dict(loaded) == {"AB": "R' U' R", "AC": "", "BA": "R U R'"}
+            assert list(loaded) == ["AB", "AC", "BA"]
+            assert loaded.tokens == ("R'", "U'", "R", "U")
+            try:
+                loaded["CA"]
+            except KeyError:
+                pass
+            else:
+                raise AssertionError("expected a missing pair to raise KeyError")
+
+        (tmpdir / "pairs.csv").write_text("pair,alg\nAB,R U R'\nBA, R U' R' \n")
+        assert read_csv_table(tmpdir / "pairs.csv") == {"AB": "R U R'", "BA": "R U' R'"}
+        (tmpdir / "grid.csv").write_text(",A,B\nA,,R U\nB,U R,\n")
+        assert read_csv_table(tmpdir / "grid.csv") == {"AB": "R U", "BA": "U R"}
+
+        (tmpdir / "broken.algt").write_bytes(b"FCIX" + bytes(20))
+        try:
+            load_alg_table(tmpdir / "broken.algt")
+        except ValueError as exc:
+            assert "not a version" in str(exc), exc
+        else:
+            raise AssertionError("expected a bad magic error")
+    print("Passed alg store checks.")
+
+
+def main():
+    verify_alg_store()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PYTHON_SRC = PROJECT_ROOT / "python"
+TESTS_DIR = PROJECT_ROOT / "tests"
+for path in (PYTHON_SRC, PROJECT_ROOT, TESTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import alg_tables  # noqa: E402
+from alg_tables import permutation_table  # noqa: E402
+from comm_drill_trainer import EDGE_BUFFER, EDGE_LETTER_SCHEME  # noqa: E402
+from dlin import FaceletCube  # noqa: E402
+from five_cycle_batch import generate_five_cycles  # noqa: E402
+from three_style_algorithms import CORNER_THREE_STYLE, EDGE_THREE_STYLE  # noqa: E402
+
+
+def verify_permutation_table(rng, count=5000, iterations=200):
+    table = permutation_table(EDGE_THREE_STYLE)
+    assert permutation_table(dict(EDGE_THREE_STYLE)) is table
+    comms, letters = generate_five_cycles(
+        count,
+        scheme=EDGE_LETTER_SCHEME,
+        buffer_letter=EDGE_BUFFER,
+        seed=11,
+    )
+    rows = table.pair_rows(letters)[comms[..., 0], comms[..., 1]]
+    assert (rows >= 0).all()
+    assert table.solves(rows).all()
+    assert not table.solves(rows[:, :4]).any()
+    keys = list(EDGE_THREE_STYLE)
+    for _ in range(iterations):
+        sequence = rng.sample(keys, 3)
+        cube = FaceletCube()
+        cube.scramble_from_string(" ".join(EDGE_THREE_STYLE[key] for key in sequence))
+        assert (cube.facelets == table.compose(sequence)).all(), sequence
+    print("Passed permutation table checks.")
+
+
+def verify_rotation_counts_as_solved():
+    table = permutation_table({"AB": "R U R' U'", "BA": "U R U' R'", "XX": "x y", "YY": "y' x'"})
+    rows = [[table.row_of[key] for key in sequence] for sequence in (
+        ("AB", "BA"), ("XX", "YY"), ("XX", "XX"), ("AB", "XX"),
+    )]
+    assert table.solves(rows).tolist() == [True, True, True, False]
+    lookup = table.pair_rows(["A", "B", "C"])
+    assert lookup[0, 2] == -1
+    try:
+        table.solves([[lookup[0, 1], lookup[0, 2]]])
+    except ValueError as exc:
+        assert "missing" in str(exc), exc
+    else:
+        raise AssertionError("expected a missing pair to raise ValueError")
+    print("Passed rotation solve checks.")
+
+
+def verify_edited_table_is_rehashed():
+    table = {"AB": "R U R' U'", "BA": "U R U' R'"}
+    before = permutation_table(table)
+    table["AB"] = "R U R'"
+    after = permutation_table(table)
+    assert after is not before
+    assert (after.compose(["AB"]) == alg_tables.alg_permutation("R U R'")).all()
+    assert permutation_table(dict(table)) is after
+    print("Passed edited table checks.")
+
+
+def verify_permutation_cache(size=3):
+    alg_tables.clear_permutation_cache()
+    original_size = alg_tables.PERMUTATION_CACHE_SIZE
+    alg_tables.PERMUTATION_CACHE_SIZE = size
+    try:
+        table = permutation_table(CORNER_THREE_STYLE)
+        hashed = []
+        original_hash = alg_tables.table_hash
+        alg_tables.table_hash = lambda table: hashed.append(table) or original_hash(table)
+        try:
+            # Read-only AlgTable objects are not hashed again.
+            for _ in range(5):
+                assert permutation_table(CORNER_THREE_STYLE) is table
+            assert not hashed
+            small = [{"AB": "R U R' U'", "BA": alg} for alg in ("U", "U'", "U2", "D")]
+            for entry in small:
+                permutation_table(entry)
+                permutation_table(entry)
+            assert len(hashed) == 2 * len(small)
+        finally:
+            alg_tables.table_hash = original_hash
+        assert len(alg_tables._PERMUTATION_TABLES) == size
+        assert len(alg_tables._TABLE_DIGESTS) == 1
+        assert permutation_table(CORNER_THREE_STYLE) is not table
+    finally:
+        alg_tables.PERMUTATION_CACHE_SIZE = original_size
+        alg_tables.clear_permutation_cache()
+    print("Passed permutation cache checks.")
+
+
+def main():
+    rng = random.Random(42)
+    verify_permutation_table(rng)
+    verify_rotation_counts_as_solved()
+    verify_edited_table_is_rehashed()
+    verify_permutation_cache()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import warnings
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PYTHON_SRC = PROJECT_ROOT / "python"
+TESTS_DIR = PROJECT_ROOT / "tests"
+for path in (PYTHON_SRC, PROJECT_ROOT, TESTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from alg_store import load_alg_table, write_alg_table  # noqa: E402
+from alg_tables import table_hash  # noqa: E402
+from alg_validation import load_or_validate, validate_alg_table, validation_path  # noqa: E402
+from three_style_algorithms import (  # noqa: E402
+    CORNER_PATH,
+    CORNER_THREE_STYLE,
+    EDGE_PATH,
+    EDGE_THREE_STYLE,
+    VALIDATION_DIR,
+    load_checked_table,
+)
+
+
+def verify_alg_validation():
+    for table, piece_type in ((CORNER_THREE_STYLE, "corner"), (EDGE_THREE_STYLE, "edge")):
+        report = validate_alg_table(table, piece_type)
+        assert report["checked"] == len(table), report
+        assert not report["wrong"] and not report["missing"], report
+
+    broken = dict(CORNER_THREE_STYLE)
+    broken["AB"] = CORNER_THREE_STYLE["BA"]
+    broken["AZ"] = "R U R'"
+    del broken["ZS"]
+    report = validate_alg_table(broken, "corner")
+    assert sorted(report["wrong"]) == ["AB", "AZ"], report["wrong"]
+    assert "Key does not name" in report["wrong"]["AZ"], report["wrong"]
+    assert report["missing"] == ["ZS"], report["missing"]
+    assert report["table_hash"] == table_hash(broken)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        first = load_or_validate(tmpdir, EDGE_THREE_STYLE, "edge")
+        path = validation_path(tmpdir, EDGE_THREE_STYLE, "edge")
+        assert path.exists() and first["table_hash"] == table_hash(EDGE_THREE_STYLE)
+        # A stored report is trusted as is, so tampering with it shows it was reused.
+        path.write_text(path.read_text().replace('"checked": 440', '"checked": -1'))
+        # The key is the file digest, so a fresh mapping of the same file finds
+        # the report without decoding anything.
+        with load_alg_table(EDGE_PATH) as reloaded:
+            assert load_or_validate(tmpdir, reloaded, "edge")["checked"] == -1
+            assert reloaded._rows is None
+        rewritten = write_alg_table(dict(EDGE_THREE_STYLE), Path(tmpdir) / "edge.algt")
+        with load_alg_table(rewritten) as reloaded:
+            assert validation_path(tmpdir, reloaded, "edge") == path
+        assert validation_path(tmpdir, broken) != validation_path(tmpdir, CORNER_THREE_STYLE)
+
+        # A corrupt report is replaced, and an unwritable directory only
+        # means the report is not saved.
+        path.write_text("{")
+        assert load_or_validate(tmpdir, EDGE_THREE_STYLE, "edge")["checked"] == 440
+        assert json.loads(path.read_text())["checked"] == 440
+        blocker = Path(tmpdir) / "blocker"
+        blocker.write_text("")
+        report = load_or_validate(blocker / "reports", EDGE_THREE_STYLE, "edge")
+        assert report["checked"] == 440 and not report["wrong"], report
+    print("Passed alg validation checks.")
+
+
+def verify_checked_table_loading():
+    # Checking the shared tables stores their reports in the shared cache.
+    for path, piece_type in ((CORNER_PATH, "corner"), (EDGE_PATH, "edge")):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with load_checked_table(path, piece_type) as table:
+                assert validation_path(VALIDATION_DIR, table, piece_type).exists(), piece_type
+
+    # Plain imports leave the validator (and numpy) alone unless asked.
+    probe = "import sys, three_style_algorithms; print('alg_validation' in sys.modules)"
+    base_env = {key: value for key, value in os.environ.items() if key != "CHECK_ALG_TABLES"}
+    for env, expected in (({}, "False"), ({"CHECK_ALG_TABLES": "1"}, "True")):
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            cwd=TESTS_DIR,
+            env={**base_env, **env},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == expected, (env, result)
+
+    broken = dict(EDGE_THREE_STYLE)
+    broken["AB"] = EDGE_THREE_STYLE["BA"]
+    del broken["CR"]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        path = write_alg_table(broken, tmpdir / "broken.algt")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with load_checked_table(path, "edge", tmpdir / "reports") as loaded:
+                assert dict(loaded) == broken
+        assert len(caught) == 1, caught
+        message = str(caught[0].message)
+        assert "broken.algt" in message and "1 wrong, 1 missing" in message, message
+        assert "AB:" in message and "missing: CR" in message, message
+        with load_alg_table(path) as reloaded:
+            assert validation_path(tmpdir / "reports", reloaded, "edge").exists()
+    print("Passed checked table loading checks.")
+
+
+def main():
+    verify_alg_validation()
+    verify_checked_table_loading()
+
+
+if __name__ == "__main__":
+    main()
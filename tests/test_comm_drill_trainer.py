@@ -0,0 +1,446 @@
+from __future__ import annotations
+
+import itertools
+import random
+import sys
+import traceback
+import warnings
+from collections import Counter
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PYTHON_SRC = PROJECT_ROOT / "python"
+TESTS_DIR = PROJECT_ROOT / "tests"
+for path in (PYTHON_SRC, PROJECT_ROOT, TESTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+import compiled_scheme  # noqa: E402
+from comm_drill_trainer import (  # noqa: E402
+    CORNER_BUFFER,
+    CORNER_LETTER_SCHEME,
+    EDGE_BUFFER,
+    EDGE_LETTER_SCHEME,
+    WING_BUFFER,
+    WING_LETTER_SCHEME,
+    generate_piece_letters,
+    iter_chain_sequences,
+    max_chain_count,
+)
+from five_cycle import basic_five_cycle, generate_five_cycle  # noqa: E402
+
+SCHEMES = (
+    (CORNER_LETTER_SCHEME, CORNER_BUFFER),
+    (EDGE_LETTER_SCHEME, EDGE_BUFFER),
+    (WING_LETTER_SCHEME, WING_BUFFER),
+)
+
+SMALL_SCHEMES = ("X A B", "X AB C D", "X ABC D", "X ABC DE", "X AB CD E", "X ABC DE F", "X ABC DEF")
+SMALL_FORCED_PAIRS = (("X AB C D", "AC"), ("X AB C D", "CB"), ("X ABC DE", "DA"), ("X AB CD E", "EC"))
+
+
+def _contains_pair(sequence, pair):
+    return any(
+        (sequence[idx], sequence[(idx + 1) % len(sequence)]) == tuple(pair)
+        for idx in range(len(sequence))
+    )
+
+
+def _assert_valid_chain(sequence, scheme, buffer_letter, count):
+    blocks = [block for block in scheme.split(" ") if block]
+    buffer_idx = next(idx for idx, block in enumerate(blocks) if buffer_letter in block)
+    block_of = {letter: idx for idx, block in enumerate(blocks) for letter in block}
+    letters = [letter for block in blocks[buffer_idx + 1 :] for letter in block]
+    assert len(sequence) == count, sequence
+    for start in range(0, count, len(letters)):
+        chunk = sequence[start : start + len(letters)]
+        assert len(set(chunk)) == len(chunk), sequence
+        assert set(chunk) <= set(letters), sequence
+    if count > 1:
+        for idx in range(count):
+            assert block_of[sequence[idx]] != block_of[sequence[(idx + 1) % count]], sequence
+
+
+def _brute_force_chains(scheme, count):
+    """Every chain the generator may return, by enumeration (tiny schemes only)."""
+    blocks = scheme.split(" ")[1:]
+    block_of = {letter: idx for idx, block in enumerate(blocks) for letter in block}
+    letters = [letter for block in blocks for letter in block]
+    total = len(letters)
+
+    def valid(run):
+        return all(block_of[a] != block_of[b] for a, b in zip(run, run[1:]))
+
+    full_rounds = [
+        run for run in itertools.permutations(letters)
+        if valid(run) and (total == 1 or block_of[run[0]] != block_of[run[-1]])
+    ]
+    rounds = -(-count // total)
+    tail = count - (rounds - 1) * total
+    last_rounds = full_rounds if tail == total else [
+        run for run in itertools.permutations(letters, tail) if valid(run)
+    ]
+    chains = set()
+    for prefix in itertools.product(full_rounds, repeat=rounds - 1):
+        for last in last_rounds:
+            chain = [letter for run in prefix + (last,) for letter in run]
+            if valid(chain) and (count == 1 or block_of[chain[0]] != block_of[chain[-1]]):
+                chains.add(tuple(chain))
+    return chains
+
+
+def _legacy_chains(scheme, count):
+    """
+    Every chain the original retry-based generator could return (tiny
+    schemes only). Its rounds were rotations of arrangements of every letter
+    with at most one pair of neighbours on the same piece, never across the
+    ends of the round, and for the first round not at its first two letters.
+    """
+    blocks = scheme.split(" ")[1:]
+    block_of = {letter: idx for idx, block in enumerate(blocks) for letter in block}
+    letters = [letter for block in blocks for letter in block]
+    total = len(letters)
+
+    def clashes(run):
+        return [idx for idx in range(1, len(run)) if block_of[run[idx - 1]] == block_of[run[idx]]]
+
+    arrangements = [
+        run for run in itertools.permutations(letters)
+        if total == 1 or block_of[run[0]] != block_of[run[-1]]
+    ]
+    full_rounds = [run for run in arrangements if not clashes(run)]
+    rounds = -(-count // total)
+    tail = count - (rounds - 1) * total
+    last_rounds = {
+        run[:tail]
+        for run in arrangements
+        if len(clashes(run)) <= 1 and (rounds > 1 or clashes(run) != [1])
+    }
+    chains = set()
+    for prefix in itertools.product(full_rounds, repeat=rounds - 1):
+        for last in last_rounds:
+            chain = [letter for run in prefix + (last,) for letter in run]
+            if not clashes(chain) and (count == 1 or block_of[chain[0]] != block_of[chain[-1]]):
+                chains.add(tuple(chain))
+    return chains
+
+
+def _legacy_generate(count, scheme, buffer_letter, rng):
+    """The original retry-based generator without forced pairs, drawing from ``rng``."""
+    raw_blocks = [block for block in scheme.split(" ") if block]
+    trim_start = next(idx for idx, block in enumerate(raw_blocks) if buffer_letter in block) + 1
+    templates = [list(block) for block in raw_blocks[trim_start:]]
+    letter_to_block_idx = {
+        letter: idx for idx, letters in enumerate(templates) for letter in letters
+    }
+    total = sum(len(letters) for letters in templates)
+
+    def build_cycle():
+        while True:
+            working = [letters.copy() for letters in templates]
+            for letters in working:
+                rng.shuffle(letters)
+            cycle = []
+            last_idx = None
+            while len(cycle) < total:
+                candidates = [i for i, letters in enumerate(working) if letters and i != last_idx]
+                if not candidates:
+                    break
+                last_idx = rng.choice(candidates)
+                cycle.append((last_idx, working[last_idx].pop()))
+            if len(cycle) < total:
+                continue
+            if len(cycle) > 1 and cycle[0][0] == cycle[-1][0]:
+                shifts = list(range(1, len(cycle) - 1))
+                rng.shuffle(shifts)
+                cycle = cycle[shifts[0]:] + cycle[: shifts[0]]
+            return cycle
+
+    def rotate_for_previous(cycle, prev_idx):
+        if prev_idx is None:
+            return cycle
+        if len(cycle) == 1:
+            return None if cycle[0][0] == prev_idx else cycle
+        shifts = list(range(len(cycle)))
+        rng.shuffle(shifts)
+        for shift in shifts:
+            rotated = cycle[shift:] + cycle[:shift]
+            if rotated[0][0] != prev_idx and rotated[0][0] != rotated[-1][0]:
+                return rotated
+        return None
+
+    while True:
+        result = []
+        prev_block_idx = None
+        failed = False
+        while len(result) < count and not failed:
+            cycle = None
+            while cycle is None:
+                cycle = rotate_for_previous(build_cycle(), prev_block_idx)
+            for block_idx, letter in cycle:
+                if len(result) == count:
+                    break
+                if block_idx == prev_block_idx:
+                    failed = True
+                    break
+                result.append(letter)
+                prev_block_idx = block_idx
+        if failed:
+            continue
+        if count > 1 and letter_to_block_idx[result[0]] == letter_to_block_idx[result[-1]]:
+            continue
+        return result
+
+
+def _assert_same_frequencies(new, old, label, sigmas=5.0):
+    """Two-sample chi-square test of two lists of outcomes."""
+    new_counts, old_counts = Counter(new), Counter(old)
+    scale = (len(old) / len(new)) ** 0.5
+    statistic = sum(
+        (new_counts[key] * scale - old_counts[key] / scale) ** 2 / (new_counts[key] + old_counts[key])
+        for key in set(new_counts) | set(old_counts)
+    )
+    dof = max(1, len(set(new_counts) | set(old_counts)) - 1)
+    assert statistic < dof + sigmas * (2 * dof) ** 0.5, (label, statistic, dof)
+
+
+def verify_chain_constraints(rng, iterations=200):
+    for scheme, buffer_letter in SCHEMES:
+        for count in (1, 2, 5, 8, 17, 30, 47):
+            for _ in range(iterations // 10):
+                sequence = generate_piece_letters(count, scheme, buffer_letter, rng=rng)
+                _assert_valid_chain(sequence, scheme, buffer_letter, count)
+    print("Passed chain constraint checks.")
+
+
+def verify_forced_pair_chains(rng, iterations=200):
+    for scheme, buffer_letter in SCHEMES:
+        blocks = [block for block in scheme.split(" ") if block]
+        pair = blocks[-2][0] + blocks[-1][0]
+        for count in (2, 3, 8, 17, 30):
+            for _ in range(iterations // 10):
+                sequence = generate_piece_letters(
+                    count, scheme, buffer_letter, forced_pair=pair, rng=rng,
+                )
+                _assert_valid_chain(sequence, scheme, buffer_letter, count)
+                assert _contains_pair(sequence, pair), (pair, sequence)
+    print("Passed forced pair chain checks.")
+
+
+def verify_chain_support_matches_brute_force(rng, samples=2000):
+    for scheme in SMALL_SCHEMES:
+        for count in range(1, 7):
+            expected = _brute_force_chains(scheme, count)
+            try:
+                generate_piece_letters(count, scheme, "X", rng=rng)
+            except ValueError:
+                assert not expected, (scheme, count)
+                continue
+            assert expected, (scheme, count)
+            seen = {
+                tuple(generate_piece_letters(count, scheme, "X", rng=rng))
+                for _ in range(samples)
+            }
+            assert seen <= expected, (scheme, count, seen - expected)
+            # Counts the original process cannot produce are built directly.
+            legacy = _legacy_chains(scheme, count)
+            if len(expected) <= 50:
+                assert seen == (legacy or expected), (scheme, count, (legacy or expected) ^ seen)
+    for scheme, pair in SMALL_FORCED_PAIRS:
+        for count in range(2, 7):
+            expected = {
+                chain for chain in _brute_force_chains(scheme, count) if _contains_pair(chain, pair)
+            }
+            try:
+                generate_piece_letters(count, scheme, "X", forced_pair=pair, rng=rng)
+            except ValueError:
+                assert not expected, (scheme, pair, count)
+                continue
+            assert expected, (scheme, pair, count)
+            seen = {
+                tuple(generate_piece_letters(count, scheme, "X", forced_pair=pair, rng=rng))
+                for _ in range(samples)
+            }
+            assert seen == expected, (scheme, pair, count, expected ^ seen)
+    print("Passed brute force support checks.")
+
+
+def verify_legacy_frequencies(samples=3000, pattern_samples=12000):
+    rng = random.Random(3)
+    legacy_rng = random.Random(4)
+    for scheme in SMALL_SCHEMES:
+        for count in range(1, 7):
+            if not _legacy_chains(scheme, count):
+                continue
+            new = [tuple(generate_piece_letters(count, scheme, "X", rng=rng)) for _ in range(samples)]
+            old = [tuple(_legacy_generate(count, scheme, "X", legacy_rng)) for _ in range(samples)]
+            _assert_same_frequencies(new, old, (scheme, count))
+
+    # Piece patterns on the real schemes, including whether a piece comes
+    # back two letters later.
+    for scheme, buffer_letter, count in (
+        (CORNER_LETTER_SCHEME, CORNER_BUFFER, 8),
+        (EDGE_LETTER_SCHEME, EDGE_BUFFER, 6),
+        (EDGE_LETTER_SCHEME, EDGE_BUFFER, 30),
+    ):
+        block_of = {letter: block for block in scheme.split(" ") for letter in block}
+
+        def pattern(sequence):
+            return tuple(block_of[letter] == block_of[sequence[2]] for letter in sequence[:2])
+
+        new = [
+            pattern(generate_piece_letters(count, scheme, buffer_letter, rng=rng))
+            for _ in range(pattern_samples)
+        ]
+        old = [
+            pattern(_legacy_generate(count, scheme, buffer_letter, legacy_rng))
+            for _ in range(pattern_samples)
+        ]
+        _assert_same_frequencies(new, old, (scheme, count))
+    print("Passed legacy frequency checks.")
+
+
+def verify_feasibility_precheck():
+    for scheme in SMALL_SCHEMES:
+        total = len(scheme.replace(" ", "")) - 1
+        maximum = max_chain_count(scheme, "X")
+        if maximum is None:
+            assert _brute_force_chains(scheme, 2 * total), scheme
+            continue
+        assert _brute_force_chains(scheme, maximum), (scheme, maximum)
+        for count in range(maximum + 1, 2 * total + 1):
+            assert not _brute_force_chains(scheme, count), (scheme, count)
+            try:
+                generate_piece_letters(count, scheme, "X")
+            except ValueError as exc:
+                assert f"maximum feasible count is {maximum}" in str(exc), exc
+            else:
+                raise AssertionError((scheme, count))
+    assert max_chain_count(CORNER_LETTER_SCHEME, CORNER_BUFFER) is None
+    assert max_chain_count("X ABCD E F", "X", forced_pair="EF") == 3
+    reasons = (
+        ((6, "X ABC DE", "X"), "Piece ABC"),
+        ((5, "X ABC DE", "X"), "only two pieces"),
+        ((3, "ABC DE", None), "only two pieces"),
+        ((3, "AB CD", None), "only two pieces"),
+        ((5, "X ABCD E F", "X"), "single partial round"),
+    )
+    for args, reason in reasons:
+        try:
+            generate_piece_letters(*args)
+        except ValueError as exc:
+            assert reason in str(exc), (args, exc)
+        else:
+            raise AssertionError(args)
+    try:
+        generate_piece_letters(4, "X AB C D", "X", forced_pair="CD")
+    except ValueError as exc:
+        assert "Forced pair CD" in str(exc), exc
+    else:
+        raise AssertionError("expected a forced pair error")
+    print("Passed feasibility precheck checks.")
+
+
+def verify_max_attempts_deprecated(rng):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        generate_piece_letters(8, CORNER_LETTER_SCHEME, CORNER_BUFFER, rng=rng)
+        assert not caught, caught
+        basic_five_cycle(rng=rng)
+        assert not caught, caught
+        generate_piece_letters(8, CORNER_LETTER_SCHEME, CORNER_BUFFER, max_attempts=10, rng=rng)
+        basic_five_cycle(rng=rng, max_attempts=10)
+        generate_five_cycle(rng=rng, max_attempts=10)
+    # Both generators share one policy for the parameter.
+    assert [warning.category for warning in caught] == [DeprecationWarning] * 3, caught
+    assert all(warning.filename == __file__ for warning in caught), caught
+    print("Passed max_attempts deprecation checks.")
+
+
+def verify_chain_stream(rng, window=50, iterations=300):
+    stream = iter_chain_sequences(
+        8, CORNER_LETTER_SCHEME, CORNER_BUFFER, rng=rng, dedup_window=window,
+    )
+    recent = []
+    for sequence in itertools.islice(stream, iterations):
+        _assert_valid_chain(sequence, CORNER_LETTER_SCHEME, CORNER_BUFFER, 8)
+        key = min(tuple(sequence[offset:] + sequence[:offset]) for offset in range(8))
+        assert key not in recent, sequence
+        recent = (recent + [key])[-window:]
+
+    empty = iter_chain_sequences(0, CORNER_LETTER_SCHEME, CORNER_BUFFER, rng=rng, dedup_window=5)
+    assert list(itertools.islice(empty, 10)) == [[]] * 10
+    print("Passed chain stream checks.")
+
+
+def verify_compiled_scheme_cache(rng):
+    compiled_scheme.clear_cache()
+    compiled_scheme.set_cache_size(2)
+    try:
+        first = compiled_scheme.compile_scheme(CORNER_LETTER_SCHEME, CORNER_BUFFER)
+        assert compiled_scheme.compile_scheme(CORNER_LETTER_SCHEME, CORNER_BUFFER) is first
+        assert compiled_scheme.compile_scheme(CORNER_LETTER_SCHEME.split(), CORNER_BUFFER) is not first
+        try:
+            first.blocks = ()
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("CompiledScheme should be immutable")
+
+        # Both generators share the entry and it survives their calls.
+        basic_five_cycle(scheme=CORNER_LETTER_SCHEME, buffer_letter=CORNER_BUFFER, rng=rng)
+        generate_piece_letters(8, CORNER_LETTER_SCHEME, CORNER_BUFFER, rng=rng)
+        assert compiled_scheme.compile_scheme(CORNER_LETTER_SCHEME, CORNER_BUFFER) is first
+
+        compiled_scheme.compile_scheme(EDGE_LETTER_SCHEME, EDGE_BUFFER)
+        compiled_scheme.compile_scheme(WING_LETTER_SCHEME, WING_BUFFER)
+        info = compiled_scheme.cache_info()
+        assert info["size"] == 2 and info["maxsize"] == 2, info
+        assert compiled_scheme.compile_scheme(CORNER_LETTER_SCHEME, CORNER_BUFFER) is not first
+
+        # A forced pair is validated against the same compiled scheme.
+        compiled_scheme.clear_cache()
+        basic_five_cycle(
+            scheme=CORNER_LETTER_SCHEME, buffer_letter=CORNER_BUFFER, rng=rng, forced_pair="OE"
+        )
+        info = compiled_scheme.cache_info()
+        assert info["size"] == 1 and info["misses"] == 1, info
+
+        # Unequal blocks are fine for chains but not for sticker tables.
+        generate_piece_letters(4, "X ABC DE F", "X", rng=rng)
+        try:
+            basic_five_cycle(scheme="X ABC DE F", buffer_letter="X", rng=rng)
+        except ValueError as exc:
+            assert "same length" in str(exc), exc
+        else:
+            raise AssertionError("expected a block length error")
+        # Each raise is a fresh error, so tracebacks do not pile up in the cache.
+        compiled = compiled_scheme.compile_scheme("X ABC DE F", "X")
+        errors = []
+        for _ in range(5):
+            try:
+                compiled.scheme_data
+            except ValueError as exc:
+                errors.append(exc)
+        assert len({id(exc) for exc in errors}) == 5
+        depths = {len(traceback.extract_tb(exc.__traceback__)) for exc in errors}
+        assert depths == {2}, depths
+    finally:
+        compiled_scheme.set_cache_size(compiled_scheme.DEFAULT_CACHE_SIZE)
+    print("Passed compiled scheme cache checks.")
+
+
+def main():
+    rng = random.Random(42)
+    verify_chain_constraints(rng)
+    verify_forced_pair_chains(rng)
+    verify_chain_support_matches_brute_force(rng)
+    verify_legacy_frequencies()
+    verify_feasibility_precheck()
+    verify_max_attempts_deprecated(rng)
+    verify_chain_stream(rng)
+    verify_compiled_scheme_cache(rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import copy
+import random
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PYTHON_SRC = PROJECT_ROOT / "python"
+TESTS_DIR = PROJECT_ROOT / "tests"
+for path in (PYTHON_SRC, PROJECT_ROOT, TESTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from dlin import (  # noqa: E402
+    BUFFERS,
+    Cube,
+    FaceletCube,
+    FaceletTracer,
+    IDENTITY_FRAME,
+    PIECE_POSITIONS,
+    Tracer,
+    compile_alg,
+)
+
+LOOPCUBE = [(x, y, z) for x in range(3) for y in range(3) for z in range(3)]
+
+MOVE_TOKENS = (
+    [face + suffix for face in "UDLRFBMESxyz" for suffix in ("", "'", "2")]
+    + [face + "w" + suffix for face in "UDLRFB" for suffix in ("", "'", "2")]
+    + [face + suffix for face in "udlrfb" for suffix in ("", "'", "2")]
+)
+
+
+def _random_scramble(rng, max_length=30):
+    return " ".join(rng.choice(MOVE_TOKENS) for _ in range(rng.randrange(1, max_length)))
+
+
+def verify_facelet_engine_matches_legacy(rng, iterations=300):
+    for _ in range(iterations):
+        scramble = _random_scramble(rng)
+        legacy = Tracer(copy.deepcopy(BUFFERS))
+        facelet = FaceletTracer(copy.deepcopy(BUFFERS))
+        legacy.scramble_from_string(scramble)
+        facelet.scramble_from_string(scramble)
+        for pos in legacy.loopcube:
+            assert legacy.piece_sides(pos) == facelet.piece_sides(pos), (scramble, pos)
+        legacy.trace_cube()
+        facelet.trace_cube()
+        assert legacy.tracing == facelet.tracing, scramble
+    print(f"Passed {iterations} facelet engine comparisons.")
+
+
+def verify_floating_buffer_order(rng, iterations=200):
+    for _ in range(iterations):
+        scramble = _random_scramble(rng)
+        buffers = {kind: rng.sample(order, len(order)) for kind, order in BUFFERS.items()}
+        legacy = Tracer(copy.deepcopy(buffers))
+        facelet = FaceletTracer(copy.deepcopy(buffers))
+        for tracer in (legacy, facelet):
+            tracer.scramble_from_string(scramble)
+            tracer.trace_cube()
+        assert legacy.tracing == facelet.tracing, (scramble, buffers)
+
+
+def verify_is_solved(rng, iterations=200):
+    for engine in (Cube, FaceletCube):
+        assert engine().is_solved()
+    for _ in range(iterations):
+        scramble = _random_scramble(rng, max_length=4)
+        for engine in (Cube, FaceletCube):
+            cube = engine()
+            cube.scramble_from_string(scramble)
+            for piece_type in ("corner", "edge", "center"):
+                expected = all(
+                    cube.piece_sides(pos) == Cube().piece_sides(pos)
+                    for pos in PIECE_POSITIONS[piece_type]
+                )
+                assert cube.is_solved(piece_type) == expected, (scramble, piece_type)
+
+
+def verify_compiled_algs_match_strings(rng, iterations=200):
+    for _ in range(iterations):
+        scramble = _random_scramble(rng)
+        compiled = compile_alg(scramble)
+        assert compile_alg(scramble) is compiled
+        for engine in (Cube, FaceletCube):
+            from_string, from_ids = engine(), engine()
+            from_string.scramble_from_string(scramble)
+            from_ids.scramble_from_string(compiled)
+            for pos in LOOPCUBE:
+                assert from_string.piece_sides(pos) == from_ids.piece_sides(pos), scramble
+
+
+def verify_piece_index(rng, iterations=200):
+    for _ in range(iterations):
+        scramble = _random_scramble(rng)
+        for engine in (Cube, FaceletCube):
+            cube = engine()
+            cube.scramble_from_string(scramble)
+            for pos in LOOPCUBE:
+                name = cube.piece_name(pos)
+                if name:
+                    assert cube.locate_piece(name) == pos, (scramble, name)
+                    assert cube.locate_piece(name[::-1]) == pos, (scramble, name)
+
+
+def verify_snapshot_restore(rng, iterations=100):
+    for engine in (Cube, FaceletCube):
+        cube = engine()
+        for _ in range(iterations):
+            first, second = _random_scramble(rng), _random_scramble(rng)
+            cube.reset_cube_to_solved()
+            assert cube.is_solved(), engine
+            cube.scramble_from_string(first)
+            saved = cube.snapshot()
+            cube.scramble_from_string(second)
+            cube.restore(saved)
+            expected = engine()
+            expected.scramble_from_string(first)
+            assert cube.scramble == expected.scramble
+            for pos in LOOPCUBE:
+                assert cube.piece_sides(pos) == expected.piece_sides(pos), (engine, first)
+                name = cube.piece_name(pos)
+                if name:
+                    assert cube.locate_piece(name) == pos, (engine, first, name)
+
+
+def verify_tracer_reuse(rng, iterations=100):
+    for tracer_class in (Tracer, FaceletTracer):
+        reused = tracer_class(copy.deepcopy(BUFFERS))
+        for _ in range(iterations):
+            scramble = _random_scramble(rng)
+            fresh = tracer_class(copy.deepcopy(BUFFERS))
+            reused.reset()
+            for tracer in (fresh, reused):
+                tracer.scramble_from_string(scramble)
+                tracer.trace_cube()
+            assert reused.tracing == fresh.tracing, (tracer_class, scramble)
+
+
+def verify_virtual_rotations(rng, iterations=100):
+    equivalents = {
+        "x": "R M' L'", "y": "U E' D'", "z": "F S B'",
+        "x'": "R' M L", "y2": "U2 E2 D2",
+        "Rw": "R M'", "Uw'": "U' E", "f2": "F2 S2", "l": "L M",
+    }
+    for engine in (Cube, FaceletCube):
+        cube = engine()
+        cube.do_move("x")
+        cube.do_move("y")
+        assert cube.frame != IDENTITY_FRAME
+        cube.piece_sides((0, 0, 0))
+        assert cube.frame == IDENTITY_FRAME
+        for _ in range(iterations):
+            prefix, suffix = _random_scramble(rng), _random_scramble(rng)
+            for move, layers in equivalents.items():
+                virtual, physical = engine(), engine()
+                virtual.scramble_from_string(f"{prefix} {move} {suffix}")
+                physical.scramble_from_string(f"{prefix} {layers} {suffix}")
+                for pos in LOOPCUBE:
+                    assert virtual.piece_sides(pos) == physical.piece_sides(pos), (engine, move, prefix, suffix)
+
+
+def verify_orbit_restriction(rng, iterations=100):
+    for _ in range(iterations):
+        scramble = _random_scramble(rng)
+        for engine in (Cube, FaceletCube):
+            full = engine()
+            full.scramble_from_string(scramble)
+            for orbits in (("corner",), ("edge", "center"), ("corner", "center")):
+                cube = engine(orbits=orbits)
+                cube.scramble_from_string(scramble)
+                for piece_type in orbits:
+                    for pos in PIECE_POSITIONS[piece_type]:
+                        assert cube.piece_sides(pos) == full.piece_sides(pos), (engine, orbits, scramble)
+                assert cube.is_solved() == full.is_solved(orbits), (engine, orbits, scramble)
+                for piece_type in orbits:
+                    assert cube.is_solved(piece_type) == full.is_solved(piece_type), (
+                        engine, orbits, piece_type, scramble,
+                    )
+                # Untracked pieces are stale, so neither engine answers for them.
+                for piece_type in set(PIECE_POSITIONS) - set(orbits):
+                    try:
+                        cube.is_solved(piece_type)
+                    except ValueError as exc:
+                        assert "not tracked" in str(exc), exc
+                    else:
+                        raise AssertionError((engine, orbits, piece_type))
+        for tracer_class in (Tracer, FaceletTracer):
+            full = tracer_class(copy.deepcopy(BUFFERS))
+            full.scramble_from_string(scramble)
+            full.trace_cube()
+            for trace in ("corner", "edge"):
+                tracer = tracer_class(copy.deepcopy(BUFFERS), trace=trace)
+                tracer.scramble_from_string(scramble)
+                tracer.trace_cube()
+                assert tracer.tracing[trace] == full.tracing[trace], (tracer_class, trace, scramble)
+                assert tracer.tracing["rotation"] == full.tracing["rotation"], scramble
+
+
+def main():
+    rng = random.Random(42)
+    verify_facelet_engine_matches_legacy(rng)
+    verify_compiled_algs_match_strings(rng)
+    verify_piece_index(rng)
+    verify_floating_buffer_order(rng)
+    verify_is_solved(rng)
+    verify_snapshot_restore(rng)
+    verify_tracer_reuse(rng)
+    verify_virtual_rotations(rng)
+    verify_orbit_restriction(rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import itertools
 import random
 import sys
+import tempfile
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -17,8 +19,21 @@ from comm_drill_trainer import (
     EDGE_BUFFER,
     EDGE_LETTER_SCHEME,
 )  # noqa: E402
-from dlin import Tracer, BUFFERS  # noqa: E402
-from five_cycle import generate_five_cycle  # noqa: E402
+from dlin import FaceletTracer, BUFFERS  # noqa: E402
+from five_cycle import (  # noqa: E402
+    _apply_comm_sequence,
+    _build_scheme_data,
+    _normalize_blocks,
+    _prepare_five_cycle,
+    _sample_five_cycle,
+    basic_five_cycle,
+    generate_five_cycle,
+    iter_five_cycles,
+)
+from five_cycle_batch import decode_five_cycles, generate_five_cycles  # noqa: E402
+from parallel_generation import generate_five_cycle_pool  # noqa: E402
+from sticker_batch import StickerBatch  # noqa: E402
+from five_cycle_index import FiveCycleIndex, index_path, load_or_build_index  # noqa: E402
 from three_style_algorithms import CORNER_THREE_STYLE, EDGE_THREE_STYLE  # noqa: E402
 
 
@@ -40,9 +55,17 @@ def _assert_no_repeats_or_inverses(sequence):
         seen.add(pair)
 
 
+EDGE_TRACER = FaceletTracer(BUFFERS, trace="edge")
+CORNER_TRACER = FaceletTracer(BUFFERS, trace="corner")
+
+
 def trace_edges(scramble: str):
-    tracer = Tracer(BUFFERS, trace="edge")
+    tracer = EDGE_TRACER
+    tracer.reset()
     tracer.scramble_from_string(scramble)
+    # Only pay for a full trace when the cube is not already solved.
+    if tracer.is_solved(("edge", "center")):
+        return []
     tracer.trace_cube()
     # print(tracer.tracing)
     return tracer.tracing["edge"]
@@ -55,7 +78,6 @@ def run_edge_tests(iterations=1000, rng=None):
             buffer_letter=EDGE_BUFFER,
             scheme=EDGE_LETTER_SCHEME,
             rng=rng,
-            max_attempts=5000,
         )
         comm_sequence = result["comm_sequence"]
         _assert_no_repeats_or_inverses(comm_sequence)
@@ -82,7 +104,6 @@ def run_corner_tests(iterations=1000, rng=None):
             buffer_letter=CORNER_BUFFER,
             scheme=CORNER_LETTER_SCHEME,
             rng=rng,
-            max_attempts=5000,
         )
         corner_sequence = corner_result["comm_sequence"]
         _assert_no_repeats_or_inverses(corner_sequence)
@@ -93,10 +114,13 @@ def run_corner_tests(iterations=1000, rng=None):
                 raise KeyError(f"Missing algorithm for letter pair {key}")
             corner_algorithms.append(CORNER_THREE_STYLE[key])
         corner_scramble = " ".join(corner_algorithms)
-        tracer = Tracer(BUFFERS, trace="corner")
+        tracer = CORNER_TRACER
+        tracer.reset()
         tracer.scramble_from_string(corner_scramble)
-        tracer.trace_cube()
-        corner_trace = tracer.tracing["corner"]
+        corner_trace = []
+        if not tracer.is_solved(("corner", "center")):
+            tracer.trace_cube()
+            corner_trace = tracer.tracing["corner"]
         if corner_trace:
             print("Corner failed iteration:", i)
             print("Comms:", corner_sequence)
@@ -123,7 +147,6 @@ def verify_forced_pair_integration(rng):
         buffer_letter=CORNER_BUFFER,
         scheme=CORNER_LETTER_SCHEME,
         forced_pair=forced_pair,
-        max_attempts=5000,
     )
     assert _comm_sequence_contains_pair(result["comm_sequence"], forced_pair)
     _assert_no_repeats_or_inverses(result["comm_sequence"])
@@ -137,8 +160,128 @@ def verify_invalid_forced_pair_rejection():
             forced_pair=("O", "I"),
         )
     except ValueError:
-        return
-    raise AssertionError("Expected ValueError for invalid forced pair.")
+        pass
+    else:
+        raise AssertionError("Expected ValueError for invalid forced pair.")
+
+    # Only the two forced pieces and one other left to draw from.
+    prepared = dict(_prepare_five_cycle(CORNER_LETTER_SCHEME, CORNER_BUFFER, "OE"))
+    prepared["available_pieces"] = prepared["available_pieces"][:3]
+    try:
+        _sample_five_cycle(prepared, random.Random(0))
+    except ValueError as exc:
+        assert "Not enough additional pieces" in str(exc), exc
+    else:
+        raise AssertionError("Expected ValueError for a forced pair without spare pieces.")
+
+
+def verify_derived_trace_matches_simulation(rng, iterations=500):
+    for scheme, buffer_letter in (
+        (CORNER_LETTER_SCHEME, CORNER_BUFFER),
+        (EDGE_LETTER_SCHEME, EDGE_BUFFER),
+    ):
+        for randomize in (False, True):
+            for _ in range(iterations):
+                result = basic_five_cycle(
+                    buffer_letter=buffer_letter,
+                    scheme=scheme,
+                    rng=rng,
+                    randomize_third_orientation=randomize,
+                    verify=True,
+                )
+                _assert_no_repeats_or_inverses(result["comm_sequence"])
+
+
+def verify_index_sampling(rng, iterations=200):
+    with tempfile.TemporaryDirectory() as directory:
+        built = load_or_build_index(
+            directory,
+            scheme=CORNER_LETTER_SCHEME,
+            buffer_letter=CORNER_BUFFER,
+        )
+        index = FiveCycleIndex.load(
+            index_path(directory, CORNER_LETTER_SCHEME, CORNER_BUFFER),
+        )
+    assert len(index) == len(built)
+    scheme_data = _build_scheme_data(_normalize_blocks(CORNER_LETTER_SCHEME))
+    solved = scheme_data["stickers"].solved_state().labels()
+    for step in range(iterations):
+        forced_pair = _random_forced_pair_from_scheme(
+            rng, CORNER_LETTER_SCHEME, CORNER_BUFFER,
+        )
+        result = index.sample(rng, forced_pair=forced_pair)
+        assert _comm_sequence_contains_pair(result["comm_sequence"], forced_pair)
+        _assert_no_repeats_or_inverses(result["comm_sequence"])
+        # Replay a share of the records, forced and not, to check they solve.
+        if step % 10 == 0:
+            for sequence in (result["comm_sequence"], index.sample(rng)["comm_sequence"]):
+                state = _apply_comm_sequence(scheme_data, sequence, CORNER_BUFFER)
+                assert state.labels() == solved, sequence
+
+
+def verify_batch_generation(count=500):
+    blocks = _normalize_blocks(EDGE_LETTER_SCHEME)
+    scheme_data = _build_scheme_data(blocks)
+    solved = scheme_data["stickers"].solved_state().labels()
+    comms, letters = generate_five_cycles(
+        count,
+        scheme=EDGE_LETTER_SCHEME,
+        buffer_letter=EDGE_BUFFER,
+        seed=42,
+        randomize_third_orientation=True,
+    )
+    assert comms.shape == (count, 5, 2)
+    for sequence in decode_five_cycles(comms, letters):
+        _assert_no_repeats_or_inverses(sequence)
+        state = _apply_comm_sequence(scheme_data, sequence, EDGE_BUFFER)
+        assert state.labels() == solved, sequence
+
+
+def verify_batch_engine(count=2000):
+    stickers = _build_scheme_data(_normalize_blocks(CORNER_LETTER_SCHEME))["stickers"]
+    buffer_id = stickers.intern(CORNER_BUFFER)
+    comms, _ = generate_five_cycles(
+        count,
+        scheme=CORNER_LETTER_SCHEME,
+        buffer_letter=CORNER_BUFFER,
+        seed=7,
+        shift=False,
+    )
+    batch = StickerBatch(stickers, count)
+    batch.apply_comms(buffer_id, comms[:, :3])
+    cycles, lengths = batch.trace(buffer_id)
+    assert (lengths == 6).all()
+    assert (cycles[:, 1] == comms[:, 4, 1]).all()
+    batch.apply_comms(buffer_id, comms[:, 3:])
+    assert batch.is_solved().all()
+
+
+def verify_streaming_dedup(rng, window=100, iterations=1000):
+    stream = iter_five_cycles(
+        buffer_letter=CORNER_BUFFER,
+        scheme=CORNER_LETTER_SCHEME,
+        rng=rng,
+        dedup_window=window,
+    )
+    recent = []
+    for result in itertools.islice(stream, iterations):
+        sequence = result["comm_sequence"]
+        key = min(sequence[offset:] + sequence[:offset] for offset in range(5))
+        assert key not in recent, sequence
+        recent = (recent + [key])[-window:]
+
+
+def verify_parallel_pool_is_worker_independent(total=600):
+    options = {
+        "buffer_letter": EDGE_BUFFER,
+        "scheme": EDGE_LETTER_SCHEME,
+        "seed": 2024,
+        "chunk_size": 64,
+    }
+    inline = generate_five_cycle_pool(total, workers=1, **options)
+    pooled = generate_five_cycle_pool(total, workers=3, **options)
+    assert len(inline) == total
+    assert inline == pooled
 
 
 def main():
@@ -147,6 +290,12 @@ def main():
     run_corner_tests(rng=rng)
     verify_forced_pair_integration(rng)
     verify_invalid_forced_pair_rejection()
+    verify_derived_trace_matches_simulation(rng)
+    verify_index_sampling(rng)
+    verify_batch_generation()
+    verify_batch_engine()
+    verify_streaming_dedup(rng)
+    verify_parallel_pool_is_worker_independent()
 
 
 if __name__ == "__main__":
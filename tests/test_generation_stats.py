@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import random
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PYTHON_SRC = PROJECT_ROOT / "python"
+TESTS_DIR = PROJECT_ROOT / "tests"
+for path in (PYTHON_SRC, PROJECT_ROOT, TESTS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from comm_drill_trainer import CORNER_BUFFER, CORNER_LETTER_SCHEME  # noqa: E402
+from five_cycle import NotEnoughPiecesError, basic_five_cycle  # noqa: E402
+from generation_stats import GenerationStats, active_collector  # noqa: E402
+
+
+def verify_generation_stats(rng, iterations=200):
+    with GenerationStats() as stats:
+        for _ in range(iterations):
+            basic_five_cycle(
+                buffer_letter=CORNER_BUFFER,
+                scheme=CORNER_LETTER_SCHEME,
+                rng=rng,
+                verify=True,
+            )
+        try:
+            basic_five_cycle(buffer_letter="A", scheme="ABC DEF GHI JKL")
+        except NotEnoughPiecesError:
+            pass
+        else:
+            raise AssertionError("Expected a scheme with 3 pieces after the buffer to fail.")
+    assert stats.counters["calls"] == iterations + 1
+    assert stats.counters["successes"] == iterations
+    assert dict(stats.rejections) == {"not_enough_pieces": 1}
+    assert stats.attempts[1] == iterations + 1
+    assert sum(stats.stage_histograms["prepare"].values()) == iterations + 1
+    for stage in ("sampling", "derivation", "verification"):
+        assert sum(stats.stage_histograms[stage].values()) == iterations, stage
+    assert len(stats.by_key) == 2
+    assert active_collector() is None
+
+    events = []
+    basic_five_cycle(buffer_letter=CORNER_BUFFER, rng=rng, forced_pair="AB", stats=events.append)
+    assert events[0]["forced_pair"] == ("A", "B") and events[0]["rejection"] is None
+    assert "verification" not in events[0]["timings"]
+    print("Passed generation stats checks.")
+
+
+def verify_rejection_reasons(rng):
+    events = []
+    cases = (
+        ({"scheme": "ABC DEF GHI JKL", "forced_pair": "DG"}, NotEnoughPiecesError, "not_enough_pieces"),
+        ({"scheme": "ABC DEF GHI JKL MNO", "buffer_letter": "Z"}, ValueError, "invalid_input"),
+        ({"scheme": CORNER_LETTER_SCHEME, "forced_pair": "ABC"}, ValueError, "invalid_input"),
+        ({"scheme": CORNER_LETTER_SCHEME, "forced_pair": 12}, TypeError, "invalid_input"),
+        # Stats keys for unusable schemes must not replace the original error.
+        ({"scheme": 12}, TypeError, "invalid_input"),
+        ({"scheme": [1, 2, 3]}, TypeError, "invalid_input"),
+    )
+    for kwargs, expected_error, rejection in cases:
+        events.clear()
+        try:
+            basic_five_cycle(**{"buffer_letter": "A", "rng": rng, "stats": events.append, **kwargs})
+        except expected_error:
+            pass
+        else:
+            raise AssertionError(f"Expected {expected_error.__name__} for {kwargs}.")
+        assert len(events) == 1 and events[0]["rejection"] == rejection, (kwargs, events)
+    print("Passed rejection reason checks.")
+
+
+def main():
+    rng = random.Random(42)
+    verify_generation_stats(rng)
+    verify_rejection_reasons(rng)
+
+
+if __name__ == "__main__":
+    main()